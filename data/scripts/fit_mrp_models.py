@@ -4,13 +4,24 @@ Usage:
     python data/scripts/fit_mrp_models.py [--year YEAR] [--race RACE_TYPE]
     python data/scripts/fit_mrp_models.py --year 2024 --race president
     python data/scripts/fit_mrp_models.py  # fits all available elections
-
-Uses sync psycopg2 to query data, then calls PyMC fitting.
+    python data/scripts/fit_mrp_models.py --method advi  # quick approximate fits
+    python data/scripts/fit_mrp_models.py --jobs 4 --chains 4 --cores-per-fit 4
+    python data/scripts/fit_mrp_models.py --warm-start same --force  # quick refit
+
+Uses sync psycopg2 to load every target election in one query, then fits
+them in a pool of worker processes. Elections whose inputs (ward data,
+method, draws, tune, chains and warm start) match the input_hash stored
+with their trace are skipped unless --force is given.
 """
 
 import argparse
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import numpy as np
@@ -50,48 +61,79 @@ def county_to_region(county: str) -> str:
     return "rural"
 
 
-def load_ward_data(
-    conn, year: int, race_type: str, ward_vintage: int | None = None
-) -> pd.DataFrame | None:
-    """Load joined election + demographics data for a given election."""
-    # Determine ward vintage from year
-    if ward_vintage is None:
-        ward_vintage = 2022 if year >= 2022 else 2020
-
-    query = """
-        SELECT
-            er.ward_id,
-            w.county,
-            w.municipality,
-            er.dem_votes,
-            er.rep_votes,
-            er.total_votes,
-            er.is_estimate,
-            COALESCE(wd.population_density, 0) AS population_density,
-            COALESCE(wd.college_degree_pct, 0) AS college_degree_pct,
-            COALESCE(wd.median_household_income, 0) AS median_household_income,
-            COALESCE(wd.white_pct, 0) AS white_pct
-        FROM election_results er
-        JOIN wards w
-            ON er.ward_id = w.ward_id AND er.ward_vintage = w.ward_vintage
-        LEFT JOIN ward_demographics wd
-            ON er.ward_id = wd.ward_id AND wd.ward_vintage = w.ward_vintage
-        WHERE er.election_year = %s
-            AND er.race_type = %s
-            AND er.ward_vintage = %s
-            AND er.total_votes > 0
-    """
-    df = pd.read_sql(query, conn, params=(year, race_type, ward_vintage))
+WARD_DATA_QUERY = """
+    SELECT
+        er.election_year,
+        er.race_type,
+        er.ward_id,
+        w.county,
+        w.municipality,
+        er.dem_votes,
+        er.rep_votes,
+        er.total_votes,
+        er.is_estimate,
+        COALESCE(wd.population_density, 0) AS population_density,
+        COALESCE(wd.college_degree_pct, 0) AS college_degree_pct,
+        COALESCE(wd.median_household_income, 0) AS median_household_income,
+        COALESCE(wd.white_pct, 0) AS white_pct
+    FROM election_results er
+    JOIN wards w
+        ON er.ward_id = w.ward_id AND er.ward_vintage = w.ward_vintage
+    LEFT JOIN ward_demographics wd
+        ON er.ward_id = wd.ward_id AND wd.ward_vintage = w.ward_vintage
+    WHERE er.election_year = ANY(%s)
+        AND er.race_type = ANY(%s)
+        AND er.ward_vintage = CASE
+            WHEN er.election_year >= 2022 THEN 2022 ELSE 2020
+        END
+        AND er.total_votes > 0
+"""
 
-    if df.empty:
-        print(f"  No data found for {race_type} {year} (vintage {ward_vintage})")
-        return None
 
-    # Add region column
-    df["region"] = df["county"].apply(county_to_region)
+def ward_vintage_for(year: int) -> int:
+    return 2022 if year >= 2022 else 2020
 
-    print(f"  Loaded {len(df)} wards for {race_type} {year}")
-    return df
+
+def load_ward_data(
+    conn, elections: list[tuple[int, str]]
+) -> dict[tuple[int, str], pd.DataFrame]:
+    """Load joined election + demographics data for many elections at once.
+
+    One query covers every requested (year, race_type); the result is split
+    per election. Elections without data are missing from the dict.
+    """
+    if not elections:
+        return {}
+    years = sorted({year for year, _ in elections})
+    races = sorted({race for _, race in elections})
+    df = pd.read_sql(WARD_DATA_QUERY, conn, params=(years, races))
+
+    # Add region column (one lookup per distinct county)
+    df["region"] = df["county"].map(
+        {c: county_to_region(c) for c in df["county"].unique()}
+    )
+
+    wanted = set(elections)
+    data = {}
+    for (year, race_type), group in df.groupby(["election_year", "race_type"]):
+        key = (int(year), str(race_type))
+        if key in wanted:
+            data[key] = (
+                group.drop(columns=["election_year", "race_type"])
+                .sort_values("ward_id")
+                .reset_index(drop=True)
+            )
+    wards = sum(len(group) for group in data.values())
+    print(f"  Loaded {wards} ward results for {len(data)} elections")
+    return data
+
+
+def input_hash(df: pd.DataFrame, **params) -> str:
+    """Fingerprint of an election's fitting inputs and fit parameters."""
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return digest.hexdigest()
 
 
 def get_available_elections(conn) -> list[tuple[int, str]]:
@@ -106,34 +148,105 @@ def get_available_elections(conn) -> list[tuple[int, str]]:
     return [(row[0], row[1]) for row in cur.fetchall()]
 
 
-def fit_one(conn, year: int, race_type: str) -> bool:
-    """Fit a single MRP model for the given election."""
-    from app.election_models.mrp_model import fit_mrp_model, get_diagnostics
-    from app.election_models.mrp_storage import save_trace
-
-    ward_vintage = 2022 if year >= 2022 else 2020
-    df = load_ward_data(conn, year, race_type, ward_vintage)
-    if df is None or len(df) < 100:
-        print(f"  SKIP: insufficient data for {race_type} {year}")
-        return False
+def fit_one(
+    year: int,
+    race_type: str,
+    df: pd.DataFrame,
+    options: dict,
+) -> dict:
+    """Fit and save one MRP model. Runs in a worker process.
 
-    print(f"  Fitting MRP model for {race_type} {year} ({len(df)} wards)...")
+    Returns a summary with per-phase wall times in seconds.
+    """
+    from app.election_models.mrp_model import (
+        fit_mrp_model,
+        get_diagnostics,
+        load_warm_start,
+    )
+    from app.election_models.mrp_predict import category_levels
+    from app.election_models.mrp_progress import SamplingProgress
+    from app.election_models.mrp_storage import save_trace
 
+    ward_vintage = ward_vintage_for(year)
+    result = {"year": year, "race_type": race_type, "wards": len(df)}
+    label = f"{race_type} {year}"
+
+    def report(snap: dict) -> None:
+        eta = snap["eta_seconds"]
+        print(
+            f"    {label}: {snap['phase']} {snap['percent']:.0f}% "
+            f"({snap['draws_per_sec']:.0f} draws/s, "
+            f"ETA {'?' if eta is None else f'{eta:.0f}s'}, "
+            f"{snap['divergences']} divergences)",
+            flush=True,
+        )
+
+    progress = SamplingProgress(
+        options["chains"], options["tune"], options["draws"], report,
+        interval=30.0,
+    )
+    started = time.perf_counter()
     try:
-        trace = fit_mrp_model(df, draws=2000, tune=1000, chains=2)
+        warm_start = None
+        if options["warm_start"] is not None:
+            source = options["warm_start"]
+            warm_start = load_warm_start(
+                source["race_type"], source["year"], source["ward_vintage"],
+                informative_priors=options["informative_priors"],
+            )
+        trace = fit_mrp_model(
+            df,
+            draws=options["draws"],
+            tune=options["tune"],
+            chains=options["chains"],
+            cores=options["cores"],
+            method=options["method"],
+            warm_start=warm_start,
+            progress=progress,
+        )
     except Exception as e:
-        print(f"  FAILED: {e}")
-        return False
-
-    # Get diagnostics
-    diag = get_diagnostics(trace)
-    print(f"  Diagnostics: R-hat max={diag['r_hat_max']}, ESS min={diag['ess_min']}")
+        return {**result, "status": "failed", "error": str(e),
+                "fit_seconds": time.perf_counter() - started}
+    fitted = time.perf_counter()
 
-    # Save
-    save_trace(trace, race_type, year, ward_vintage, metadata=diag)
-    print(f"  Saved trace for {race_type} {year}")
-
-    return True
+    # A diagnostics or save error fails this election, not the whole batch
+    try:
+        diag = get_diagnostics(trace)
+        diag["timings"] = {
+            **progress.timings(),
+            "fit_seconds": round(fitted - started, 1),
+        }
+        save_trace(
+            trace, race_type, year, ward_vintage,
+            metadata={**diag, "input_hash": options["input_hash"]},
+            categories=category_levels(df),
+        )
+    except Exception as e:
+        return {**result, "status": "failed", "error": f"saving: {e}",
+                "fit_seconds": fitted - started}
+    return {
+        **result,
+        "status": "fitted",
+        "diagnostics": diag,
+        "fit_seconds": fitted - started,
+        "save_seconds": time.perf_counter() - fitted,
+    }
+
+
+def print_result(r: dict) -> None:
+    label = f"{r['race_type']} {r['year']}"
+    if r["status"] == "fitted":
+        diag = r["diagnostics"]
+        if diag["approximate"]:
+            quality = f"approximate ({diag['fit_method']})"
+        else:
+            quality = f"R-hat max={diag['r_hat_max']}, ESS min={diag['ess_min']}"
+        print(
+            f"  {label}: fitted {r['wards']} wards in {r['fit_seconds']:.0f}s "
+            f"(+{r['save_seconds']:.1f}s save) — {quality}"
+        )
+    else:
+        print(f"  {label}: FAILED after {r['fit_seconds']:.0f}s: {r['error']}")
 
 
 def main():
@@ -146,41 +259,170 @@ def main():
         default="president,governor,us_senate",
         help="Comma-separated race types to fit (default: president,governor,us_senate)",
     )
+    parser.add_argument(
+        "--method",
+        choices=["nuts", "advi", "pathfinder"],
+        default="nuts",
+        help="Fitting method: exact NUTS (default) or a fast approximation",
+    )
+    parser.add_argument(
+        "--replace-exact",
+        action="store_true",
+        help="Let an approximate fit overwrite an existing NUTS fit",
+    )
+    parser.add_argument("--draws", type=int, default=2000)
+    parser.add_argument(
+        "--tune",
+        type=int,
+        help="Tuning steps (default: 1000, or a short re-tune with --warm-start)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        help='Start NUTS from an earlier fit: "same" (this election), '
+        '"previous" (latest earlier year of the race) or RACE_YEAR',
+    )
+    parser.add_argument(
+        "--informative-priors",
+        action="store_true",
+        help="With --warm-start, centre the priors on the earlier posterior",
+    )
+    parser.add_argument("--chains", type=int, default=2, help="Chains per fit")
+    parser.add_argument(
+        "--cores-per-fit",
+        type=int,
+        help="Processes per fit (default: one per chain)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Fits run in parallel (default: CPU count / cores per fit)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Refit even if the inputs match the existing trace",
+    )
     args = parser.parse_args()
 
-    conn = psycopg2.connect(DATABASE_URL)
+    from app.election_models.mrp_model import WARM_START_TUNE
+    from app.election_models.mrp_storage import (
+        APPROXIMATE_METHODS,
+        fitted_method,
+        load_metadata,
+        resolve_warm_start,
+    )
 
+    cores = args.cores_per_fit or args.chains
+    if args.method in APPROXIMATE_METHODS:
+        cores = 1  # approximations run in a single process
+    jobs = args.jobs or max(1, (os.cpu_count() or 1) // cores)
+
+    conn = psycopg2.connect(DATABASE_URL)
     if args.year and args.race:
-        # Fit a single election
-        success = fit_one(conn, args.year, args.race)
-        conn.close()
-        sys.exit(0 if success else 1)
-
-    # Fit multiple elections
-    available = get_available_elections(conn)
-    target_races = set(args.races.split(","))
-
-    fitted = 0
-    failed = 0
-    for year, race_type in available:
-        if args.year and year != args.year:
-            continue
-        if args.race and race_type != args.race:
-            continue
-        if race_type not in target_races:
+        targets = [(args.year, args.race)]
+    else:
+        target_races = set(args.races.split(","))
+        targets = [
+            (year, race_type)
+            for year, race_type in get_available_elections(conn)
+            if (not args.year or year == args.year)
+            and (not args.race or race_type == args.race)
+            and race_type in target_races
+        ]
+
+    started = time.perf_counter()
+    data = load_ward_data(conn, targets)
+    conn.close()
+    print(f"  Data loaded in {time.perf_counter() - started:.1f}s")
+
+    pending = []
+    skipped = unchanged = 0
+    for year, race_type in targets:
+        df = data.get((year, race_type))
+        if df is None or len(df) < 100:
+            print(f"  SKIP: insufficient data for {race_type} {year}")
+            skipped += 1
             continue
 
-        print(f"\n{'='*60}")
-        print(f"Fitting {race_type} {year}")
-        print(f"{'='*60}")
+        ward_vintage = ward_vintage_for(year)
+        if (
+            args.method in APPROXIMATE_METHODS
+            and not args.replace_exact
+            and fitted_method(race_type, year, ward_vintage) == "nuts"
+        ):
+            print(f"  SKIP: {race_type} {year} already has a NUTS fit (--replace-exact)")
+            skipped += 1
+            continue
 
-        if fit_one(conn, year, race_type):
-            fitted += 1
-        else:
-            failed += 1
+        warm_start = None
+        if args.warm_start and args.method == "nuts":
+            warm_start = resolve_warm_start(race_type, year, args.warm_start)
+            if warm_start is None:
+                print(f"  {race_type} {year}: no fit for --warm-start, fitting cold")
+        tune = args.tune or (WARM_START_TUNE if warm_start else 1000)
+
+        # Everything that changes the posterior; a warm-start source is
+        # identified by election, so "--warm-start same" reruns still skip
+        digest = input_hash(
+            df,
+            method=args.method,
+            draws=args.draws,
+            tune=tune,
+            chains=args.chains,
+            warm_start=(
+                [warm_start["race_type"], warm_start["year"],
+                 warm_start["ward_vintage"]]
+                if warm_start else None
+            ),
+            informative_priors=bool(warm_start) and args.informative_priors,
+        )
+        previous = load_metadata(race_type, year, ward_vintage) or {}
+        if not args.force and previous.get("input_hash") == digest:
+            print(f"  SKIP: {race_type} {year} unchanged since {previous.get('fitted_at')}")
+            unchanged += 1
+            continue
 
-    conn.close()
-    print(f"\nDone: {fitted} fitted, {failed} failed")
+        options = {
+            "method": args.method,
+            "draws": args.draws,
+            "tune": tune,
+            "chains": args.chains,
+            "cores": cores,
+            "input_hash": digest,
+            "warm_start": warm_start,
+            "informative_priors": args.informative_priors,
+        }
+        pending.append((year, race_type, df, options))
+
+    print(
+        f"\nFitting {len(pending)} elections, {jobs} at a time "
+        f"({args.chains} chains, {cores} cores each)"
+    )
+    # One BLAS thread per chain process (inherited by the spawned workers);
+    # the pool and PyMC's chain processes provide the parallelism
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, "1")
+
+    results = []
+    if pending:
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [pool.submit(fit_one, *job) for job in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                print_result(result)
+                results.append(result)
+
+    fitted = sum(r["status"] == "fitted" for r in results)
+    failed = len(results) - fitted
+    print(
+        f"\nDone in {time.perf_counter() - started:.0f}s: {fitted} fitted, "
+        f"{failed} failed, {unchanged} unchanged, {skipped} skipped"
+    )
+    if args.year and args.race:
+        sys.exit(0 if fitted or unchanged else 1)
 
 
 if __name__ == "__main__":
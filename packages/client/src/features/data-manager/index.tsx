@@ -75,7 +75,7 @@ const PIPELINE_STEPS = [
   {
     name: 'Compute Aggregations',
     script: 'compute_aggregations.py',
-    description: 'Pre-computes county/district/statewide aggregations',
+    description: 'Pre-computes municipality/county/district/statewide aggregations',
   },
   {
     name: 'Generate Tiles',
@@ -1,3 +1,5 @@
+import type { AreaTrendLine } from '@/services/api';
+
 interface AreaTrendSummaryProps {
   summary: {
     more_democratic: number;
@@ -5,9 +7,10 @@ interface AreaTrendSummaryProps {
     inconclusive: number;
   };
   totalWards: number;
+  areaTrend?: AreaTrendLine;
 }
 
-export function AreaTrendSummary({ summary, totalWards }: AreaTrendSummaryProps) {
+export function AreaTrendSummary({ summary, totalWards, areaTrend }: AreaTrendSummaryProps) {
   if (totalWards === 0) {
     return <p className="text-sm text-muted-foreground">No trend data available.</p>;
   }
@@ -63,6 +66,18 @@ export function AreaTrendSummary({ summary, totalWards }: AreaTrendSummaryProps)
       </div>
 
       <p className="text-xs text-muted-foreground">{totalWards} wards analyzed</p>
+
+      {areaTrend?.slope != null && (
+        <p className="text-xs text-muted-foreground">
+          Area margin trend (turnout-weighted): {areaTrend.slope > 0 ? '+' : ''}
+          {areaTrend.slope.toFixed(2)} pts/yr
+          {areaTrend.direction === 'more_democratic'
+            ? ', trending Democratic'
+            : areaTrend.direction === 'more_republican'
+              ? ', trending Republican'
+              : ', inconclusive'}
+        </p>
+      )}
     </div>
   );
 }
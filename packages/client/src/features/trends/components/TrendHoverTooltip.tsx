@@ -1,17 +1,26 @@
 import { memo } from 'react';
 import { TrendClassificationBadge } from './TrendClassificationBadge';
-import type { TrendClassificationEntry } from '@/services/api';
+import type { ChangepointEntry, TrendClassificationEntry, WardForecastEntry } from '@/services/api';
 
 interface TrendHoverTooltipProps {
   point: { x: number; y: number } | null;
   properties: Record<string, unknown> | null;
   classification: TrendClassificationEntry | null;
+  changepoint?: ChangepointEntry | null;
+  forecast?: WardForecastEntry | null;
+}
+
+function formatMargin(margin: number): string {
+  if (margin === 0) return 'Even';
+  return `${margin > 0 ? 'D' : 'R'}+${Math.abs(margin).toFixed(1)}`;
 }
 
 export const TrendHoverTooltip = memo(function TrendHoverTooltip({
   point,
   properties,
   classification,
+  changepoint,
+  forecast,
 }: TrendHoverTooltipProps) {
   if (!point || !properties) return null;
 
@@ -86,6 +95,28 @@ export const TrendHoverTooltip = memo(function TrendHoverTooltip({
       ) : (
         <p className="mt-1.5 text-[10px] text-muted-foreground">No trend data</p>
       )}
+
+      {changepoint && (
+        <p className="mt-1 text-[10px] font-medium">
+          Realigned in {changepoint.break_year}: {Math.abs(changepoint.magnitude).toFixed(1)} pts
+          toward {changepoint.magnitude > 0 ? 'D' : 'R'}
+        </p>
+      )}
+
+      {forecast && (
+        <div className="mt-1 text-[10px]">
+          <p className="font-medium">
+            {forecast.targetYear} forecast: {formatMargin(forecast.margin)}
+            {' '}({formatMargin(forecast.marginLower)} to {formatMargin(forecast.marginUpper)})
+          </p>
+          {forecast.turnoutLower != null && forecast.turnoutUpper != null && (
+            <p className="text-muted-foreground">
+              Turnout {forecast.totalVotes.toLocaleString()} ({forecast.turnoutLower.toLocaleString()}
+              {'\u2013'}{forecast.turnoutUpper.toLocaleString()})
+            </p>
+          )}
+        </div>
+      )}
     </div>
   );
 });
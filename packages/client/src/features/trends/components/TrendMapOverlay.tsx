@@ -1,9 +1,9 @@
 import { useMemo, useState, useCallback, memo } from 'react';
 import { WisconsinMap } from '@/shared/components/WisconsinMap';
 import { QueryErrorState } from '@/shared/components/QueryErrorState';
-import { useTrendClassifications } from '../hooks/useTrends';
+import { useChangepoints, useTrendClassifications, useTrendForecasts } from '../hooks/useTrends';
 import type { MapDataResponse, WardMapEntry } from '@/features/election-map/hooks/useMapData';
-import type { TrendClassificationEntry } from '@/services/api';
+import type { ChangepointEntry, TrendClassificationEntry, WardForecastEntry } from '@/services/api';
 import { TrendInfoBanner } from './TrendInfoBanner';
 import { TrendLegend } from './TrendLegend';
 import { TrendHoverTooltip } from './TrendHoverTooltip';
@@ -60,6 +60,40 @@ function trendToMapData(
   };
 }
 
+/**
+ * Map realignment size to a demPct scale: shifts toward D are blue, toward
+ * R red; a 20+ point break saturates. Wards without a significant break
+ * are left uncolored.
+ */
+function changepointsToMapData(
+  changepoints: Record<string, ChangepointEntry>,
+): MapDataResponse {
+  const data: Record<string, WardMapEntry> = {};
+
+  for (const [wardId, info] of Object.entries(changepoints)) {
+    const shift = Math.max(-20, Math.min(20, info.magnitude));
+    const demPct = 50 + (shift / 20) * 30;
+    data[wardId] = {
+      demPct,
+      repPct: 100 - demPct,
+      margin: (demPct - 50) * 2,
+      totalVotes: 0,
+      demVotes: 0,
+      repVotes: 0,
+      isEstimate: false,
+    };
+  }
+
+  return {
+    year: 0,
+    raceType: 'realignment',
+    wardCount: Object.keys(data).length,
+    data,
+  };
+}
+
+type TrendLayer = 'trend' | 'realignment' | 'forecast';
+
 interface SummaryStats {
   demCount: number;
   repCount: number;
@@ -127,12 +161,27 @@ const EMPTY_STATS: SummaryStats = {
 export const TrendMapOverlay = memo(function TrendMapOverlay() {
   const [hover, setHover] = useState<HoverState | null>(null);
   const [visibleWardIds, setVisibleWardIds] = useState<string[]>([]);
+  const [layer, setLayer] = useState<TrendLayer>('trend');
   const { data: classData, isLoading: classLoading, isError: classError, error: classErrorObj, refetch: classRefetch } = useTrendClassifications('president');
+  const { data: changepointData, isLoading: changepointLoading } = useChangepoints(
+    'president',
+    layer === 'realignment',
+  );
+  const { data: forecastData, isLoading: forecastLoading } = useTrendForecasts(
+    'president',
+    layer === 'forecast',
+  );
 
   const mapData = useMemo(() => {
+    // Forecasts are served in map-data shape and render as-is
+    if (layer === 'forecast') return forecastData;
+    if (layer === 'realignment') {
+      if (!changepointData?.changepoints) return undefined;
+      return changepointsToMapData(changepointData.changepoints);
+    }
     if (!classData?.classifications) return undefined;
     return trendToMapData(classData.classifications);
-  }, [classData]);
+  }, [layer, classData, changepointData, forecastData]);
 
   // Viewport-scoped summary: only count wards currently visible on the map
   const viewportStats = useMemo<SummaryStats>(() => {
@@ -174,18 +223,54 @@ export const TrendMapOverlay = memo(function TrendMapOverlay() {
       ? classData.classifications[hover.wardId]
       : null;
 
-  const isLoading = classLoading;
+  const hoveredChangepoint: ChangepointEntry | null =
+    layer === 'realignment' && hover
+      ? changepointData?.changepoints?.[hover.wardId] ?? null
+      : null;
+
+  const hoveredForecast: WardForecastEntry | null =
+    layer === 'forecast' && hover ? forecastData?.data?.[hover.wardId] ?? null : null;
+
+  const isLoading =
+    layer === 'forecast'
+      ? forecastLoading
+      : layer === 'realignment'
+        ? changepointLoading
+        : classLoading;
 
   return (
     <div className="flex h-full flex-col">
       <div className="flex items-center gap-3 border-b bg-background px-4 py-2">
         <span className="text-sm font-medium">Presidential Election Trends</span>
+        <div className="flex gap-1" role="group" aria-label="Trend map layer">
+          {([
+            ['trend', 'Trend'],
+            ['realignment', 'Realignment'],
+            ['forecast', 'Forecast'],
+          ] as const).map(([value, label]) => (
+            <button
+              key={value}
+              aria-pressed={layer === value}
+              className={`rounded px-2.5 py-1 text-xs transition-colors ${
+                layer === value ? 'bg-content2 font-medium' : 'text-muted-foreground hover:bg-content2'
+              }`}
+              onClick={() => setLayer(value)}
+            >
+              {label}
+            </button>
+          ))}
+        </div>
         {isLoading && (
           <span className="text-xs text-muted-foreground">Loading...</span>
         )}
         {mapData && !isLoading && (
           <span className="text-xs text-muted-foreground">
-            {mapData.wardCount.toLocaleString()} wards classified
+            {mapData.wardCount.toLocaleString()}{' '}
+            {layer === 'realignment'
+              ? 'wards with a significant break'
+              : layer === 'forecast'
+                ? `wards forecast for ${forecastData?.year ?? ''}`
+                : 'wards classified'}
           </span>
         )}
       </div>
@@ -221,6 +306,8 @@ export const TrendMapOverlay = memo(function TrendMapOverlay() {
           point={hover?.point ?? null}
           properties={hover?.properties ?? null}
           classification={hoveredClassification}
+          changepoint={hoveredChangepoint}
+          forecast={hoveredForecast}
         />
       </div>}
     </div>
@@ -1,16 +1,18 @@
 import { useState, useMemo, memo } from 'react';
 import { Button } from '@/components/ui/button';
 import { useBulkWardElections } from '../hooks/useBulkWardElections';
-import type { AreaTrendEntry, TrendElection } from '@/services/api';
+import { useAreaTrendWards } from '../hooks/useTrends';
+import type { AreaTrendSort, TrendElection } from '@/services/api';
 import { POLITICAL_COLORS } from '@/shared/lib/politicalColors';
 
 interface TrendSparklineGridProps {
-  trends: AreaTrendEntry[];
+  filters: Record<string, string>;
+  totalWards: number;
   raceType?: string;
   pageSize?: number;
 }
 
-type SortMode = 'ward_id' | 'slope_asc' | 'slope_desc';
+type SortMode = AreaTrendSort;
 
 const MiniSparkline = memo(function MiniSparkline({
   wardId,
@@ -116,38 +118,24 @@ const MiniSparkline = memo(function MiniSparkline({
 });
 
 export function TrendSparklineGrid({
-  trends,
+  filters,
+  totalWards,
   raceType = 'president',
   pageSize = 50,
 }: TrendSparklineGridProps) {
   const [page, setPage] = useState(0);
   const [sortMode, setSortMode] = useState<SortMode>('ward_id');
 
-  // Sort trends
-  const sorted = useMemo(() => {
-    const items = [...trends];
-    switch (sortMode) {
-      case 'slope_asc':
-        items.sort((a, b) => (a.slope ?? 0) - (b.slope ?? 0));
-        break;
-      case 'slope_desc':
-        items.sort((a, b) => (b.slope ?? 0) - (a.slope ?? 0));
-        break;
-      default:
-        items.sort((a, b) => a.ward_id.localeCompare(b.ward_id));
-        break;
-    }
-    return items;
-  }, [trends, sortMode]);
-
-  const totalPages = Math.ceil(sorted.length / pageSize);
-  const displayed = sorted.slice(page * pageSize, (page + 1) * pageSize);
+  // Sorting and paging happen server-side; only the visible page is fetched
+  const { data: pageData } = useAreaTrendWards(filters, page, pageSize, sortMode);
+  const displayed = useMemo(() => pageData?.trends ?? [], [pageData]);
+  const totalPages = Math.ceil(totalWards / pageSize);
 
   // Fetch real election histories for the displayed wards
   const displayedWardIds = useMemo(() => displayed.map((t) => t.ward_id), [displayed]);
-  const { data: bulkElections } = useBulkWardElections(displayedWardIds);
+  const { data: bulkElections } = useBulkWardElections(displayedWardIds, raceType);
 
-  if (sorted.length === 0) {
+  if (totalWards === 0) {
     return <p className="text-sm text-muted-foreground">No trend data to display.</p>;
   }
 
@@ -175,7 +163,7 @@ export function TrendSparklineGrid({
           ))}
         </div>
         <span className="ml-auto text-xs text-muted-foreground">
-          {sorted.length.toLocaleString()} wards
+          {totalWards.toLocaleString()} wards
         </span>
       </div>
 
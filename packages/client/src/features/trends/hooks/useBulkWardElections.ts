@@ -1,17 +1,42 @@
 import { useQuery } from '@tanstack/react-query';
 import { api } from '@/services/api';
+import type { ColumnarElectionsResponse, TrendElection } from '@/services/api';
+
+/** Expand the columnar response into per-ward election lists. */
+function toWardElections(data: ColumnarElectionsResponse): Record<string, TrendElection[]> {
+  const grouped: Record<string, TrendElection[]> = {};
+  for (let i = 0; i < data.row_count; i++) {
+    const wardId = data.ward_ids[data.ward[i]];
+    const dem = data.dem_votes[i];
+    const rep = data.rep_votes[i];
+    const total = data.total_votes[i];
+    (grouped[wardId] ??= []).push({
+      year: data.year[i],
+      race_type: data.races[data.race[i]],
+      dem_votes: dem,
+      rep_votes: rep,
+      other_votes: data.other_votes[i],
+      total_votes: total,
+      dem_pct: total > 0 ? (dem / total) * 100 : 0,
+      rep_pct: total > 0 ? (rep / total) * 100 : 0,
+      margin: total > 0 ? ((dem - rep) / total) * 100 : 0,
+      is_estimate: data.is_estimate[i],
+    });
+  }
+  return grouped;
+}
 
 /**
- * Fetches election histories for a batch of ward IDs.
+ * Fetches election histories for a batch of ward IDs (any number).
  * Returns Record<wardId, TrendElection[]>.
  */
-export function useBulkWardElections(wardIds: string[]) {
+export function useBulkWardElections(wardIds: string[], raceType?: string) {
   return useQuery({
-    queryKey: ['trends', 'bulk-elections', wardIds.slice(0, 10).join(','), wardIds.length],
+    queryKey: ['trends', 'elections', raceType ?? 'all', wardIds.join(',')],
     queryFn: async () => {
       if (wardIds.length === 0) return {};
-      const response = await api.getBulkWardElections(wardIds);
-      return response.elections;
+      const response = await api.getWardElections({ ward_ids: wardIds, race_type: raceType });
+      return toWardElections(response);
     },
     enabled: wardIds.length > 0,
     staleTime: 5 * 60 * 1000,
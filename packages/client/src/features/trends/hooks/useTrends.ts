@@ -1,9 +1,12 @@
-import { useQuery } from '@tanstack/react-query';
+import { keepPreviousData, useQuery } from '@tanstack/react-query';
 import { api } from '@/services/api';
 import { queryKeys } from '@/services/queryKeys';
 import type {
   WardTrendResponse,
   AreaTrendsResponse,
+  AreaTrendSort,
+  ChangepointsResponse,
+  TrendForecastsResponse,
   TrendClassificationsResponse,
 } from '@/services/api';
 
@@ -27,6 +30,25 @@ export function useAreaTrends(filters: Record<string, string>) {
   });
 }
 
+/** One server-side page of ward trends for an area. */
+export function useAreaTrendWards(
+  filters: Record<string, string>,
+  page: number,
+  pageSize: number,
+  sort: AreaTrendSort,
+) {
+  const hasFilters = Object.values(filters).some((v) => v !== '');
+
+  return useQuery<AreaTrendsResponse>({
+    queryKey: queryKeys.trends.areaWards(filters, page, pageSize, sort),
+    queryFn: () =>
+      api.getAreaTrends(filters, { limit: pageSize, offset: page * pageSize, sort }),
+    enabled: hasFilters,
+    placeholderData: keepPreviousData,
+    staleTime: 5 * 60 * 1000,
+  });
+}
+
 export function useTrendClassifications(raceType: string) {
   return useQuery<TrendClassificationsResponse>({
     queryKey: queryKeys.trends.classify(raceType),
@@ -34,3 +56,21 @@ export function useTrendClassifications(raceType: string) {
     staleTime: 10 * 60 * 1000,
   });
 }
+
+export function useChangepoints(raceType: string, enabled = true) {
+  return useQuery<ChangepointsResponse>({
+    queryKey: queryKeys.trends.changepoints(raceType),
+    queryFn: () => api.getChangepoints(raceType),
+    enabled,
+    staleTime: 10 * 60 * 1000,
+  });
+}
+
+export function useTrendForecasts(raceType: string, enabled = true) {
+  return useQuery<TrendForecastsResponse>({
+    queryKey: queryKeys.trends.forecasts(raceType),
+    queryFn: () => api.getTrendForecasts(raceType),
+    enabled,
+    staleTime: 10 * 60 * 1000,
+  });
+}
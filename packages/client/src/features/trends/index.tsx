@@ -265,11 +265,15 @@ export default function Trends() {
                 <AreaTrendSummary
                   summary={areaTrendData.summary}
                   totalWards={areaTrendData.total_wards}
+                  areaTrend={areaTrendData.area_trend}
                 />
 
                 <div>
                   <h3 className="mb-2 text-sm font-medium">Ward Sparklines</h3>
-                  <TrendSparklineGrid trends={areaTrendData.trends} />
+                  <TrendSparklineGrid
+                    filters={areaFilters}
+                    totalWards={areaTrendData.total_wards}
+                  />
                 </div>
               </div>
             )}
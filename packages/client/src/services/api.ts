@@ -1,4 +1,4 @@
-import type { MapDataResponse } from '@/features/election-map/hooks/useMapData';
+import type { MapDataResponse, WardMapEntry } from '@/features/election-map/hooks/useMapData';
 import type { ElectionInfo } from '@/features/election-map/hooks/useElections';
 import type { WardDetail } from '@/features/election-map/hooks/useWardDetail';
 import { ApiError, NetworkError } from '@/shared/lib/errors';
@@ -159,6 +159,22 @@ export interface WardTrendResponse {
   elections: TrendElection[];
 }
 
+/** Columnar election rows: one array position per (ward, election). */
+export interface ColumnarElectionsResponse {
+  ward_count: number;
+  row_count: number;
+  ward_ids: string[];
+  races: string[];
+  ward: number[];
+  year: number[];
+  race: number[];
+  dem_votes: number[];
+  rep_votes: number[];
+  other_votes: number[];
+  total_votes: number[];
+  is_estimate: boolean[];
+}
+
 export interface AreaTrendEntry {
   ward_id: string;
   race_type: string;
@@ -168,13 +184,34 @@ export interface AreaTrendEntry {
   p_value: number | null;
 }
 
+export interface AreaTrendLine {
+  direction: string | null;
+  slope: number | null;
+  r_squared: number | null;
+  std_err: number | null;
+  p_value: number | null;
+  elections: {
+    year: number;
+    dem_votes: number;
+    rep_votes: number;
+    total_votes: number;
+    margin: number | null;
+  }[];
+}
+
+export type AreaTrendSort = 'ward_id' | 'slope_asc' | 'slope_desc';
+
 export interface AreaTrendsResponse {
+  race_type: string;
   summary: {
     more_democratic: number;
     more_republican: number;
     inconclusive: number;
   };
   total_wards: number;
+  area_trend: AreaTrendLine;
+  offset: number;
+  limit: number | null;
   trends: AreaTrendEntry[];
 }
 
@@ -188,6 +225,33 @@ export interface TrendClassificationEntry {
   end_year: number | null;
 }
 
+export interface ChangepointEntry {
+  break_year: number;
+  magnitude: number;
+  slope: number | null;
+  p_value: number | null;
+  elections_analyzed: number | null;
+}
+
+export interface ChangepointsResponse {
+  race_type: string;
+  ward_count: number;
+  changepoints: Record<string, ChangepointEntry>;
+}
+
+export interface WardForecastEntry extends WardMapEntry {
+  targetYear: number;
+  marginLower: number;
+  marginUpper: number;
+  turnoutLower: number | null;
+  turnoutUpper: number | null;
+}
+
+export interface TrendForecastsResponse extends MapDataResponse {
+  intervalLevel: number | null;
+  data: Record<string, WardForecastEntry>;
+}
+
 export interface TrendClassificationsResponse {
   race_type: string;
   classifications: Record<string, TrendClassificationEntry>;
@@ -251,22 +315,35 @@ export const api = {
   // Trends
   getWardTrend: (wardId: string) =>
     request<WardTrendResponse>(`/api/v1/trends/ward/${wardId}`),
-  getAreaTrends: (filters: Record<string, string>) => {
+  getAreaTrends: (
+    filters: Record<string, string>,
+    page?: { limit: number; offset: number; sort: AreaTrendSort },
+  ) => {
     const params = new URLSearchParams(filters);
+    if (page) {
+      params.set('limit', String(page.limit));
+      params.set('offset', String(page.offset));
+      params.set('sort', page.sort);
+    } else {
+      params.set('include_wards', 'false');
+    }
     return request<AreaTrendsResponse>(`/api/v1/trends/area?${params.toString()}`);
   },
   getTrendClassifications: (raceType: string) =>
     request<TrendClassificationsResponse>(`/api/v1/trends/classify?race_type=${encodeURIComponent(raceType)}`),
+  getTrendForecasts: (raceType: string) =>
+    request<TrendForecastsResponse>(`/api/v1/trends/forecasts?race_type=${encodeURIComponent(raceType)}`),
+  getChangepoints: (raceType: string) =>
+    request<ChangepointsResponse>(`/api/v1/trends/changepoints?race_type=${encodeURIComponent(raceType)}`),
 
   // Bulk elections
-  getBulkWardElections: (wardIds: string[]) =>
-    request<{ ward_count: number; elections: Record<string, TrendElection[]> }>(
-      '/api/v1/trends/bulk-elections',
-      {
-        method: 'POST',
-        body: JSON.stringify({ ward_ids: wardIds }),
-      },
-    ),
+  getWardElections: (
+    selection: { ward_ids?: string[]; race_type?: string } & Record<string, unknown>,
+  ) =>
+    request<ColumnarElectionsResponse>('/api/v1/trends/elections', {
+      method: 'POST',
+      body: JSON.stringify(selection),
+    }),
 
   // Demographics
   getWardDemographics: (wardId: string) =>
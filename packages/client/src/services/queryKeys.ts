@@ -20,8 +20,14 @@ export const queryKeys = {
     ward: (wardId: string) => ['trends', wardId] as const,
     area: (filters: Record<string, string>) =>
       ['trends', 'area', filters] as const,
+    areaWards: (filters: Record<string, string>, page: number, pageSize: number, sort: string) =>
+      ['trends', 'area', filters, 'wards', page, pageSize, sort] as const,
     classify: (raceType: string) =>
       ['trends', 'classify', raceType] as const,
+    changepoints: (raceType: string) =>
+      ['trends', 'changepoints', raceType] as const,
+    forecasts: (raceType: string) =>
+      ['trends', 'forecasts', raceType] as const,
   },
   scenarios: {
     all: ['scenarios'] as const,
@@ -0,0 +1,61 @@
+"""add ward_clusters and ward_cluster_profiles tables
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ward_clusters",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ward_id", sa.String(length=50), nullable=False),
+        sa.Column("ward_vintage", sa.Integer(), nullable=False),
+        sa.Column("cluster_id", sa.Integer(), nullable=False),
+        sa.Column("distance", sa.Float(), nullable=True),
+        sa.Column("method", sa.String(length=20), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "ward_id", "ward_vintage", name="uq_ward_cluster_vintage"
+        ),
+    )
+    op.create_index(
+        "idx_ward_clusters_vintage", "ward_clusters", ["ward_vintage"]
+    )
+
+    op.create_table(
+        "ward_cluster_profiles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ward_vintage", sa.Integer(), nullable=False),
+        sa.Column("cluster_id", sa.Integer(), nullable=False),
+        sa.Column("ward_count", sa.Integer(), nullable=False),
+        sa.Column("label", sa.String(length=50), nullable=False),
+        sa.Column("latest_margin", sa.Float(), nullable=True),
+        sa.Column("margin_shift", sa.Float(), nullable=True),
+        sa.Column("profile", sa.JSON(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "ward_vintage", "cluster_id", name="uq_cluster_profile"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ward_cluster_profiles")
+    op.drop_index("idx_ward_clusters_vintage", table_name="ward_clusters")
+    op.drop_table("ward_clusters")
@@ -0,0 +1,28 @@
+"""add trend_std_err to ward_trends
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ward_trends", sa.Column("trend_std_err", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ward_trends", "trend_std_err")
@@ -0,0 +1,47 @@
+"""add election_versions change-tracking table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "election_versions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ward_vintage", sa.Integer(), nullable=False),
+        sa.Column("election_year", sa.Integer(), nullable=False),
+        sa.Column("race_type", sa.String(length=50), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("checksum", sa.String(length=32), nullable=False),
+        sa.Column("data_version", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "ward_vintage", "election_year", "race_type",
+            name="uq_election_version",
+        ),
+    )
+    op.create_index(
+        "idx_election_versions_version", "election_versions", ["data_version"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_election_versions_version", table_name="election_versions"
+    )
+    op.drop_table("election_versions")
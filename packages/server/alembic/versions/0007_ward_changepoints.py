@@ -0,0 +1,47 @@
+"""add ward_changepoints table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ward_changepoints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ward_id", sa.String(length=50), nullable=False),
+        sa.Column("race_type", sa.String(length=50), nullable=False),
+        sa.Column("break_year", sa.Integer(), nullable=False),
+        sa.Column("magnitude", sa.Float(), nullable=False),
+        sa.Column("slope", sa.Float(), nullable=True),
+        sa.Column("f_stat", sa.Float(), nullable=True),
+        sa.Column("p_value", sa.Float(), nullable=True),
+        sa.Column("elections_analyzed", sa.Integer(), nullable=True),
+        sa.Column("ward_vintage", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("ward_id", "race_type", name="uq_ward_changepoint"),
+    )
+    op.create_index(
+        "idx_ward_changepoints_race",
+        "ward_changepoints",
+        ["race_type", "break_year"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_ward_changepoints_race", table_name="ward_changepoints")
+    op.drop_table("ward_changepoints")
@@ -0,0 +1,48 @@
+"""add ward_forecasts table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ward_forecasts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("ward_id", sa.String(length=50), nullable=False),
+        sa.Column("race_type", sa.String(length=50), nullable=False),
+        sa.Column("target_year", sa.Integer(), nullable=False),
+        sa.Column("margin", sa.Float(), nullable=False),
+        sa.Column("margin_lower", sa.Float(), nullable=False),
+        sa.Column("margin_upper", sa.Float(), nullable=False),
+        sa.Column("turnout", sa.Integer(), nullable=True),
+        sa.Column("turnout_lower", sa.Integer(), nullable=True),
+        sa.Column("turnout_upper", sa.Integer(), nullable=True),
+        sa.Column("interval_level", sa.Float(), nullable=False),
+        sa.Column("elections_analyzed", sa.Integer(), nullable=True),
+        sa.Column("ward_vintage", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("ward_id", "race_type", name="uq_ward_forecast"),
+    )
+    op.create_index(
+        "idx_ward_forecasts_race", "ward_forecasts", ["race_type"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_ward_forecasts_race", table_name="ward_forecasts")
+    op.drop_table("ward_forecasts")
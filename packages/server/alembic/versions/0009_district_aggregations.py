@@ -0,0 +1,66 @@
+"""add ward_vintage to election_aggregations for district levels
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "election_aggregations",
+        sa.Column("ward_vintage", sa.Integer(), nullable=True),
+    )
+    op.drop_constraint(
+        "uq_aggregation_unique", "election_aggregations", type_="unique"
+    )
+    op.create_unique_constraint(
+        "uq_aggregation_unique",
+        "election_aggregations",
+        [
+            "aggregation_level",
+            "aggregation_key",
+            "election_year",
+            "race_type",
+            "ward_vintage",
+        ],
+    )
+    op.create_index(
+        "idx_aggregations_election",
+        "election_aggregations",
+        ["aggregation_level", "election_year", "race_type"],
+    )
+    # Derived tables added since change tracking (0006) — changepoints,
+    # forecasts, district aggregations — must be backfilled, so forget the
+    # recorded fingerprints and let the next aggregation run rebuild all.
+    op.execute("DELETE FROM election_versions")
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM election_aggregations WHERE ward_vintage IS NOT NULL"
+    )
+    op.drop_index(
+        "idx_aggregations_election", table_name="election_aggregations"
+    )
+    op.drop_constraint(
+        "uq_aggregation_unique", "election_aggregations", type_="unique"
+    )
+    op.create_unique_constraint(
+        "uq_aggregation_unique",
+        "election_aggregations",
+        ["aggregation_level", "aggregation_key", "election_year", "race_type"],
+    )
+    op.drop_column("election_aggregations", "ward_vintage")
@@ -0,0 +1,49 @@
+"""rollup cube: municipality level and per-vintage rows at every level
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # County and statewide rows were stored without a vintage; the cube
+    # rebuilds them per vintage, so drop them and force a full rebuild.
+    op.execute("DELETE FROM election_aggregations WHERE ward_vintage IS NULL")
+    op.execute("DELETE FROM election_versions")
+    op.alter_column(
+        "election_aggregations", "ward_vintage",
+        existing_type=sa.Integer(), nullable=False,
+    )
+    op.alter_column(
+        "election_aggregations", "aggregation_key",
+        existing_type=sa.String(length=100), type_=sa.String(length=400),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DELETE FROM election_aggregations WHERE aggregation_level = 'municipality'"
+    )
+    op.alter_column(
+        "election_aggregations", "aggregation_key",
+        existing_type=sa.String(length=400), type_=sa.String(length=100),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "election_aggregations", "ward_vintage",
+        existing_type=sa.Integer(), nullable=True,
+    )
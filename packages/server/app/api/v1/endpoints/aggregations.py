@@ -1,12 +1,63 @@
-from fastapi import APIRouter, Depends
+import math
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.services.aggregation_service import AggregationService
+from app.services.aggregation_service import AggregationLevel, AggregationService
 
 router = APIRouter(prefix="/aggregations", tags=["aggregations"])
 
 
+class CustomRegionRequest(BaseModel):
+    ward_ids: list[str] | None = None
+    geometry: dict[str, Any] | None = None
+    area_weighted: bool = False
+    race_type: str | None = None
+    vintage: int | None = None
+
+
+def _ring_error(ring: Any) -> str | None:
+    """Why a GeoJSON linear ring is malformed, or None if it is usable."""
+    if not isinstance(ring, list) or len(ring) < 4:
+        return "each ring needs at least 4 positions"
+    for position in ring:
+        if (
+            not isinstance(position, list)
+            or len(position) not in (2, 3)
+            or not all(
+                isinstance(c, int | float) and not isinstance(c, bool)
+                and math.isfinite(c)
+                for c in position
+            )
+        ):
+            return "positions must be [longitude, latitude] number pairs"
+    if ring[0][:2] != ring[-1][:2]:
+        return "rings must be closed (first position equal to last)"
+    return None
+
+
+def _geometry_error(geometry: dict[str, Any]) -> str | None:
+    """Check a Polygon/MultiPolygon before it reaches ST_GeomFromGeoJSON."""
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if kind not in ("Polygon", "MultiPolygon") or not coordinates:
+        return "geometry must be a GeoJSON Polygon or MultiPolygon"
+    if not isinstance(coordinates, list):
+        return "coordinates must be a list"
+    polygons = [coordinates] if kind == "Polygon" else coordinates
+    for polygon in polygons:
+        if not isinstance(polygon, list) or not polygon:
+            return "each polygon needs at least one ring"
+        for ring in polygon:
+            error = _ring_error(ring)
+            if error is not None:
+                return error
+    return None
+
+
 @router.get("/county/{county}/{year}/{race_type}")
 async def get_county_aggregation(
     county: str,
@@ -22,6 +73,28 @@ async def get_county_aggregation(
     return result
 
 
+@router.get("/district/{district_type}/{year}/{race_type}")
+async def get_all_district_aggregations(
+    district_type: str,
+    year: int,
+    race_type: str,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Get aggregated results for every district of a type in one call."""
+    service = AggregationService(db)
+    result = await service.get_all_districts(district_type, year, race_type, vintage)
+    if result is None:
+        return {
+            "district_type": district_type,
+            "year": year,
+            "race_type": race_type,
+            "district_count": 0,
+            "districts": [],
+        }
+    return result
+
+
 @router.get("/district/{district_type}/{district_id}/{year}/{race_type}")
 async def get_district_aggregation(
     district_type: str,
@@ -56,3 +129,76 @@ async def get_statewide_aggregation(
     if result is None:
         return {"year": year, "race_type": race_type, "results": None}
     return result
+
+
+@router.post("/custom")
+async def get_custom_aggregation(
+    body: CustomRegionRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Aggregate a user-defined region for every election in one call.
+
+    Define the region with ``ward_ids`` and/or a GeoJSON Polygon or
+    MultiPolygon ``geometry`` (WGS84). With ``area_weighted``, wards cut by
+    the polygon count in proportion to their area inside it.
+    """
+    if body.ward_ids is None and body.geometry is None:
+        raise HTTPException(
+            status_code=400, detail="Provide ward_ids or a geometry"
+        )
+    if body.geometry is not None:
+        error = _geometry_error(body.geometry)
+        if error is not None:
+            raise HTTPException(status_code=400, detail=error)
+    service = AggregationService(db)
+    result = await service.get_custom_region(
+        ward_ids=body.ward_ids,
+        geometry=body.geometry,
+        area_weighted=body.area_weighted,
+        race_type=body.race_type,
+        vintage=body.vintage,
+    )
+    if result is None:
+        raise HTTPException(status_code=404, detail="No ward data available")
+    return result
+
+
+@router.get("/{level}")
+async def get_level_aggregations(
+    level: AggregationLevel,
+    year: int,
+    race_type: str,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Every key at a rollup level for one election (latest vintage by default)."""
+    service = AggregationService(db)
+    result = await service.get_level(level, year, race_type, vintage)
+    if result is None:
+        return {
+            "level": level,
+            "year": year,
+            "race_type": race_type,
+            "key_count": 0,
+            "results": [],
+        }
+    return result
+
+
+@router.get("/{level}/{key}")
+async def get_key_aggregations(
+    level: AggregationLevel,
+    key: str,
+    year: int | None = None,
+    race_type: str | None = None,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Totals for one geography across every election (or a filtered subset)."""
+    service = AggregationService(db)
+    result = await service.get_aggregation(level, key, year, race_type, vintage)
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"No {level} aggregations for {key}"
+        )
+    return result
@@ -1,9 +1,18 @@
+import math
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.services.mrp_service import MrpService
+from app.election_models.mrp_storage import FitMethod
+from app.services.mrp_service import (
+    MAX_SCENARIOS,
+    MrpAdjustment,
+    MrpService,
+    MrpSummaryLevel,
+    expand_scenarios,
+)
 from app.services.scenario_service import ScenarioService
 
 router = APIRouter(prefix="/models", tags=["models"])
@@ -18,7 +27,33 @@ class MrpFitRequest(BaseModel):
     year: int
     race_type: str
     draws: int = 2000
-    tune: int = 1000
+    tune: int | None = None  # 1000, or a short re-tune when warm-starting
+    chains: int = Field(default=2, ge=1, le=8)
+    method: FitMethod = "nuts"
+    replace_exact: bool = False
+    warm_start: str | None = None  # "same", "previous" or "{race_type}_{year}"
+    informative_priors: bool = False
+
+
+class MrpScenarioRequest(BaseModel):
+    year: int
+    race_type: str
+    scenarios: list[dict[MrpAdjustment, float]] = []
+    grid: dict[MrpAdjustment, list[float]] | None = None
+    levels: list[MrpSummaryLevel] = [
+        "county", "congressional", "state_senate", "assembly",
+    ]
+    include_wards: bool = False
+
+
+class MrpOutcomeRequest(BaseModel):
+    year: int
+    race_type: str
+    adjustments: dict[MrpAdjustment, float] = {}
+    levels: list[MrpSummaryLevel] = [
+        "county", "congressional", "state_senate", "assembly",
+    ]
+    n_samples: int = Field(default=500, ge=50, le=4000)
 
 
 class ScenarioCreateRequest(BaseModel):
@@ -135,11 +170,75 @@ async def predict(
             adjustments=adjustments,
         )
     except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=404, detail=str(e)) from e
 
     return result
 
 
+@router.post("/mrp/scenarios")
+async def predict_mrp_scenarios(
+    request: MrpScenarioRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Evaluate many MRP adjustment sets in one batched computation.
+
+    ``scenarios`` lists adjustment sets; ``grid`` maps adjustment names to
+    value lists whose cartesian product is applied on top of each listed
+    scenario. Returns statewide and per-level totals for every scenario,
+    plus ward projections if ``include_wards`` is set.
+    """
+    grid = request.grid or {}
+    count = max(len(request.scenarios), 1 if grid else 0) * math.prod(
+        len(values) for values in grid.values()
+    )
+    if count == 0:
+        raise HTTPException(
+            status_code=400, detail="Provide at least one scenario or a grid"
+        )
+    if count > MAX_SCENARIOS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_SCENARIOS} scenarios per request (got {count})",
+        )
+    scenarios = expand_scenarios(request.scenarios, grid)
+
+    mrp_service = MrpService(db)
+    try:
+        return await mrp_service.predict_scenarios(
+            year=request.year,
+            race_type=request.race_type,
+            scenarios=scenarios,
+            levels=request.levels,
+            include_wards=request.include_wards,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post("/mrp/outcomes")
+async def predict_mrp_outcomes(
+    request: MrpOutcomeRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Win probabilities and outcome distributions from MRP posterior draws.
+
+    Votes are summed per posterior draw statewide and into each requested
+    level, giving margin quantiles, Democratic win probabilities and a
+    histogram of groups won.
+    """
+    mrp_service = MrpService(db)
+    try:
+        return await mrp_service.predict_outcomes(
+            year=request.year,
+            race_type=request.race_type,
+            adjustments=request.adjustments,
+            levels=request.levels,
+            n_samples=request.n_samples,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
 @router.post("/mrp/fit")
 async def trigger_mrp_fit(request: MrpFitRequest) -> dict:
     """Trigger async MRP model fitting via Celery."""
@@ -156,12 +255,20 @@ async def trigger_mrp_fit(request: MrpFitRequest) -> dict:
         race_type=request.race_type,
         draws=request.draws,
         tune=request.tune,
+        chains=request.chains,
+        method=request.method,
+        replace_exact=request.replace_exact,
+        warm_start=request.warm_start,
+        informative_priors=request.informative_priors,
     )
 
     return {
         "task_id": task.id,
         "status": "PENDING",
-        "message": f"Fitting MRP model for {request.race_type} {request.year}",
+        "message": (
+            f"Fitting MRP model for {request.race_type} {request.year} "
+            f"({request.method})"
+        ),
     }
 
 
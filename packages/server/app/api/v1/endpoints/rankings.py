@@ -0,0 +1,96 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.services.ranking_service import (
+    ELECTION_METRICS,
+    RankingMetric,
+    RankingService,
+)
+
+router = APIRouter(prefix="/rankings", tags=["rankings"])
+
+
+def _check_election(metric: str, year: int | None, race_type: str | None) -> None:
+    if metric in ELECTION_METRICS and (year is None or not race_type):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Metric '{metric}' requires year and race_type parameters",
+        )
+
+
+def _not_found(metric: str, year: int | None, race_type: str | None) -> HTTPException:
+    if metric in ELECTION_METRICS:
+        return HTTPException(
+            status_code=404, detail=f"No {metric} data for {race_type} {year}"
+        )
+    return HTTPException(status_code=404, detail=f"No {metric} data available")
+
+
+@router.get("/{metric}")
+async def get_rankings(
+    metric: RankingMetric,
+    year: int | None = None,
+    race_type: str | None = None,
+    vintage: int | None = None,
+    order: Literal["top", "bottom"] = "top",
+    limit: int = Query(20, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Top-k or bottom-k wards for a metric."""
+    _check_election(metric, year, race_type)
+    service = RankingService(db)
+    result = await service.top(
+        metric,
+        year=year,
+        race_type=race_type,
+        vintage=vintage,
+        limit=limit,
+        ascending=order == "bottom",
+    )
+    if result is None:
+        raise _not_found(metric, year, race_type)
+    return result
+
+
+@router.get("/{metric}/percentiles")
+async def get_percentiles(
+    metric: RankingMetric,
+    year: int | None = None,
+    race_type: str | None = None,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Percentile of every ranked ward, keyed by ward_id, for map coloring."""
+    _check_election(metric, year, race_type)
+    service = RankingService(db)
+    result = await service.percentiles(
+        metric, year=year, race_type=race_type, vintage=vintage
+    )
+    if result is None:
+        raise _not_found(metric, year, race_type)
+    return result
+
+
+@router.get("/{metric}/ward/{ward_id}")
+async def get_ward_rank(
+    metric: RankingMetric,
+    ward_id: str,
+    year: int | None = None,
+    race_type: str | None = None,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Rank and percentile of a single ward for a metric."""
+    _check_election(metric, year, race_type)
+    service = RankingService(db)
+    result = await service.ward_rank(
+        metric, ward_id, year=year, race_type=race_type, vintage=vintage
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"Ward {ward_id} has no {metric} ranking"
+        )
+    return result
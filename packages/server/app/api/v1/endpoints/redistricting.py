@@ -0,0 +1,95 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.services.redistricting_service import (
+    DistrictType,
+    PlanBase,
+    RedistrictingService,
+)
+
+router = APIRouter(prefix="/redistricting", tags=["redistricting"])
+
+
+class PlanRequest(BaseModel):
+    district_type: DistrictType
+    assignments: dict[str, str | None] = {}
+    base: PlanBase = "current"
+    race_type: str | None = None
+    vintage: int | None = None
+    only_changed: bool = False
+
+
+class FairnessRequest(BaseModel):
+    district_type: DistrictType
+    year: int
+    race_type: str
+    assignments: dict[str, str | None] = {}
+    base: PlanBase = "current"
+    vintage: int | None = None
+    swing_range: float = Field(default=10.0, ge=0, le=50)
+    swing_step: float = Field(default=0.5, ge=0.1, le=10)
+
+
+@router.post("/plan")
+async def evaluate_plan(
+    body: PlanRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """District results for every election under a what-if ward assignment.
+
+    ``assignments`` maps ward_id to district id (null drops the ward). With
+    ``base="current"`` it is a diff against the wards table's current
+    districts; with ``base="empty"`` it is the full plan.
+    """
+    if body.base == "empty" and not body.assignments:
+        raise HTTPException(
+            status_code=400, detail="A plan with base='empty' needs assignments"
+        )
+    service = RedistrictingService(db)
+    result = await service.evaluate_plan(
+        district_type=body.district_type,
+        assignments=body.assignments,
+        base=body.base,
+        race_type=body.race_type,
+        vintage=body.vintage,
+        only_changed=body.only_changed,
+    )
+    if result is None:
+        raise HTTPException(status_code=404, detail="No ward data available")
+    return result
+
+
+@router.post("/fairness")
+async def get_fairness(
+    body: FairnessRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Seats won, efficiency gap, mean-median difference, partisan bias and
+    a uniform-swing seat-vote curve for one election under a plan.
+
+    Without ``assignments`` the current map is scored. Positive metrics
+    favour Democrats.
+    """
+    if body.base == "empty" and not body.assignments:
+        raise HTTPException(
+            status_code=400, detail="A plan with base='empty' needs assignments"
+        )
+    service = RedistrictingService(db)
+    result = await service.get_fairness(
+        district_type=body.district_type,
+        year=body.year,
+        race_type=body.race_type,
+        assignments=body.assignments,
+        base=body.base,
+        vintage=body.vintage,
+        swing_range=body.swing_range,
+        swing_step=body.swing_step,
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No {body.year} {body.race_type} results available",
+        )
+    return result
@@ -1,12 +1,22 @@
-from fastapi import APIRouter, Depends, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.services.trend_service import TrendService
+from app.services.trend_service import AreaTrendSort, TrendService
 
 router = APIRouter(prefix="/trends", tags=["trends"])
 
 
+class ElectionsRequest(BaseModel):
+    ward_ids: list[str] | None = None
+    county: str | None = None
+    municipality: str | None = None
+    district_type: str | None = None
+    district_id: str | None = None
+    race_type: str | None = None
+
+
 @router.get("/ward/{ward_id}")
 async def get_ward_trend(
     ward_id: str,
@@ -26,24 +36,71 @@ async def get_area_trends(
     municipality: str | None = None,
     district_type: str | None = None,
     district_id: str | None = None,
+    race_type: str = Query("president"),
+    include_wards: bool = True,
+    limit: int | None = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    sort: AreaTrendSort = "ward_id",
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """Get aggregated trends for an area."""
+    """Get aggregated trends for an area.
+
+    Returns direction counts and a turnout-weighted area trend line. Ward
+    rows are paginated with limit/offset (all wards if limit is omitted)
+    and skipped with include_wards=false.
+    """
     service = TrendService(db)
     return await service.get_area_trends(
         county=county,
         municipality=municipality,
         district_type=district_type,
         district_id=district_id,
+        race_type=race_type,
+        include_wards=include_wards,
+        limit=limit,
+        offset=offset,
+        sort=sort,
+    )
+
+
+@router.post("/elections")
+async def get_elections_columnar(
+    body: ElectionsRequest,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Election histories for any number of wards in a columnar layout.
+
+    Select wards with ``ward_ids`` and/or an area filter (county,
+    municipality, district_type + district_id); optionally limit to one
+    race_type.
+    """
+    has_area = body.county or body.municipality or (
+        body.district_type and body.district_id
+    )
+    if body.ward_ids is None and not has_area:
+        raise HTTPException(
+            status_code=400, detail="Provide ward_ids or an area filter"
+        )
+    service = TrendService(db)
+    return await service.get_elections_columnar(
+        ward_ids=body.ward_ids,
+        county=body.county,
+        municipality=body.municipality,
+        district_type=body.district_type,
+        district_id=body.district_id,
+        race_type=body.race_type,
     )
 
 
-@router.post("/bulk-elections")
+@router.post("/bulk-elections", deprecated=True)
 async def get_bulk_elections(
     ward_ids: list[str] = Body(..., embed=True),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    """Get election histories for a list of ward IDs."""
+    """Get election histories for a list of ward IDs.
+
+    Deprecated: capped at 500 wards; use POST /trends/elections.
+    """
     # Limit to 500 wards per request
     capped = ward_ids[:500]
     service = TrendService(db)
@@ -59,3 +116,36 @@ async def classify_trends(
     """Bulk trend classification for all wards."""
     service = TrendService(db)
     return await service.classify_all(race_type=race_type)
+
+
+@router.get("/changepoints")
+async def get_changepoints(
+    race_type: str = Query("president"),
+    significant_only: bool = True,
+    alpha: float = Query(0.05, gt=0, le=1),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Realignment layer: break year and size of each ward's sharpest shift.
+
+    Pre-computed by data/scripts/compute_aggregations.py. By default only
+    breaks with a (Bonferroni-adjusted) p-value below alpha are returned.
+    """
+    service = TrendService(db)
+    return await service.get_changepoints(
+        race_type=race_type, significant_only=significant_only, alpha=alpha
+    )
+
+
+@router.get("/forecasts")
+async def get_forecasts(
+    race_type: str = Query("president"),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Next-election margin/turnout forecasts per ward, map-data shaped.
+
+    Pre-computed by data/scripts/compute_aggregations.py. ``year`` is the
+    most common target year; each ward entry carries its own targetYear
+    and interval bounds.
+    """
+    service = TrendService(db)
+    return await service.get_forecasts(race_type=race_type)
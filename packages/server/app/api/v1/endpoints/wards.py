@@ -6,6 +6,7 @@ from app.core.database import get_db
 from app.services.ward_service import WardService
 from app.services.geocoding_service import GeocodingService
 from app.services.report_card_service import ReportCardService
+from app.services.similarity_service import SimilarityService
 
 router = APIRouter(prefix="/wards", tags=["wards"])
 
@@ -92,6 +93,21 @@ async def search_wards(
     return {"results": results, "query": q, "count": len(results)}
 
 
+@router.get("/clusters")
+async def get_ward_clusters(
+    response: Response,
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Get electoral archetype clusters as a compact {ward_id: cluster_id} layer.
+
+    Clusters are pre-computed by data/scripts/compute_aggregations.py.
+    """
+    response.headers["Cache-Control"] = "public, max-age=86400"
+    service = WardService(db)
+    return await service.get_clusters(vintage=vintage)
+
+
 @router.get("/{ward_id}/report-card")
 async def get_ward_report_card(
     ward_id: str,
@@ -106,6 +122,21 @@ async def get_ward_report_card(
     return report
 
 
+@router.get("/{ward_id}/similar")
+async def get_similar_wards(
+    ward_id: str,
+    k: int = Query(10, ge=1, le=100),
+    vintage: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Find the k wards most similar in voting history and demographics."""
+    service = SimilarityService(db)
+    result = await service.find_similar(ward_id, k=k, vintage=vintage)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Ward {ward_id} not found")
+    return result
+
+
 @router.get("/{ward_id}")
 async def get_ward(
     ward_id: str,
@@ -2,7 +2,8 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     wards, elections, trends, aggregations, models, spring_elections,
-    demographics, ward_notes, voter_registration, live_results, analytics,
+    demographics, ward_notes, voter_registration, live_results, analytics, rankings,
+    redistricting,
 )
 
 api_router = APIRouter(prefix="/api/v1")
@@ -17,3 +18,5 @@ api_router.include_router(ward_notes.router)
 api_router.include_router(voter_registration.router)
 api_router.include_router(live_results.router)
 api_router.include_router(analytics.router)
+api_router.include_router(rankings.router)
+api_router.include_router(redistricting.router)
@@ -21,6 +21,17 @@ class Settings(BaseSettings):
     # MRP model traces directory
     mrp_traces_dir: str = "/data/mrp_traces"
 
+    # Fitted MRP posteriors kept in memory for prediction (LRU)
+    mrp_posterior_cache_size: int = 8
+
+    # Thread pool for CPU-bound model predictions (see services/compute_pool.py)
+    compute_workers: int = 2
+    compute_max_pending: int = 8  # running + queued; beyond this requests get 503
+    compute_timeout_seconds: float = 30.0  # per request; then 504
+
+    # In-memory ward × election matrices (similar wards, rankings, ...)
+    ward_matrix_ttl_seconds: int = 3600
+
     # Admin
     admin_api_key: str = ""  # Set via ADMIN_API_KEY env var; required for destructive endpoints
     admin_analytics_key: str = ""  # Set via ADMIN_ANALYTICS_KEY env var; required for analytics dashboard
@@ -37,6 +37,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # ip -> (window_start, count)
         self._counters: dict[str, tuple[float, int]] = defaultdict(lambda: (0.0, 0))
 
+    def reset(self) -> None:
+        """Forget every client's window (used between tests)."""
+        self._counters.clear()
+
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         client_ip = request.client.host if request.client else "unknown"
         now = time.monotonic()
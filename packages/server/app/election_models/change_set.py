@@ -0,0 +1,66 @@
+"""Change detection for the incremental aggregation stage.
+
+data/scripts/compute_aggregations.py fingerprints every
+(ward_vintage, election_year, race_type) in election_results and compares
+the fingerprints with those stored in election_versions by the previous
+run. These helpers turn that comparison into what each stage must redo.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+# (ward_vintage, election_year, race_type) and its (row_count, checksum)
+ElectionKey = tuple[int, int, str]
+Fingerprint = tuple[int, str]
+
+
+def diff_fingerprints(
+    current: dict[ElectionKey, Fingerprint],
+    stored: dict[ElectionKey, Fingerprint],
+    full: bool = False,
+) -> tuple[set[ElectionKey], set[ElectionKey]]:
+    """Elections added, changed or removed between two fingerprint sets.
+
+    Returns (changed, removed): changed holds every differing key (all keys
+    if full), removed the subset missing from current.
+    """
+    if full:
+        changed = set(current) | set(stored)
+    else:
+        changed = {
+            k for k in current.keys() | stored.keys()
+            if current.get(k) != stored.get(k)
+        }
+    return changed, changed - set(current)
+
+
+def rewrite_scope(
+    changed: set[ElectionKey], removed: set[ElectionKey], full: bool = False
+) -> tuple[set[str], set[str]]:
+    """Race types a per-ward stage rewrites whole, and those it patches.
+
+    A race type is rewritten whole on a full rebuild or when one of its
+    elections was removed; otherwise only wards with results in a changed
+    election (see changed_wards) are rewritten.
+    """
+    race_types = {race for _, _, race in changed}
+    whole = race_types if full else {race for _, _, race in removed}
+    return whole, race_types - whole
+
+
+def changed_wards(
+    vintage: int,
+    ward_ids: NDArray[np.str_],
+    elections: list[tuple[int, str]],
+    present: NDArray[np.bool_],
+    changed: set[ElectionKey],
+    race_types: set[str],
+) -> dict[str, set[str]]:
+    """Wards of one vintage with results in a changed election, per race type."""
+    wards: dict[str, set[str]] = {race: set() for race in race_types}
+    for j, (year, race) in enumerate(elections):
+        if race in wards and (vintage, year, race) in changed:
+            wards[race].update(ward_ids[present[:, j]].tolist())
+    return wards
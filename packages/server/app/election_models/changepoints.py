@@ -0,0 +1,143 @@
+"""Vectorized realignment (changepoint) detection on ward margin series.
+
+For every ward the margin series is compared against a linear trend with a
+single level shift::
+
+    margin = a + b·year + d·[year >= break_year]
+
+Every candidate break year is tried for all wards at once (a batched 3×3
+least-squares solve per candidate), and each ward keeps the break that
+reduces the residual sum of squares the most. ``d`` is the size of the
+sudden move in margin points — e.g. a ward that dropped 20 points in 2016
+and then resumed its old slope — which a single linear slope smears out.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import stats  # type: ignore[import-untyped]
+
+
+@dataclass
+class ChangepointFit:
+    break_year: NDArray[np.int64]  # first year of the new level (0 if invalid)
+    magnitude: NDArray[np.float64]  # level shift d, margin points (+ = toward D)
+    slope: NDArray[np.float64]  # within-segment slope b, points/year
+    f_stat: NDArray[np.float64]  # shift model vs. plain linear trend
+    p_value: NDArray[np.float64]  # Bonferroni-adjusted over candidate breaks
+    n: NDArray[np.int64]
+    valid: NDArray[np.bool_]
+
+
+def detect_changepoints(
+    years: NDArray[np.int64],
+    values: NDArray[np.float64],
+    min_segment: int = 2,
+) -> ChangepointFit:
+    """Best single level-shift break for every row of a (n_wards, n_years) matrix.
+
+    Args:
+        years: (n_years,) ascending election years matching the columns.
+        values: (n_wards, n_years) margins, NaN where a ward has no result.
+        min_segment: Minimum observed elections on each side of the break.
+
+    Returns:
+        ChangepointFit with one entry per ward. A ward is valid when it has
+        at least one admissible break and 2·min_segment + 1 elections, so
+        the shift model keeps a residual degree of freedom. The F test
+        compares the shift model with the linear fit; its p-value is
+        multiplied by the number of candidate breaks tried for that ward,
+        since the best of several breaks is reported.
+    """
+    mask = ~np.isnan(values)
+    w = mask.astype(np.float64)
+    y = np.where(mask, values, 0.0)
+    year_arr = np.asarray(years, dtype=np.int64)
+    t = (year_arr - year_arr.mean()).astype(np.float64)
+    n_wards, n_years = values.shape
+    n = w.sum(axis=1)
+
+    sse_linear = _masked_sse(np.stack([np.ones(n_years), t], axis=1), w, y)
+
+    best_sse = np.full(n_wards, np.inf)
+    best_break = np.zeros(n_wards, dtype=np.int64)
+    best_shift = np.full(n_wards, np.nan)
+    best_slope = np.full(n_wards, np.nan)
+    candidates = np.zeros(n_wards)
+
+    # Observed elections before each column, to enforce min_segment
+    before = np.cumsum(w, axis=1) - w
+    for b in range(1, n_years):
+        step = (np.arange(n_years) >= b).astype(np.float64)
+        design = np.stack([np.ones(n_years), t, step], axis=1)
+        # Break at the ward's first observed election of the new level, so
+        # gaps in a ward's history do not produce duplicate candidates
+        ok = (
+            mask[:, b]
+            & (before[:, b] >= min_segment)
+            & (n - before[:, b] >= min_segment)
+        )
+        if not ok.any():
+            continue
+        sse, beta = _masked_sse(design, w, y, return_beta=True)
+        ok &= np.isfinite(sse)
+        candidates += ok
+        better = ok & (sse < best_sse)
+        best_sse = np.where(better, sse, best_sse)
+        best_break = np.where(better, year_arr[b], best_break)
+        best_shift = np.where(better, beta[:, 2], best_shift)
+        best_slope = np.where(better, beta[:, 1], best_slope)
+
+    valid = np.isfinite(best_sse) & (n >= 2 * min_segment + 1)
+    df = np.maximum(n - 3, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_stat = (sse_linear - best_sse) / (best_sse / df)
+    f_stat = np.where(valid, np.clip(f_stat, 0.0, None), np.nan)
+    # Zero residual: infinitely strong evidence only if the shift explains
+    # something the line does not. A series the line already fits exactly
+    # (constant, e.g. uncontested ±100, or linear) has no break: F = 0.
+    exact = valid & (best_sse <= 1e-12)
+    explains = sse_linear - best_sse > 1e-9
+    f_stat = np.where(exact, np.where(explains, np.inf, 0.0), f_stat)
+
+    p_raw = stats.f.sf(np.nan_to_num(f_stat, nan=0.0, posinf=1e12), 1, df)
+    p_value = np.where(
+        valid, np.minimum(p_raw * np.maximum(candidates, 1), 1.0), np.nan
+    )
+
+    return ChangepointFit(
+        break_year=np.where(valid, best_break, 0),
+        magnitude=np.where(valid, best_shift, np.nan),
+        slope=np.where(valid, best_slope, np.nan),
+        f_stat=f_stat,
+        p_value=p_value,
+        n=n.astype(np.int64),
+        valid=valid,
+    )
+
+
+def _masked_sse(
+    design: NDArray[np.float64],
+    w: NDArray[np.float64],
+    y: NDArray[np.float64],
+    return_beta: bool = False,
+):
+    """Residual sum of squares of y ~ design, per row, using only masked cells.
+
+    Solves all rows' normal equations in one batched call; rows whose
+    system is singular (too few points) get an infinite SSE.
+    """
+    xtx = np.einsum("nm,mi,mj->nij", w, design, design)
+    xty = np.einsum("nm,mi->ni", w * y, design)
+    k = design.shape[1]
+    singular = np.abs(np.linalg.det(xtx)) < 1e-9
+    xtx[singular] = np.eye(k)
+    beta = np.linalg.solve(xtx, xty[..., None])[..., 0]
+    resid = (y - beta @ design.T) * w
+    sse = np.where(singular, np.inf, (resid**2).sum(axis=1))
+    if return_beta:
+        return sse, beta
+    return sse
@@ -0,0 +1,159 @@
+"""Electoral archetype clustering of ward voting histories.
+
+Groups wards by the shape of their margin and turnout trajectories across
+elections using scikit-learn. Everything runs as one vectorized batch over
+the ward × election matrix, so it can be rerun by the aggregation stage
+after every load.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+from sklearn.cluster import AgglomerativeClustering, KMeans
+
+
+@dataclass
+class ClusterResult:
+    labels: NDArray[np.int64]  # cluster id per ward, ordered D → R
+    distances: NDArray[np.float64]  # distance to own centroid (feature space)
+    profiles: list[dict]  # one summary per cluster id
+
+
+def trajectory_features(
+    margin: NDArray[np.float64], total: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Standardized margin + turnout-index trajectories, one row per ward.
+
+    margin is (n_wards, n_elections) with NaN for missing results. Turnout
+    is expressed relative to the ward's own mean vote count so clusters
+    follow the shape of the trajectory rather than ward size. Missing cells
+    are imputed at the column mean; both blocks carry equal weight.
+    """
+    present = ~np.isnan(margin)
+    votes = np.where(present, total, np.nan).astype(np.float64)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        ward_mean = np.nanmean(votes, axis=1, keepdims=True)
+        turnout_index = votes / ward_mean
+
+    blocks = []
+    for block in (margin, turnout_index):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nan_to_num(np.nanmean(block, axis=0))
+            std = np.nanstd(block, axis=0)
+        std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+        z = np.nan_to_num((block - mean) / std, nan=0.0)
+        blocks.append(z / np.sqrt(max(z.shape[1], 1)))
+    return np.hstack(blocks)
+
+
+def cluster_trajectories(
+    margin: NDArray[np.float64],
+    total: NDArray[np.float64],
+    n_clusters: int = 8,
+    method: Literal["kmeans", "hierarchical"] = "kmeans",
+    random_state: int = 0,
+) -> ClusterResult:
+    """Cluster wards by their margin/turnout trajectories.
+
+    Args:
+        margin: (n_wards, n_elections) margins in points, NaN if missing.
+        total: (n_wards, n_elections) total votes.
+        n_clusters: Number of archetypes.
+        method: 'kmeans' (default, fast) or 'hierarchical' (Ward linkage,
+            O(n²) memory — fine for a single vintage of ~7k wards).
+
+    Returns:
+        ClusterResult with cluster ids renumbered from most Democratic (0)
+        to most Republican, so ids stay stable across reruns.
+    """
+    features = trajectory_features(margin, total)
+    n_clusters = max(1, min(n_clusters, len(features)))
+
+    if method == "hierarchical":
+        raw = AgglomerativeClustering(
+            n_clusters=n_clusters, linkage="ward"
+        ).fit_predict(features)
+    else:
+        raw = KMeans(
+            n_clusters=n_clusters, n_init=10, random_state=random_state
+        ).fit_predict(features)
+
+    # Centroids in feature space via one-hot matmul (no per-cluster loop)
+    onehot = np.zeros((len(features), n_clusters))
+    onehot[np.arange(len(features)), raw] = 1.0
+    counts = onehot.sum(axis=0)
+    centroids = (onehot.T @ features) / np.maximum(counts, 1)[:, None]
+    distances = np.linalg.norm(features - centroids[raw], axis=1)
+
+    # Mean margin trajectory per cluster, ignoring missing cells
+    present = ~np.isnan(margin)
+    filled = np.where(present, margin, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        margin_profile = (onehot.T @ filled) / (onehot.T @ present)
+        vote_share = onehot.T @ np.where(present, total, 0.0)
+        turnout_profile = vote_share / vote_share.mean(axis=1, keepdims=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        overall = np.nanmean(margin_profile, axis=1)
+    renumber = np.empty(n_clusters, dtype=np.int64)
+    renumber[np.argsort(-np.nan_to_num(overall, nan=0.0), kind="stable")] = np.arange(
+        n_clusters
+    )
+
+    profiles: list[dict] = [{} for _ in range(n_clusters)]
+    for raw_id in range(n_clusters):
+        trajectory = margin_profile[raw_id]
+        valid = np.flatnonzero(~np.isnan(trajectory))
+        latest = float(trajectory[valid[-1]]) if len(valid) else None
+        shift = (
+            float(trajectory[valid[-1]] - trajectory[valid[0]])
+            if len(valid) > 1 else 0.0
+        )
+        profiles[renumber[raw_id]] = {
+            "cluster_id": int(renumber[raw_id]),
+            "ward_count": int(counts[raw_id]),
+            "latest_margin": round(latest, 2) if latest is not None else None,
+            "margin_shift": round(shift, 2),
+            "label": _archetype_label(latest, shift),
+            "margin_trajectory": [
+                None if np.isnan(v) else round(float(v), 2) for v in trajectory
+            ],
+            "turnout_trajectory": [
+                None if np.isnan(v) else round(float(v), 3)
+                for v in turnout_profile[raw_id]
+            ],
+        }
+
+    return ClusterResult(
+        labels=renumber[raw], distances=distances, profiles=profiles
+    )
+
+
+def _archetype_label(latest: float | None, shift: float) -> str:
+    """Human-readable archetype, e.g. 'Lean R, trending R'."""
+    if latest is None:
+        return "Unknown"
+    if latest >= 15:
+        lean = "Safe D"
+    elif latest >= 5:
+        lean = "Lean D"
+    elif latest > -5:
+        lean = "Competitive"
+    elif latest > -15:
+        lean = "Lean R"
+    else:
+        lean = "Safe R"
+
+    if shift >= 5:
+        return f"{lean}, trending D"
+    if shift <= -5:
+        return f"{lean}, trending R"
+    return f"{lean}, stable"
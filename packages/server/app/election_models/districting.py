@@ -0,0 +1,69 @@
+"""Sparse ward → district assignment matrices for plan evaluation.
+
+A district plan is a label per ward (None for wards left out of the plan).
+It is encoded once as a (n_districts, n_wards) 0/1 CSR matrix, so district
+totals for every election are a single sparse × dense product with the
+ward × election vote arrays, and re-evaluating a plan after moving a few
+wards costs one more product rather than a database round trip.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse  # type: ignore[import-untyped]
+
+
+@dataclass
+class DistrictAssignment:
+    district_ids: list[str]  # sorted, one per matrix row
+    codes: NDArray[np.int64]  # (n_wards,) row in district_ids, -1 if unassigned
+    matrix: sparse.csr_matrix  # (n_districts, n_wards) 0/1
+
+    @property
+    def n_districts(self) -> int:
+        return len(self.district_ids)
+
+    def ward_counts(self) -> NDArray[np.int64]:
+        return np.bincount(self.codes[self.codes >= 0], minlength=self.n_districts)
+
+
+def build_assignment(labels: Sequence[str | None]) -> DistrictAssignment:
+    """Encode a district label per ward as a sparse assignment matrix.
+
+    District ids sort numerically when they are all integers ("2" before
+    "10"), otherwise lexically. None and empty labels are unassigned.
+    """
+    label_arr = np.array([lab or "" for lab in labels], dtype=object)
+    assigned = np.flatnonzero(label_arr != "")
+    names = sorted(
+        {str(lab) for lab in label_arr[assigned]},
+        key=lambda d: (0, int(d), d) if d.isdigit() else (1, 0, d),
+    )
+    index = {d: i for i, d in enumerate(names)}
+
+    codes = np.full(len(label_arr), -1, dtype=np.int64)
+    codes[assigned] = [index[str(lab)] for lab in label_arr[assigned]]
+
+    matrix = sparse.csr_matrix(
+        (np.ones(len(assigned)), (codes[assigned], assigned)),
+        shape=(len(names), len(label_arr)),
+    )
+    return DistrictAssignment(district_ids=names, codes=codes, matrix=matrix)
+
+
+def district_totals(
+    assignment: DistrictAssignment,
+    votes: dict[str, NDArray[np.int64]],
+) -> dict[str, NDArray[np.int64]]:
+    """Sum each (n_wards, n_elections) vote array into districts.
+
+    Returns arrays of shape (n_districts, n_elections) under the same keys.
+    """
+    return {
+        name: np.asarray(assignment.matrix @ arr).round().astype(np.int64)
+        for name, arr in votes.items()
+    }
@@ -0,0 +1,154 @@
+"""Seat-vote curves and partisan-fairness metrics for a district plan.
+
+All metrics use two-party votes and follow the margin convention used
+elsewhere: positive values favour Democrats.
+
+- Efficiency gap: (Republican wasted − Democratic wasted) / two-party
+  votes. Wasted votes are every vote for a loser and a winner's votes
+  above half the district's two-party total.
+- Mean-median difference: median − mean of the district Democratic share.
+- Partisan bias: Democratic seat share minus one half when the statewide
+  vote is swung to 50%.
+
+A district with equal two-party votes is won by neither party: it is not
+a Democratic seat, and each party wastes half its votes there, so it
+leaves the efficiency gap unchanged.
+
+The seat-vote curve applies the ward-level uniform swing model
+(``uniform_swing.py``) for a whole grid of swings in one broadcast call and
+sums the projected wards into districts with one sparse product.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from app.election_models.districting import DistrictAssignment
+from app.election_models.uniform_swing import uniform_swing
+
+
+@dataclass
+class FairnessMetrics:
+    dem_vote_share: float  # statewide two-party
+    dem_seats: int
+    seats: int  # districts with two-party votes
+    efficiency_gap: float
+    mean_median: float
+    partisan_bias: float
+    district_dem_share: NDArray[np.float64]  # NaN where no two-party votes
+
+
+@dataclass
+class SeatVoteCurve:
+    swing: NDArray[np.float64]  # points applied to every ward
+    dem_vote_share: NDArray[np.float64]
+    dem_seats: NDArray[np.int64]
+    seat_share: NDArray[np.float64]
+
+
+def plan_metrics(
+    dem: NDArray[np.int64], rep: NDArray[np.int64]
+) -> FairnessMetrics:
+    """Seats, efficiency gap and mean-median for per-district votes."""
+    dem = np.asarray(dem, dtype=np.float64)
+    rep = np.asarray(rep, dtype=np.float64)
+    two_party = dem + rep
+    contested = two_party > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(contested, dem / two_party, np.nan)
+
+    d, r, t = dem[contested], rep[contested], two_party[contested]
+    dem_won, rep_won = d > r, r > d
+    wasted_dem = np.where(dem_won, d - t / 2, np.where(rep_won, d, d / 2))
+    wasted_rep = np.where(rep_won, r - t / 2, np.where(dem_won, r, r / 2))
+    total = t.sum()
+
+    shares = share[contested]
+    vote_share = float(d.sum() / total) if total else float("nan")
+    return FairnessMetrics(
+        dem_vote_share=vote_share,
+        dem_seats=int(dem_won.sum()),
+        seats=int(contested.sum()),
+        efficiency_gap=(
+            float((wasted_rep.sum() - wasted_dem.sum()) / total)
+            if total else float("nan")
+        ),
+        mean_median=(
+            float(np.median(shares) - shares.mean())
+            if len(shares) else float("nan")
+        ),
+        partisan_bias=float("nan"),
+        district_dem_share=share,
+    )
+
+
+def seat_vote_curve(
+    assignment: DistrictAssignment,
+    dem: NDArray[np.int64],
+    rep: NDArray[np.int64],
+    total: NDArray[np.int64],
+    swings: NDArray[np.float64],
+) -> SeatVoteCurve:
+    """Seats and statewide vote share for every swing in the grid.
+
+    Args:
+        assignment: Ward → district assignment.
+        dem, rep, total: (n_wards,) votes for one election.
+        swings: (n_swings,) uniform swings in points (positive = toward D).
+    """
+    swings = np.asarray(swings, dtype=np.float64)
+    projected = uniform_swing(dem, rep, total, swings[:, None])
+    # (n_districts, n_swings) district totals under every swing
+    district_dem = np.asarray(assignment.matrix @ projected["dem_votes"].T)
+    district_rep = np.asarray(assignment.matrix @ projected["rep_votes"].T)
+
+    in_plan = assignment.codes >= 0
+    state_dem = projected["dem_votes"][:, in_plan].sum(axis=1)
+    state_two = state_dem + projected["rep_votes"][:, in_plan].sum(axis=1)
+    contested = (district_dem + district_rep) > 0
+    dem_seats = ((district_dem > district_rep) & contested).sum(axis=0)
+    n_seats = max(int(contested.any(axis=1).sum()), 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vote_share = np.where(state_two > 0, state_dem / state_two, np.nan)
+    return SeatVoteCurve(
+        swing=swings,
+        dem_vote_share=vote_share,
+        dem_seats=dem_seats.astype(np.int64),
+        seat_share=dem_seats / n_seats,
+    )
+
+
+def evaluate_fairness(
+    assignment: DistrictAssignment,
+    dem: NDArray[np.int64],
+    rep: NDArray[np.int64],
+    total: NDArray[np.int64],
+    swings: NDArray[np.float64],
+) -> tuple[FairnessMetrics, SeatVoteCurve]:
+    """Metrics for the observed election plus the seat-vote curve.
+
+    Partisan bias uses one extra swing appended to the batched grid: the
+    one that moves the statewide two-party vote in the plan's wards to 50%
+    (exactly, unless ward shares hit the model's 1%/99% clip).
+    """
+    district_dem = np.asarray(assignment.matrix @ dem).round().astype(np.int64)
+    district_rep = np.asarray(assignment.matrix @ rep).round().astype(np.int64)
+    metrics = plan_metrics(district_dem, district_rep)
+
+    swings = np.asarray(swings, dtype=np.float64)
+    even = (0.5 - metrics.dem_vote_share) * 100
+    grid = np.append(swings, even if np.isfinite(even) else 0.0)
+    curve = seat_vote_curve(assignment, dem, rep, total, grid)
+
+    if np.isfinite(even):
+        metrics.partisan_bias = float(curve.seat_share[-1] - 0.5)
+    return metrics, SeatVoteCurve(
+        swing=curve.swing[:-1],
+        dem_vote_share=curve.dem_vote_share[:-1],
+        dem_seats=curve.dem_seats[:-1],
+        seat_share=curve.seat_share[:-1],
+    )
@@ -9,81 +9,71 @@ demographic group shifts.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING
 
 import arviz as az
 import numpy as np
 import pandas as pd
 import pymc as pm
+from numpy.typing import NDArray
+
+from app.election_models.mrp_predict import (  # noqa: F401 — re-exported
+    ADJUSTMENT_MAP,
+    COVARIATES,
+    category_levels,
+    predict_mrp,
+    prepare_ward_df,
+)
+from app.election_models.mrp_progress import SamplingProgress
+from app.election_models.mrp_storage import (
+    APPROXIMATE_METHODS,
+    FitMethod,
+    load_posterior,
+    load_trace,
+)
+from app.election_models.mrp_warm_start import (
+    WarmStart,
+    draw_moments,
+    previous_draws,
+    warm_start_priors,
+)
+
+if TYPE_CHECKING:
+    from pytensor.tensor.variable import TensorVariable
 
 logger = logging.getLogger(__name__)
 
-# Demographic covariate columns expected in ward_df
-COVARIATES = [
-    "log_population_density",
-    "college_degree_pct",
-    "median_household_income_scaled",
-    "white_pct",
-]
-
-# Post-hoc adjustment mapping: param name -> covariate index in COVARIATES
-ADJUSTMENT_MAP = {
-    "collegeShift": 1,   # college_degree_pct
-    "incomeShift": 2,    # median_household_income_scaled
-}
-
-
-def prepare_ward_df(ward_df: pd.DataFrame) -> pd.DataFrame:
-    """Prepare a ward DataFrame with the required derived columns.
-
-    Expects columns: ward_id, dem_votes, rep_votes, total_votes,
-    county, population_density, college_degree_pct,
-    median_household_income, white_pct, region
-    """
-    df = ward_df.copy()
-
-    # Log population density (add 1 to avoid log(0))
-    df["log_population_density"] = np.log1p(
-        df["population_density"].fillna(0).clip(lower=0)
-    )
-
-    # Scale income to [0, 1] range
-    income = df["median_household_income"].fillna(0)
-    income_max = income.max()
-    if income_max > 0:
-        df["median_household_income_scaled"] = income / income_max
-    else:
-        df["median_household_income_scaled"] = 0.0
-
-    # Fill NaNs in covariates
-    for col in ["college_degree_pct", "white_pct"]:
-        df[col] = df[col].fillna(df[col].median())
-
-    # Compute two-party dem share
-    two_party = df["dem_votes"] + df["rep_votes"]
-    df["dem_two_party_share"] = np.where(
-        two_party > 0,
-        df["dem_votes"] / two_party,
-        0.5,
-    )
-
-    # Clamp to avoid logit(-inf)/logit(inf)
-    df["dem_two_party_share"] = df["dem_two_party_share"].clip(0.01, 0.99)
+# Tuning steps for a warm-started fit (the mass matrix and step size start
+# from the earlier fit's adaptation, so only a short re-adaptation is needed)
+WARM_START_TUNE = 200
 
-    # Encode county and region as integer codes
-    df["county_code"] = pd.Categorical(df["county"]).codes
-    df["region_code"] = pd.Categorical(df["region"]).codes
+# Pseudo-sample weight of the warm-start variance estimate in the mass
+# matrix adaptation; it is overtaken by the new fit's own draws as it tunes
+WARM_START_WEIGHT = 50
 
-    return df
+DEFAULT_PRIORS: dict = {
+    "intercept": (0.0, 2.0),
+    "beta": (0.0, 1.0),
+    "sigma_county": 1.0,
+    "sigma_region": 1.0,
+    "sigma_obs": 1.0,
+}
 
 
-def build_mrp_model(ward_df: pd.DataFrame) -> pm.Model:
+def build_mrp_model(
+    ward_df: pd.DataFrame, priors: dict | None = None
+) -> pm.Model:
     """Construct the PyMC MRP model.
 
     Outcome: logit(dem_two_party_share) per ward
     Fixed effects: log(pop_density), college_pct, income_scaled, white_pct
     Random effects: county intercepts, region intercepts
+
+    priors overrides DEFAULT_PRIORS: (mu, sigma) for the Normal intercept
+    and beta (scalars or per-covariate arrays), and the HalfNormal scale of
+    each sigma_*.
     """
+    priors = {**DEFAULT_PRIORS, **(priors or {})}
     df = prepare_ward_df(ward_df)
 
     n_counties = df["county_code"].nunique()
@@ -106,17 +96,24 @@ def build_mrp_model(ward_df: pd.DataFrame) -> pm.Model:
         pm.Data("region_idx", region_idx)
 
         # Priors — fixed effects
-        intercept = pm.Normal("intercept", mu=0, sigma=2)
-        beta = pm.Normal("beta", mu=0, sigma=1, shape=len(COVARIATES))
+        intercept = pm.Normal(
+            "intercept", mu=priors["intercept"][0], sigma=priors["intercept"][1]
+        )
+        beta = pm.Normal(
+            "beta",
+            mu=priors["beta"][0],
+            sigma=priors["beta"][1],
+            shape=len(COVARIATES),
+        )
 
         # Random effects — county
-        sigma_county = pm.HalfNormal("sigma_county", sigma=1)
+        sigma_county = pm.HalfNormal("sigma_county", sigma=priors["sigma_county"])
         county_effect = pm.Normal(
             "county_effect", mu=0, sigma=sigma_county, shape=n_counties
         )
 
         # Random effects — region
-        sigma_region = pm.HalfNormal("sigma_region", sigma=1)
+        sigma_region = pm.HalfNormal("sigma_region", sigma=priors["sigma_region"])
         region_effect = pm.Normal(
             "region_effect", mu=0, sigma=sigma_region, shape=n_regions
         )
@@ -130,7 +127,7 @@ def build_mrp_model(ward_df: pd.DataFrame) -> pm.Model:
         )
 
         # Observation noise
-        sigma_obs = pm.HalfNormal("sigma_obs", sigma=1)
+        sigma_obs = pm.HalfNormal("sigma_obs", sigma=priors["sigma_obs"])
 
         # Likelihood (Normal on logit scale)
         pm.Normal("y_obs", mu=mu, sigma=sigma_obs, observed=y)
@@ -144,187 +141,206 @@ def fit_mrp_model(
     tune: int = 1000,
     chains: int = 2,
     target_accept: float = 0.9,
+    method: FitMethod = "nuts",
+    advi_iterations: int = 30_000,
+    cores: int | None = None,
+    warm_start: WarmStart | None = None,
+    progress: SamplingProgress | None = None,
 ) -> az.InferenceData:
-    """Run MCMC sampling and return ArviZ InferenceData."""
-    model = build_mrp_model(ward_df)
-
-    with model:
-        trace = pm.sample(
-            draws=draws,
-            tune=tune,
-            chains=chains,
-            target_accept=target_accept,
-            return_inferencedata=True,
-            progressbar=True,
-        )
+    """Fit the model and return ArviZ InferenceData.
+
+    method="nuts" runs MCMC. "advi" runs mean-field ADVI (pm.fit) for up to
+    advi_iterations steps, stopping early once the parameters converge;
+    "pathfinder" uses pymc-extras. Both approximations return `draws`
+    samples as a single chain and record the method in the posterior's
+    ``fit_method`` attribute; tune, chains and target_accept are ignored.
+    cores caps the processes NUTS runs chains in (PyMC's default if None).
+
+    warm_start starts NUTS from an earlier fit: chains start at dispersed
+    draws of it, and the mass matrix and step size adaptation start from its
+    posterior variances and final step size, so a short tune (see
+    WARM_START_TUNE) suffices. With warm_start.informative_priors the fixed
+    effects and scales also get priors centred on its posterior. Ignored by
+    the approximate methods.
+
+    progress receives every NUTS draw or ADVI iteration (see
+    mrp_progress.SamplingProgress); Pathfinder reports nothing.
+    """
+    levels = category_levels(ward_df)
+    priors = None
+    if warm_start is not None and warm_start.informative_priors and method == "nuts":
+        priors = warm_start_priors(warm_start)
+    model = build_mrp_model(ward_df, priors)
+
+    if method == "nuts":
+        step = initvals = None
+        if warm_start is not None:
+            step, initvals = _warm_start_step(
+                model, warm_start, levels, chains, target_accept
+            )
+        with model:
+            trace = pm.sample(
+                draws=draws,
+                tune=tune,
+                chains=chains,
+                cores=cores,
+                step=step,
+                initvals=initvals,
+                target_accept=target_accept,
+                callback=progress,
+                return_inferencedata=True,
+                progressbar=True,
+            )
+        if warm_start is not None:
+            trace.posterior.attrs["warm_start"] = warm_start.label
+    elif method == "advi":
+        with model:
+            callbacks = [pm.callbacks.CheckParametersConvergence(diff="absolute")]
+            if progress is not None:
+                # Iterations are an upper bound: convergence may stop it early
+                progress.configure(chains=1, tune=0, draws=advi_iterations)
+                callbacks.append(progress.advi)
+            approx = pm.fit(
+                n=advi_iterations,
+                method="advi",
+                callbacks=callbacks,
+                progressbar=True,
+            )
+            trace = approx.sample(draws)
+        trace.posterior.attrs["final_loss"] = float(approx.hist[-1])
+    elif method == "pathfinder":
+        try:
+            import pymc_extras as pmx  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError(
+                "Pathfinder fitting needs pymc-extras (pip install pymc-extras)"
+            ) from e
+        trace = pmx.fit(method="pathfinder", model=model, num_draws=draws)
+    else:
+        raise ValueError(f"Unknown MRP fit method: {method}")
+    if progress is not None:
+        progress.finish()
 
-    # Log diagnostics
-    summary = az.summary(trace, var_names=["intercept", "beta", "sigma_obs"])
-    logger.info("MRP fit summary:\n%s", summary)
+    trace.posterior.attrs["fit_method"] = method
+    diagnostics = get_diagnostics(trace)
+    logger.info("MRP %s fit diagnostics: %s", method, diagnostics)
+    return trace
 
-    rhat_max = float(summary["r_hat"].max())
-    ess_min = float(summary["ess_bulk"].min())
-    logger.info("R-hat max: %.3f, ESS min: %.0f", rhat_max, ess_min)
 
-    return trace
+def load_warm_start(
+    race_type: str,
+    year: int,
+    ward_vintage: int,
+    informative_priors: bool = False,
+) -> WarmStart | None:
+    """Load a stored fit as a warm start, or None if it does not exist."""
+    trace = load_trace(race_type, year, ward_vintage)
+    if trace is None:
+        return None
+    posterior = load_posterior(race_type, year, ward_vintage)
+    categories = None
+    if (
+        posterior is not None
+        and posterior.counties is not None
+        and posterior.regions is not None
+    ):
+        categories = {"county": posterior.counties, "region": posterior.regions}
+    return WarmStart(
+        trace=trace,
+        categories=categories,
+        label=f"{race_type}_{year}_v{ward_vintage}",
+        informative_priors=informative_priors,
+    )
 
 
-def predict_mrp(
-    trace: az.InferenceData,
-    ward_df: pd.DataFrame,
-    adjustments: dict[str, Any] | None = None,
-) -> dict[str, dict[str, float]]:
-    """Generate ward-level predictions from a fitted MRP trace.
-
-    Args:
-        trace: Fitted ArviZ InferenceData with posterior samples.
-        ward_df: Ward data with same structure as training data.
-        adjustments: Optional post-hoc adjustments:
-            - turnoutChange: uniform % change in turnout
-            - collegeShift: shift on college covariate (points)
-            - urbanShift: shift applied to wards with density > 3000
-            - ruralShift: shift applied to wards with density < 500
-            - incomeShift: shift on income covariate (points)
-
-    Returns:
-        Dict keyed by ward_id with prediction fields.
-    """
-    from scipy.special import expit  # type: ignore[import-untyped]
+def _unconstrained(
+    model: pm.Model, rv: TensorVariable, draws: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Draws of a free variable mapped to the sampler's unconstrained space
+    (e.g. log for the HalfNormal scales)."""
+    transform = model.rvs_to_transforms.get(rv)
+    if transform is None:
+        return draws
+    return np.asarray(transform.forward(draws, *rv.owner.inputs).eval())
+
+
+def _warm_start_step(
+    model: pm.Model,
+    warm_start: WarmStart,
+    levels: dict[str, list[str]],
+    chains: int,
+    target_accept: float,
+) -> tuple[pm.NUTS, list[dict]]:
+    """NUTS step and per-chain initial values seeded from an earlier fit."""
+    from pymc.step_methods.hmc.quadpotential import QuadPotentialDiagAdapt
+
+    means, variances = [], []
+    initvals: list[dict] = [{} for _ in range(chains)]
+    for rv in model.free_RVs:
+        draws = previous_draws(warm_start, rv.name, levels)
+        expected = model.initial_point()[model.rvs_to_values[rv].name].shape
+        if draws.shape[1:] != expected:
+            raise ValueError(f"Warm start shape mismatch for {rv.name}")
+
+        # Initial values are on the constrained scale, one draw per chain
+        picks = np.linspace(0, len(draws) - 1, chains, dtype=int)
+        for chain, pick in zip(initvals, picks, strict=True):
+            chain[rv.name] = np.nan_to_num(draws[pick])
+
+        # Mass matrix statistics are on the sampler's unconstrained scale
+        flat = _unconstrained(model, rv, draws).reshape(len(draws), -1)
+        mean, var = draw_moments(flat)
+        means.append(mean)
+        variances.append(var)
+
+    mean = np.concatenate(means)
+    var = np.concatenate(variances)
+    potential = QuadPotentialDiagAdapt(
+        len(mean), mean, var, initial_weight=WARM_START_WEIGHT
+    )
+    # Adapted step size of the earlier fit (NUTS default for approximations)
+    stats = getattr(warm_start.trace, "sample_stats", None)
+    if stats is not None and "step_size" in stats:
+        step_size = float(np.median(stats["step_size"].values[:, -1]))
+    else:
+        step_size = 0.25 / len(mean) ** 0.25
+    with model:
+        step = pm.NUTS(
+            vars=[model.rvs_to_values[rv] for rv in model.free_RVs],
+            potential=potential,
+            step_scale=step_size * len(mean) ** 0.25,
+            target_accept=target_accept,
+        )
+    logger.info(
+        "Warm-starting MRP fit from %s (step size %.3f, %d parameters)",
+        warm_start.label, step_size, len(mean),
+    )
+    return step, initvals
 
-    adjustments = adjustments or {}
-    df = prepare_ward_df(ward_df)
 
-    # Extract posterior means
-    posterior = trace.posterior
-    intercept = float(posterior["intercept"].mean())
-    beta = posterior["beta"].mean(dim=["chain", "draw"]).values
-    county_effect = posterior["county_effect"].mean(dim=["chain", "draw"]).values
-    region_effect = posterior["region_effect"].mean(dim=["chain", "draw"]).values
-
-    # Apply covariate-based adjustments to beta
-    beta_adj = beta.copy()
-    for param_name, cov_idx in ADJUSTMENT_MAP.items():
-        shift = adjustments.get(param_name, 0)
-        if shift != 0:
-            # Convert points shift to coefficient adjustment
-            # A 1-point shift means adding 0.01 to the logit-scale prediction per unit
-            beta_adj[cov_idx] += shift * 0.04
-
-    # Build linear predictor
-    X = df[COVARIATES].values.astype(np.float64)
-    county_idx = df["county_code"].values
-    region_idx = df["region_code"].values
+def get_diagnostics(trace: az.InferenceData) -> dict:
+    """Extract key diagnostics from a fitted trace.
 
-    mu = (
-        intercept
-        + X @ beta_adj
-        + county_effect[county_idx]
-        + region_effect[region_idx]
-    )
+    R-hat and ESS are only meaningful for MCMC; approximate fits report
+    their method (and ADVI its final loss) instead.
+    """
+    method = trace.posterior.attrs.get("fit_method", "nuts")
+    diagnostics: dict = {
+        "fit_method": method,
+        "approximate": method in APPROXIMATE_METHODS,
+        "draws": int(trace.posterior.sizes["draw"]),
+        "chains": int(trace.posterior.sizes["chain"]),
+    }
+    if "warm_start" in trace.posterior.attrs:
+        diagnostics["warm_start"] = trace.posterior.attrs["warm_start"]
+    if method in APPROXIMATE_METHODS:
+        if "final_loss" in trace.posterior.attrs:
+            diagnostics["final_loss"] = round(
+                float(trace.posterior.attrs["final_loss"]), 2
+            )
+        return diagnostics
 
-    # Apply urban/rural shift directly to logit
-    urban_shift = adjustments.get("urbanShift", 0)
-    rural_shift = adjustments.get("ruralShift", 0)
-    if urban_shift != 0 or rural_shift != 0:
-        density = df["population_density"].fillna(0).values
-        for i in range(len(mu)):
-            if density[i] > 3000 and urban_shift != 0:
-                mu[i] += urban_shift * 0.04
-            elif density[i] < 500 and rural_shift != 0:
-                mu[i] += rural_shift * 0.04
-
-    # Convert logit to probability
-    dem_two_party_share = expit(mu)
-
-    # Turnout adjustment
-    turnout_change = adjustments.get("turnoutChange", 0)
-    turnout_multiplier = 1 + turnout_change / 100
-
-    # Compute credible intervals from full posterior
-    beta_samples = posterior["beta"].values  # (chains, draws, n_covariates)
-    intercept_samples = posterior["intercept"].values  # (chains, draws)
-    county_samples = posterior["county_effect"].values  # (chains, draws, n_counties)
-    region_samples = posterior["region_effect"].values  # (chains, draws, n_regions)
-
-    # Flatten chains
-    n_chains, n_draws = intercept_samples.shape
-    intercept_flat = intercept_samples.reshape(-1)
-    beta_flat = beta_samples.reshape(-1, beta_samples.shape[-1])
-    county_flat = county_samples.reshape(-1, county_samples.shape[-1])
-    region_flat = region_samples.reshape(-1, region_samples.shape[-1])
-
-    # Apply same adjustments to beta samples
-    beta_flat_adj = beta_flat.copy()
-    for param_name, cov_idx in ADJUSTMENT_MAP.items():
-        shift = adjustments.get(param_name, 0)
-        if shift != 0:
-            beta_flat_adj[:, cov_idx] += shift * 0.04
-
-    # Sample-level predictions (subsample for speed)
-    n_samples = min(500, len(intercept_flat))
-    sample_idx = np.linspace(0, len(intercept_flat) - 1, n_samples, dtype=int)
-
-    mu_samples = np.zeros((n_samples, len(df)))
-    for si, idx in enumerate(sample_idx):
-        mu_samples[si] = (
-            intercept_flat[idx]
-            + X @ beta_flat_adj[idx]
-            + county_flat[idx][county_idx]
-            + region_flat[idx][region_idx]
-        )
-        # Apply urban/rural shifts
-        if urban_shift != 0 or rural_shift != 0:
-            density = df["population_density"].fillna(0).values
-            for wi in range(len(df)):
-                if density[wi] > 3000 and urban_shift != 0:
-                    mu_samples[si, wi] += urban_shift * 0.04
-                elif density[wi] < 500 and rural_shift != 0:
-                    mu_samples[si, wi] += rural_shift * 0.04
-
-    share_samples = expit(mu_samples)
-    lower_share = np.percentile(share_samples, 5, axis=0)
-    upper_share = np.percentile(share_samples, 95, axis=0)
-
-    # Build predictions
-    predictions: dict[str, dict[str, float]] = {}
-    for i, row in df.iterrows():
-        ward_id = str(row["ward_id"])
-        total = int(row["total_votes"])
-        two_party = int(row["dem_votes"]) + int(row["rep_votes"])
-
-        projected_total = max(1, round(total * turnout_multiplier))
-        projected_two_party = max(1, round(two_party * turnout_multiplier))
-        other = projected_total - projected_two_party
-
-        share = float(dem_two_party_share[i] if isinstance(i, int) else dem_two_party_share[df.index.get_loc(i)])
-        idx_pos = df.index.get_loc(i) if not isinstance(i, int) else i
-        low = float(lower_share[idx_pos])
-        high = float(upper_share[idx_pos])
-
-        dem_votes = round(projected_two_party * share)
-        rep_votes = projected_two_party - dem_votes
-
-        predictions[ward_id] = {
-            "demPct": round(dem_votes / projected_total * 100, 2) if projected_total > 0 else 50.0,
-            "repPct": round(rep_votes / projected_total * 100, 2) if projected_total > 0 else 50.0,
-            "margin": round((dem_votes - rep_votes) / projected_total * 100, 2) if projected_total > 0 else 0.0,
-            "demVotes": dem_votes,
-            "repVotes": rep_votes,
-            "totalVotes": projected_total,
-            "confidence": 0.8,
-            "lowerMargin": round((2 * low - 1) * 100, 2),
-            "upperMargin": round((2 * high - 1) * 100, 2),
-        }
-
-    return predictions
-
-
-def get_diagnostics(trace: az.InferenceData) -> dict[str, float]:
-    """Extract key MCMC diagnostics from a fitted trace."""
     summary = az.summary(trace, var_names=["intercept", "beta", "sigma_obs"])
-    return {
-        "r_hat_max": round(float(summary["r_hat"].max()), 3),
-        "ess_min": round(float(summary["ess_bulk"].min()), 0),
-        "draws": int(trace.posterior.dims["draw"]),
-        "chains": int(trace.posterior.dims["chain"]),
-    }
+    diagnostics["r_hat_max"] = round(float(summary["r_hat"].max()), 3)
+    diagnostics["ess_min"] = round(float(summary["ess_bulk"].min()), 0)
+    return diagnostics
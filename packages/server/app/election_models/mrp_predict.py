@@ -0,0 +1,557 @@
+"""MRP prediction from flattened posterior draws.
+
+Kept free of PyMC and ArviZ so the API process can predict from the
+memory-mapped posterior sidecars written by ``mrp_storage`` without
+importing the fitting stack; ``mrp_model`` re-exports these names.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
+
+from app.election_models.districting import DistrictAssignment, build_assignment
+from app.election_models.mrp_storage import MrpPosterior
+
+# Demographic covariate columns expected in ward_df
+COVARIATES = [
+    "log_population_density",
+    "college_degree_pct",
+    "median_household_income_scaled",
+    "white_pct",
+]
+
+# Post-hoc adjustment mapping: param name -> covariate index in COVARIATES
+ADJUSTMENT_MAP = {
+    "collegeShift": 1,   # college_degree_pct
+    "incomeShift": 2,    # median_household_income_scaled
+}
+
+
+def prepare_ward_df(ward_df: pd.DataFrame) -> pd.DataFrame:
+    """Prepare a ward DataFrame with the required derived columns.
+
+    Expects columns: ward_id, dem_votes, rep_votes, total_votes,
+    county, population_density, college_degree_pct,
+    median_household_income, white_pct, region
+    """
+    df = ward_df.copy()
+
+    # Log population density (add 1 to avoid log(0))
+    df["log_population_density"] = np.log1p(
+        df["population_density"].fillna(0).clip(lower=0)
+    )
+
+    # Scale income to [0, 1] range
+    income = df["median_household_income"].fillna(0)
+    income_max = income.max()
+    if income_max > 0:
+        df["median_household_income_scaled"] = income / income_max
+    else:
+        df["median_household_income_scaled"] = 0.0
+
+    # Fill NaNs in covariates
+    for col in ["college_degree_pct", "white_pct"]:
+        df[col] = df[col].fillna(df[col].median())
+
+    # Compute two-party dem share
+    two_party = df["dem_votes"] + df["rep_votes"]
+    df["dem_two_party_share"] = np.where(
+        two_party > 0,
+        df["dem_votes"] / two_party,
+        0.5,
+    )
+
+    # Clamp to avoid logit(-inf)/logit(inf)
+    df["dem_two_party_share"] = df["dem_two_party_share"].clip(0.01, 0.99)
+
+    # Encode county and region as integer codes
+    df["county_code"] = pd.Categorical(df["county"]).codes
+    df["region_code"] = pd.Categorical(df["region"]).codes
+
+    return df
+
+
+def category_levels(ward_df: pd.DataFrame) -> dict[str, list[str]]:
+    """County and region names in the order of prepare_ward_df's codes.
+
+    Saved with the posterior at fit time so predictions index the random
+    effects by name rather than by the prediction data's own categories.
+    """
+    return {
+        "county": [str(c) for c in pd.Categorical(ward_df["county"]).categories],
+        "region": [str(r) for r in pd.Categorical(ward_df["region"]).categories],
+    }
+
+
+@dataclass
+class MrpDesign:
+    """Prediction inputs for one election as plain arrays.
+
+    Everything predict_mrp needs that does not depend on the adjustments:
+    the covariate matrix in COVARIATES order, geography, density and the
+    observed votes, all aligned to ward_ids.
+    """
+
+    ward_ids: list[str]
+    X: NDArray[np.float64]  # (n_wards, len(COVARIATES))
+    counties: NDArray[np.object_]
+    regions: NDArray[np.object_]
+    county_codes: NDArray[np.integer]  # codes in this data's own categories
+    region_codes: NDArray[np.integer]
+    density: NDArray[np.float64]
+    dem_votes: NDArray[np.int64]
+    rep_votes: NDArray[np.int64]
+    total_votes: NDArray[np.int64]
+    data_version: int = 0
+    # Summary groupings: level name ("county", "congressional", ...) → label
+    groups: dict[str, NDArray[np.object_]] = field(default_factory=dict)
+    _level_codes: dict[tuple, NDArray[np.integer]] = field(
+        default_factory=dict, repr=False
+    )
+    _assignments: dict[str, DistrictAssignment] = field(
+        default_factory=dict, repr=False
+    )
+
+    @property
+    def n_wards(self) -> int:
+        return len(self.ward_ids)
+
+    def codes_for(
+        self, name: str, levels: list[str] | None
+    ) -> NDArray[np.integer]:
+        """Per-ward codes of "county" or "region" into the fit's levels.
+
+        Without level names the data's own category codes are returned.
+        A level unseen at fit time gets code -1. Memoized per level list.
+        """
+        if levels is None:
+            return self.county_codes if name == "county" else self.region_codes
+        key = (name, *levels)
+        codes = self._level_codes.get(key)
+        if codes is None:
+            values = self.counties if name == "county" else self.regions
+            codes = pd.Index(levels).get_indexer(values)
+            self._level_codes[key] = codes
+        return codes
+
+    def assignment(self, level: str) -> DistrictAssignment:
+        """Sparse ward → group matrix for a summary level (memoized)."""
+        assignment = self._assignments.get(level)
+        if assignment is None:
+            assignment = build_assignment(self.groups[level].tolist())
+            self._assignments[level] = assignment
+        return assignment
+
+
+# Ward DataFrame columns used as summary groupings when present
+GROUP_COLUMNS = {
+    "county": "county",
+    "congressional": "congressional_district",
+    "state_senate": "state_senate_district",
+    "assembly": "assembly_district",
+}
+
+
+def build_design(ward_df: pd.DataFrame, data_version: int = 0) -> MrpDesign:
+    """Compute the prediction design for a raw ward DataFrame."""
+    df = prepare_ward_df(ward_df)
+    groups = {
+        level: df[col].values.astype(object)
+        for level, col in GROUP_COLUMNS.items()
+        if col in df
+    }
+    return MrpDesign(
+        ward_ids=df["ward_id"].astype(str).tolist(),
+        X=df[COVARIATES].values.astype(np.float64),
+        counties=df["county"].values.astype(object),
+        regions=df["region"].values.astype(object),
+        county_codes=df["county_code"].values,
+        region_codes=df["region_code"].values,
+        density=df["population_density"].fillna(0).values.astype(np.float64),
+        dem_votes=df["dem_votes"].values.astype(np.int64),
+        rep_votes=df["rep_votes"].values.astype(np.int64),
+        total_votes=df["total_votes"].values.astype(np.int64),
+        data_version=data_version,
+        groups=groups,
+    )
+
+
+def _gather_effects(
+    effects: NDArray[np.floating],
+    design: MrpDesign,
+    name: str,
+    levels: list[str] | None,
+) -> tuple[NDArray[np.floating], NDArray[np.integer]]:
+    """Random-effect columns and per-ward codes into them.
+
+    With the fit's level names, wards are matched by name; a level unseen at
+    fit time gets code -1, which selects an appended zero column. Without
+    them the codes from the prediction data are used as before.
+    """
+    codes = design.codes_for(name, levels)
+    if levels is None:
+        return effects, codes
+    padded = np.concatenate([effects, np.zeros((len(effects), 1))], axis=1)
+    return padded, codes
+
+
+def _adjustment_terms(
+    design: MrpDesign, scenarios: list[dict[str, Any]]
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Adjustments of each scenario as arrays.
+
+    Returns the coefficient shift (n_scenarios, len(COVARIATES)), the
+    per-ward logit shift (n_scenarios, n_wards) and the turnout multiplier
+    (n_scenarios,).
+    """
+    def param(name: str) -> NDArray[np.float64]:
+        return np.array([s.get(name, 0) for s in scenarios], dtype=np.float64)
+
+    # Covariate shifts move the coefficient: 1 point = +0.04 on the logit scale
+    beta_shift = np.zeros((len(scenarios), len(COVARIATES)))
+    for param_name, cov_idx in ADJUSTMENT_MAP.items():
+        beta_shift[:, cov_idx] += param(param_name) * 0.04
+
+    # Urban/rural shifts move the logit of the matching wards directly
+    density = design.density
+    ward_shift = (
+        np.outer(param("urbanShift") * 0.04, density > 3000)
+        + np.outer(param("ruralShift") * 0.04, density < 500)
+    )
+    return beta_shift, ward_shift, 1 + param("turnoutChange") / 100
+
+
+def _project_votes(
+    design: MrpDesign,
+    dem_two_party_share: NDArray[np.float64],
+    turnout_multiplier: float | NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Projected (dem, rep, total) votes; broadcasts over leading axes."""
+    two_party = design.dem_votes + design.rep_votes
+    projected_total = np.maximum(
+        1, np.round(design.total_votes * turnout_multiplier)
+    )
+    projected_two_party = np.maximum(1, np.round(two_party * turnout_multiplier))
+    dem_votes = np.round(projected_two_party * dem_two_party_share)
+    return dem_votes, projected_two_party - dem_votes, projected_total
+
+
+def _mean_logit(
+    posterior: MrpPosterior, design: MrpDesign
+) -> NDArray[np.float64]:
+    """Unadjusted linear predictor per ward from posterior means."""
+    county_effect, county_idx = _gather_effects(
+        posterior.county_effect, design, "county", posterior.counties
+    )
+    region_effect, region_idx = _gather_effects(
+        posterior.region_effect, design, "region", posterior.regions
+    )
+    return (
+        posterior.intercept.mean()
+        + design.X @ posterior.beta.mean(axis=0)
+        + county_effect.mean(axis=0)[county_idx]
+        + region_effect.mean(axis=0)[region_idx]
+    )
+
+
+def _sample_shares(
+    posterior: MrpPosterior,
+    design: MrpDesign,
+    beta_shift: NDArray[np.float64],
+    ward_shift: NDArray[np.float64],
+    n_samples: int,
+) -> NDArray[np.float64]:
+    """Two-party Democratic share per (draw, ward) for an even subsample.
+
+    Uses n_samples evenly spaced posterior draws (all if fewer), evaluated
+    for every ward at once as a (samples × wards) linear predictor.
+    """
+    from scipy.special import expit  # type: ignore[import-untyped]
+
+    county_effect, county_idx = _gather_effects(
+        posterior.county_effect, design, "county", posterior.counties
+    )
+    region_effect, region_idx = _gather_effects(
+        posterior.region_effect, design, "region", posterior.regions
+    )
+    n_draws = posterior.n_samples
+    sample_idx = np.linspace(0, n_draws - 1, min(n_samples, n_draws), dtype=int)
+    mu_samples = (
+        posterior.intercept[sample_idx, None]
+        + (posterior.beta[sample_idx] + beta_shift) @ design.X.T
+        + county_effect[sample_idx][:, county_idx]
+        + region_effect[sample_idx][:, region_idx]
+        + ward_shift
+    )
+    return expit(mu_samples)
+
+
+def predict_mrp(
+    posterior: MrpPosterior,
+    data: MrpDesign | pd.DataFrame,
+    adjustments: dict[str, Any] | None = None,
+    n_samples: int = 500,
+) -> dict[str, dict[str, float]]:
+    """Generate ward-level predictions from a fitted MRP trace.
+
+    The point estimate uses posterior means; the 5–95% interval comes from
+    an evenly spaced subsample of n_samples draws, evaluated for all wards
+    at once as a (samples × wards) linear predictor.
+
+    Args:
+        posterior: Flattened posterior draws (see mrp_storage.load_posterior).
+        data: Cached design (build_design) or ward data with the same
+            structure as the training data.
+        adjustments: Optional post-hoc adjustments:
+            - turnoutChange: uniform % change in turnout
+            - collegeShift: shift on college covariate (points)
+            - urbanShift: shift applied to wards with density > 3000
+            - ruralShift: shift applied to wards with density < 500
+            - incomeShift: shift on income covariate (points)
+        n_samples: Posterior draws used for the interval.
+
+    Returns:
+        Dict keyed by ward_id with prediction fields.
+    """
+    from scipy.special import expit  # type: ignore[import-untyped]
+
+    adjustments = adjustments or {}
+    design = data if isinstance(data, MrpDesign) else build_design(data)
+
+    beta_shift, ward_shift, turnout = _adjustment_terms(design, [adjustments])
+    beta_shift, ward_shift = beta_shift[0], ward_shift[0]
+
+    # Point estimate from posterior means
+    mu = _mean_logit(posterior, design) + design.X @ beta_shift + ward_shift
+    dem_two_party_share = expit(mu)
+
+    # Credible interval: (samples × wards) predictor in one matmul + gathers
+    share_samples = _sample_shares(
+        posterior, design, beta_shift, ward_shift, n_samples
+    )
+    lower_share, upper_share = np.percentile(share_samples, [5, 95], axis=0)
+
+    # Turnout adjustment and vote counts for every ward at once
+    dem_votes, rep_votes, projected_total = _project_votes(
+        design, dem_two_party_share, turnout[0]
+    )
+
+    columns = zip(
+        design.ward_ids,
+        np.round(dem_votes / projected_total * 100, 2).tolist(),
+        np.round(rep_votes / projected_total * 100, 2).tolist(),
+        np.round((dem_votes - rep_votes) / projected_total * 100, 2).tolist(),
+        dem_votes.astype(np.int64).tolist(),
+        rep_votes.astype(np.int64).tolist(),
+        projected_total.astype(np.int64).tolist(),
+        np.round((2 * lower_share - 1) * 100, 2).tolist(),
+        np.round((2 * upper_share - 1) * 100, 2).tolist(),
+        strict=True,
+    )
+    return {
+        ward_id: {
+            "demPct": dem_pct,
+            "repPct": rep_pct,
+            "margin": margin,
+            "demVotes": dem,
+            "repVotes": rep,
+            "totalVotes": total_votes,
+            "confidence": 0.8,
+            "lowerMargin": lower,
+            "upperMargin": upper,
+        }
+        for (
+            ward_id, dem_pct, rep_pct, margin, dem, rep, total_votes, lower, upper
+        ) in columns
+    }
+
+
+def _vote_summary(
+    dem: NDArray[np.float64], rep: NDArray[np.float64], total: NDArray[np.float64]
+) -> list[dict[str, float | int]]:
+    """Summary rows for matching 1-D arrays of projected votes."""
+    margin = np.round((dem - rep) / np.maximum(total, 1) * 100, 2)
+    return [
+        {"demVotes": d, "repVotes": r, "totalVotes": t, "margin": m}
+        for d, r, t, m in zip(
+            dem.round().astype(np.int64).tolist(),
+            rep.round().astype(np.int64).tolist(),
+            total.round().astype(np.int64).tolist(),
+            margin.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def predict_scenarios(
+    posterior: MrpPosterior,
+    data: MrpDesign | pd.DataFrame,
+    scenarios: list[dict[str, Any]],
+    levels: Sequence[str] = (),
+    include_wards: bool = False,
+) -> list[dict[str, Any]]:
+    """Evaluate many adjustment sets against one posterior in one pass.
+
+    Each scenario is projected like predict_mrp's point estimate: the
+    posterior-mean linear predictor is computed once and every scenario's
+    shifts are added as a (scenarios × wards) matrix. Wards are summed into
+    each summary level (a key of design.groups) with one sparse product
+    for all scenarios. Credible intervals are not computed.
+
+    Returns one dict per scenario with the adjustments, statewide totals,
+    a list of group totals per level, and, if include_wards, per-ward
+    projections keyed by ward_id.
+    """
+    from scipy.special import expit  # type: ignore[import-untyped]
+
+    design = data if isinstance(data, MrpDesign) else build_design(data)
+    beta_shift, ward_shift, turnout = _adjustment_terms(design, scenarios)
+    share = expit(
+        _mean_logit(posterior, design) + beta_shift @ design.X.T + ward_shift
+    )
+    dem, rep, total = _project_votes(design, share, turnout[:, None])
+
+    statewide = _vote_summary(dem.sum(axis=1), rep.sum(axis=1), total.sum(axis=1))
+    grouped: dict[str, tuple[list[str], list[list[dict]]]] = {}
+    for level in levels:
+        assignment = design.assignment(level)
+        # (n_groups, n_scenarios) per vote type, then one row list per scenario
+        g_dem, g_rep, g_total = (
+            np.asarray(assignment.matrix @ arr.T) for arr in (dem, rep, total)
+        )
+        grouped[level] = (
+            assignment.district_ids,
+            [
+                _vote_summary(g_dem[:, i], g_rep[:, i], g_total[:, i])
+                for i in range(len(scenarios))
+            ],
+        )
+
+    results = []
+    for i, adjustments in enumerate(scenarios):
+        result: dict[str, Any] = {
+            "adjustments": adjustments,
+            "statewide": statewide[i],
+            "groups": {
+                level: [
+                    {"id": group_id, **row}
+                    for group_id, row in zip(ids, rows[i], strict=True)
+                ]
+                for level, (ids, rows) in grouped.items()
+            },
+        }
+        if include_wards:
+            result["wards"] = {
+                ward_id: row
+                for ward_id, row in zip(
+                    design.ward_ids,
+                    _vote_summary(dem[i], rep[i], total[i]),
+                    strict=True,
+                )
+            }
+        results.append(result)
+    return results
+
+
+# Quantiles reported for every outcome distribution
+OUTCOME_QUANTILES = (5, 25, 50, 75, 95)
+
+
+def _distribution(values: NDArray[np.float64], axis: int = -1) -> dict[str, Any]:
+    """Mean and OUTCOME_QUANTILES of draws along an axis, rounded."""
+    quantiles = np.percentile(values, OUTCOME_QUANTILES, axis=axis)
+    return {
+        "mean": np.round(values.mean(axis=axis), 2).tolist(),
+        **{
+            f"p{q}": np.round(row, 2).tolist()
+            for q, row in zip(OUTCOME_QUANTILES, quantiles, strict=True)
+        },
+    }
+
+
+def predict_outcomes(
+    posterior: MrpPosterior,
+    data: MrpDesign | pd.DataFrame,
+    adjustments: dict[str, Any] | None = None,
+    levels: Sequence[str] = (),
+    n_samples: int = 500,
+) -> dict[str, Any]:
+    """Outcome distributions and win probabilities from posterior draws.
+
+    Ward two-party shares are sampled for n_samples evenly spaced draws (as
+    in predict_mrp's interval) and projected into votes like predict_mrp;
+    the projected two-party and total votes do not vary by draw. Votes are
+    summed per draw statewide and, for each summary level, into groups with
+    one sparse × dense product, so every statistic is over the joint
+    posterior rather than independent ward intervals.
+
+    Returns the statewide margin distribution (with every draw), the
+    statewide win probability, and per level each group's win probability
+    and margin distribution plus a histogram of groups won by Democrats.
+    Margins are D − R as % of projected total votes.
+    """
+    adjustments = adjustments or {}
+    design = data if isinstance(data, MrpDesign) else build_design(data)
+
+    beta_shift, ward_shift, turnout = _adjustment_terms(design, [adjustments])
+    share_samples = _sample_shares(
+        posterior, design, beta_shift[0], ward_shift[0], n_samples
+    )
+    # (samples, wards) Democratic votes; two-party and total are per ward
+    dem_draws, rep_draws, total = _project_votes(
+        design, share_samples, turnout[0]
+    )
+    two_party = dem_draws[0] + rep_draws[0]
+
+    state_dem = dem_draws.sum(axis=1)
+    state_two_party = two_party.sum()
+    state_margin = (2 * state_dem - state_two_party) / max(total.sum(), 1) * 100
+
+    result: dict[str, Any] = {
+        "sampleCount": len(share_samples),
+        "statewide": {
+            "demWinProb": round(float((2 * state_dem > state_two_party).mean()), 4),
+            "margin": _distribution(state_margin),
+            "marginDraws": np.round(state_margin, 2).tolist(),
+        },
+        "levels": {},
+    }
+
+    for level in levels:
+        assignment = design.assignment(level)
+        # (n_groups, n_samples) Democratic votes per group and draw
+        group_dem = np.asarray(assignment.matrix @ dem_draws.T)
+        group_two_party = assignment.matrix @ two_party
+        group_total = np.maximum(assignment.matrix @ total, 1)
+        dem_wins = 2 * group_dem > group_two_party[:, None]
+        margin = (
+            (2 * group_dem - group_two_party[:, None])
+            / group_total[:, None] * 100
+        )
+        win_prob = dem_wins.mean(axis=1)
+        margin_dist = _distribution(margin, axis=1)
+
+        seats = dem_wins.sum(axis=0)
+        histogram = np.bincount(seats, minlength=assignment.n_districts + 1)
+        result["levels"][level] = {
+            "groups": [
+                {
+                    "id": group_id,
+                    "demWinProb": round(float(win_prob[i]), 4),
+                    "margin": {k: v[i] for k, v in margin_dist.items()},
+                }
+                for i, group_id in enumerate(assignment.district_ids)
+            ],
+            "demSeats": {
+                **_distribution(seats.astype(np.float64)),
+                # Probability of exactly k Democratic wins, k = 0..n_groups
+                "histogram": np.round(histogram / len(seats), 4).tolist(),
+            },
+        }
+    return result
@@ -0,0 +1,160 @@
+"""Live progress of an MRP fit, reported from PyMC callbacks.
+
+SamplingProgress is passed to ``fit_mrp_model`` and called by PyMC after
+every NUTS draw (or every ADVI iteration). It keeps per-chain counters and
+hands a snapshot to a report function at most every ``interval`` seconds,
+so a Celery task can publish it as task state without flooding the result
+backend. It also times setup (model compilation), tuning and sampling for
+the trace metadata.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ChainProgress:
+    draws: int = 0  # tuning + sampling draws completed
+    divergences: int = 0  # after tuning
+    step_size: float | None = None
+    started: float | None = None  # first draw
+
+
+class SamplingProgress:
+    """Per-chain draw counts, divergences, step size, throughput and ETA."""
+
+    def __init__(
+        self,
+        chains: int,
+        tune: int,
+        draws: int,
+        report: Callable[[dict[str, Any]], None],
+        interval: float = 2.0,
+    ) -> None:
+        self.report = report
+        self.interval = interval
+        self.configure(chains, tune, draws)
+        self.started = time.monotonic()
+        self.first_draw: float | None = None  # after model compilation
+        self.sampling_started: float | None = None
+        self.finished: float | None = None
+        self._last_report = 0.0
+        self._extra: dict[str, Any] = {}
+
+    def configure(self, chains: int, tune: int, draws: int) -> None:
+        """Set the expected work (fit_mrp_model does this for ADVI)."""
+        self.tune = tune
+        self.draws = draws
+        self.chains = [ChainProgress() for _ in range(chains)]
+
+    @property
+    def total_draws(self) -> int:
+        return len(self.chains) * (self.tune + self.draws)
+
+    def __call__(self, trace: Any = None, draw: Any = None) -> None:
+        """PyMC ``pm.sample(callback=...)`` hook."""
+        chain = self._start(draw.chain)
+        chain.draws = draw.draw_idx + 1
+        stats = draw.stats
+        if isinstance(stats, list | tuple):
+            stats = stats[0]  # one dict per step method; NUTS is the only one
+        if not draw.tuning:
+            if self.sampling_started is None:
+                self.sampling_started = time.monotonic()
+            if stats.get("diverging"):
+                chain.divergences += 1
+        if stats.get("step_size") is not None:
+            chain.step_size = float(stats["step_size"])
+        if draw.is_last and all(
+            c.draws >= self.tune + self.draws for c in self.chains
+        ):
+            self.finished = time.monotonic()
+        self._maybe_report(force=draw.is_last)
+
+    def advi(self, approx: Any, losses: Any, i: int) -> None:
+        """PyMC ``pm.fit(callbacks=[...])`` hook; ADVI runs as one chain."""
+        self._start(0).draws = i + 1
+        if self.sampling_started is None:
+            self.sampling_started = self.first_draw
+        self._extra = {"loss": float(losses[-1]) if len(losses) else None}
+        self._maybe_report()
+
+    def finish(self) -> None:
+        """Mark the fit done and report it, even if the last callback was
+        throttled or ADVI stopped early on convergence."""
+        if self.finished is None:
+            self.finished = time.monotonic()
+        self._maybe_report(force=True)
+
+    def _start(self, index: int) -> ChainProgress:
+        now = time.monotonic()
+        if self.first_draw is None:
+            self.first_draw = now
+        chain = self.chains[index]
+        if chain.started is None:
+            chain.started = now
+        return chain
+
+    def _maybe_report(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        self.report({**self.snapshot(), **self._extra})
+
+    def snapshot(self) -> dict[str, Any]:
+        now = self.finished or time.monotonic()
+        per_chain = self.tune + self.draws
+        done = sum(c.draws for c in self.chains)
+        elapsed = now - self.started
+        drawing = now - self.first_draw if self.first_draw is not None else 0.0
+        rate = done / drawing if drawing > 0 else 0.0
+        eta: float | None
+        if self.finished is not None:
+            phase, percent, eta = "done", 100.0, 0.0
+        else:
+            phase = "tuning" if self.sampling_started is None else "sampling"
+            percent = round(100 * done / max(self.total_draws, 1), 1)
+            eta = round((self.total_draws - done) / rate, 0) if rate > 0 else None
+        return {
+            "phase": phase,
+            "draws_done": done,
+            "draws_total": self.total_draws,
+            "percent": percent,
+            "draws_per_sec": round(rate, 1),
+            "elapsed_seconds": round(elapsed, 1),
+            "eta_seconds": eta,
+            "divergences": sum(c.divergences for c in self.chains),
+            "chains": [
+                {
+                    "chain": i,
+                    "draw": c.draws,
+                    "of": per_chain,
+                    "tuning": c.draws < self.tune,
+                    "divergences": c.divergences,
+                    "step_size": (
+                        round(c.step_size, 4) if c.step_size is not None else None
+                    ),
+                    "draws_per_sec": (
+                        round(c.draws / max(now - c.started, 1e-9), 1)
+                        if c.started is not None else 0.0
+                    ),
+                }
+                for i, c in enumerate(self.chains)
+            ],
+        }
+
+    def timings(self) -> dict[str, float]:
+        """Wall time of setup (model compilation), tuning and sampling."""
+        end = self.finished or time.monotonic()
+        first = self.first_draw or end
+        sampling = self.sampling_started or end
+        return {
+            "setup_seconds": round(first - self.started, 1),
+            "tune_seconds": round(sampling - first, 1),
+            "sample_seconds": round(end - sampling, 1),
+        }
@@ -1,12 +1,24 @@
-"""Save and load MRP model traces as NetCDF4 files."""
+"""Save and load MRP model traces as NetCDF4 files.
+
+Next to each trace a compact posterior sidecar is written: the prediction
+draws (intercept, beta, county and region effects) as one float32 ``.npy``
+matrix plus a JSON header with column ranges and the county/region names
+behind the effect indices. Predictions memory-map the sidecar, so API
+workers share its pages and never import ArviZ or read NetCDF.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from numpy.typing import NDArray
 
 if TYPE_CHECKING:
     import arviz as az
@@ -16,6 +28,66 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class MrpPosterior:
+    """Posterior draws used for prediction, chains flattened into samples.
+
+    Arrays are (n_samples,) for the intercept and (n_samples, k) for beta,
+    county_effect and region_effect.
+    """
+
+    intercept: NDArray[np.float64]
+    beta: NDArray[np.float64]
+    county_effect: NDArray[np.float64]
+    region_effect: NDArray[np.float64]
+    metadata: dict = field(default_factory=dict)
+    counties: list[str] | None = None  # names behind county_effect columns
+    regions: list[str] | None = None
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.intercept)
+
+
+# "nuts" is exact MCMC; the others are variational approximations that fit
+# in well under a minute and are marked as approximate in the metadata.
+FitMethod = Literal["nuts", "advi", "pathfinder"]
+APPROXIMATE_METHODS = ("advi", "pathfinder")
+
+# Metadata keys reported as a model's diagnostics
+DIAGNOSTIC_KEYS = (
+    "fit_method", "approximate", "r_hat_max", "ess_min", "draws", "chains",
+    "final_loss", "comparison", "warm_start", "timings",
+)
+
+# Sidecar columns, in order
+POSTERIOR_VARIABLES = ("intercept", "beta", "county_effect", "region_effect")
+POSTERIOR_FORMAT_VERSION = 1
+
+
+def posterior_from_trace(
+    trace: az.InferenceData,
+    metadata: dict | None = None,
+    categories: dict[str, list[str]] | None = None,
+) -> MrpPosterior:
+    """Flatten the prediction variables of a fitted trace."""
+    posterior = trace.posterior
+
+    def flat(name: str) -> NDArray[np.float64]:
+        values = np.asarray(posterior[name].values, dtype=np.float64)
+        return values.reshape(values.shape[0] * values.shape[1], -1)
+
+    return MrpPosterior(
+        intercept=flat("intercept")[:, 0],
+        beta=flat("beta"),
+        county_effect=flat("county_effect"),
+        region_effect=flat("region_effect"),
+        metadata=metadata or {},
+        counties=(categories or {}).get("county"),
+        regions=(categories or {}).get("region"),
+    )
+
+
 def _traces_dir() -> Path:
     """Get the traces directory, creating it if needed."""
     path = Path(settings.mrp_traces_dir)
@@ -37,14 +109,23 @@ def metadata_filename(
     return f"{race_type}_{year}_v{ward_vintage}.json"
 
 
+def posterior_filenames(
+    race_type: str, year: int, ward_vintage: int
+) -> tuple[str, str]:
+    """Canonical posterior sidecar filenames (draws, header)."""
+    stem = f"{race_type}_{year}_v{ward_vintage}.posterior"
+    return f"{stem}.npy", f"{stem}.json"
+
+
 def save_trace(
     trace: az.InferenceData,
     race_type: str,
     year: int,
     ward_vintage: int,
     metadata: dict | None = None,
+    categories: dict[str, list[str]] | None = None,
 ) -> Path:
-    """Save a fitted MRP trace to disk.
+    """Save a fitted MRP trace to disk, plus its posterior sidecar.
 
     Args:
         trace: ArviZ InferenceData from PyMC sampling.
@@ -52,6 +133,8 @@ def save_trace(
         year: Election year.
         ward_vintage: Ward boundary vintage (e.g., 2020).
         metadata: Optional metadata dict (diagnostics, fit params, etc.).
+        categories: County/region names in effect-index order
+            (mrp_predict.category_levels of the training data).
 
     Returns:
         Path to the saved trace file.
@@ -60,10 +143,6 @@ def save_trace(
     fname = trace_filename(race_type, year, ward_vintage)
     filepath = traces_dir / fname
 
-    trace.to_netcdf(str(filepath))  # type: ignore[union-attr]
-    logger.info("Saved MRP trace to %s", filepath)
-
-    # Save metadata sidecar
     meta = metadata or {}
     meta.update({
         "race_type": race_type,
@@ -71,12 +150,156 @@ def save_trace(
         "ward_vintage": ward_vintage,
         "fitted_at": datetime.now(timezone.utc).isoformat(),
     })
+    posterior = posterior_from_trace(trace, meta, categories)
+
+    # Compare against the fit being replaced when it used another method
+    previous = _load_posterior_sidecar(race_type, year, ward_vintage)
+    if previous is not None:
+        comparison = compare_fits(posterior, previous)
+        if comparison is not None:
+            meta["comparison"] = comparison
+            logger.info("MRP fit comparison: %s", comparison)
+
+    # Write to a temp file and rename so a warm start never opens a
+    # half-written trace
+    tmp_path = filepath.with_suffix(".nc.tmp")
+    trace.to_netcdf(str(tmp_path))  # type: ignore[union-attr]
+    os.replace(tmp_path, filepath)
+    logger.info("Saved MRP trace to %s", filepath)
+
+    # Save metadata sidecar
     meta_path = traces_dir / metadata_filename(race_type, year, ward_vintage)
-    meta_path.write_text(json.dumps(meta, indent=2))
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    tmp_meta.write_text(json.dumps(meta, indent=2))
+    os.replace(tmp_meta, meta_path)
 
+    save_posterior(posterior, race_type, year, ward_vintage)
     return filepath
 
 
+def compare_fits(new: MrpPosterior, previous: MrpPosterior) -> dict | None:
+    """Compare an approximate fit with an exact (NUTS) fit of the same data.
+
+    Returns None unless exactly one of the two is approximate and their
+    parameters line up. The NUTS fit is the reference: for each variable,
+    the largest difference in posterior means in units of the reference
+    standard deviation, and the median ratio of approximate to reference
+    standard deviations (mean-field ADVI typically comes in below 1).
+    """
+    methods = [p.metadata.get("fit_method", "nuts") for p in (new, previous)]
+    if (methods[0] == "nuts") == (methods[1] == "nuts"):
+        return None
+    exact, approx = (new, previous) if methods[0] == "nuts" else (previous, new)
+    if (exact.counties, exact.regions) != (approx.counties, approx.regions):
+        return None
+
+    variables = {}
+    for name in POSTERIOR_VARIABLES:
+        ref = np.asarray(getattr(exact, name), dtype=np.float64)
+        alt = np.asarray(getattr(approx, name), dtype=np.float64)
+        if ref.shape[1:] != alt.shape[1:]:
+            return None
+        ref_sd = np.maximum(ref.std(axis=0), 1e-9)
+        mean_diff = np.abs(alt.mean(axis=0) - ref.mean(axis=0)) / ref_sd
+        variables[name] = {
+            "max_std_mean_diff": round(float(mean_diff.max()), 3),
+            "sd_ratio_median": round(float(np.median(alt.std(axis=0) / ref_sd)), 3),
+        }
+    return {
+        "approximate_method": approx.metadata.get("fit_method"),
+        "approximate_fitted_at": approx.metadata.get("fitted_at"),
+        "exact_fitted_at": exact.metadata.get("fitted_at"),
+        "max_std_mean_diff": max(v["max_std_mean_diff"] for v in variables.values()),
+        "variables": variables,
+    }
+
+
+def save_posterior(
+    posterior: MrpPosterior, race_type: str, year: int, ward_vintage: int
+) -> Path:
+    """Write the float32 posterior sidecar for an election.
+
+    Both files are written to temporary names and renamed into place, so a
+    worker memory-mapping the previous sidecar keeps a consistent view.
+    """
+    traces_dir = _traces_dir()
+    npy_name, header_name = posterior_filenames(race_type, year, ward_vintage)
+
+    blocks = [
+        posterior.intercept.reshape(-1, 1),
+        posterior.beta,
+        posterior.county_effect,
+        posterior.region_effect,
+    ]
+    columns = {}
+    start = 0
+    for name, block in zip(POSTERIOR_VARIABLES, blocks, strict=True):
+        columns[name] = [start, start + block.shape[1]]
+        start += block.shape[1]
+    header = {
+        "format_version": POSTERIOR_FORMAT_VERSION,
+        "n_samples": posterior.n_samples,
+        "columns": columns,
+        "counties": posterior.counties,
+        "regions": posterior.regions,
+    }
+
+    npy_path = traces_dir / npy_name
+    tmp_npy = npy_path.with_suffix(".npy.tmp")
+    with open(tmp_npy, "wb") as f:
+        np.save(f, np.concatenate(blocks, axis=1).astype(np.float32))
+    os.replace(tmp_npy, npy_path)
+
+    header_path = traces_dir / header_name
+    tmp_header = header_path.with_suffix(".json.tmp")
+    tmp_header.write_text(json.dumps(header))
+    os.replace(tmp_header, header_path)
+
+    logger.info("Saved MRP posterior sidecar to %s", npy_path)
+    return npy_path
+
+
+def _load_posterior_sidecar(
+    race_type: str, year: int, ward_vintage: int
+) -> MrpPosterior | None:
+    """Memory-map the posterior sidecar, or None if it is missing or stale."""
+    traces_dir = _traces_dir()
+    npy_name, header_name = posterior_filenames(race_type, year, ward_vintage)
+    npy_path = traces_dir / npy_name
+    header_path = traces_dir / header_name
+    if not npy_path.exists() or not header_path.exists():
+        return None
+    trace_file = traces_dir / trace_filename(race_type, year, ward_vintage)
+    if (
+        trace_file.exists()
+        and npy_path.stat().st_mtime < trace_file.stat().st_mtime
+    ):
+        return None  # trace refit without a new sidecar
+
+    header = json.loads(header_path.read_text())
+    if header.get("format_version") != POSTERIOR_FORMAT_VERSION:
+        return None
+    draws = np.load(npy_path, mmap_mode="r")
+    blocks = {
+        name: draws[:, start:stop]
+        for name, (start, stop) in header["columns"].items()
+    }
+    return MrpPosterior(
+        intercept=blocks["intercept"][:, 0],
+        beta=blocks["beta"],
+        county_effect=blocks["county_effect"],
+        region_effect=blocks["region_effect"],
+        metadata=load_metadata(race_type, year, ward_vintage) or {},
+        counties=header.get("counties"),
+        regions=header.get("regions"),
+    )
+
+
+def trace_path(race_type: str, year: int, ward_vintage: int) -> Path:
+    """Path of the trace file for an election (which may not exist)."""
+    return _traces_dir() / trace_filename(race_type, year, ward_vintage)
+
+
 def load_trace(
     race_type: str, year: int, ward_vintage: int
 ) -> az.InferenceData | None:
@@ -99,6 +322,31 @@ def load_trace(
     return trace
 
 
+def load_posterior(
+    race_type: str, year: int, ward_vintage: int
+) -> MrpPosterior | None:
+    """Load the prediction draws and metadata of a fitted model.
+
+    Memory-maps the posterior sidecar when present. Traces fitted before
+    sidecars existed are read from NetCDF once (needs ArviZ) and a sidecar
+    is written for next time. Returns None if no trace exists.
+    """
+    posterior = _load_posterior_sidecar(race_type, year, ward_vintage)
+    if posterior is not None:
+        return posterior
+
+    trace = load_trace(race_type, year, ward_vintage)
+    if trace is None:
+        return None
+    metadata = load_metadata(race_type, year, ward_vintage) or {}
+    posterior = posterior_from_trace(trace, metadata)
+    try:
+        save_posterior(posterior, race_type, year, ward_vintage)
+    except OSError:
+        logger.warning("Could not write MRP posterior sidecar", exc_info=True)
+    return posterior
+
+
 def load_metadata(
     race_type: str, year: int, ward_vintage: int
 ) -> dict | None:
@@ -112,6 +360,42 @@ def load_metadata(
     return json.loads(meta_path.read_text())
 
 
+def fitted_method(
+    race_type: str, year: int, ward_vintage: int
+) -> str | None:
+    """Fit method of the stored model for an election, None if unfitted."""
+    if not trace_path(race_type, year, ward_vintage).exists():
+        return None
+    meta = load_metadata(race_type, year, ward_vintage) or {}
+    return meta.get("fit_method", "nuts")
+
+
+def resolve_warm_start(
+    race_type: str, year: int, source: str
+) -> dict | None:
+    """Find the stored fit a new fit should warm-start from.
+
+    source is "same" (this election's current fit, e.g. after a data
+    correction), "previous" (the latest fitted earlier year of the same race)
+    or an explicit "{race_type}_{year}". Returns the list_fitted_models
+    entry, or None if there is no such fit.
+    """
+    fitted = list_fitted_models()
+    if source == "same":
+        matches = [
+            m for m in fitted if (m["race_type"], m["year"]) == (race_type, year)
+        ]
+    elif source == "previous":
+        matches = [
+            m for m in fitted if m["race_type"] == race_type and m["year"] < year
+        ]
+    else:
+        matches = [m for m in fitted if f"{m['race_type']}_{m['year']}" == source]
+    if not matches:
+        return None
+    return max(matches, key=lambda m: (m["year"], m["ward_vintage"]))
+
+
 def list_fitted_models() -> list[dict]:
     """Scan the traces directory and return metadata for all fitted models."""
     traces_dir = _traces_dir()
@@ -149,7 +433,7 @@ def list_fitted_models() -> list[dict]:
             "fitted_at": meta.get("fitted_at"),
             "diagnostics": {
                 k: meta.get(k)
-                for k in ["r_hat_max", "ess_min", "draws", "chains"]
+                for k in DIAGNOSTIC_KEYS
                 if k in meta
             },
             "filename": nc_file.name,
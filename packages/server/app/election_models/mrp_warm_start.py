@@ -0,0 +1,97 @@
+"""Warm-start inputs for an MRP fit, taken from an earlier fit's posterior.
+
+Kept free of PyMC so the draw alignment, prior construction and mass
+matrix statistics can be used (and tested) without the fitting stack;
+``mrp_model`` builds the NUTS step from them and re-exports WarmStart.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    import arviz as az
+
+
+@dataclass
+class WarmStart:
+    """An earlier fit to start NUTS from.
+
+    categories are that fit's county/region names in effect-index order, so
+    random effects are matched by name when the sets of levels differ.
+    """
+
+    trace: az.InferenceData
+    categories: dict[str, list[str]] | None = None
+    label: str = ""
+    informative_priors: bool = False
+    prior_scale: float = 2.0  # widen the earlier posterior sd by this factor
+
+
+def _flat_draws(warm_start: WarmStart, name: str) -> NDArray[np.float64]:
+    """(chain × draw, ...) draws of a variable from the warm-start trace."""
+    values = np.asarray(warm_start.trace.posterior[name].values, dtype=np.float64)
+    return values.reshape(values.shape[0] * values.shape[1], *values.shape[2:])
+
+
+def previous_draws(
+    warm_start: WarmStart, name: str, levels: dict[str, list[str]]
+) -> NDArray[np.float64]:
+    """Flattened draws of a variable from the warm-start trace.
+
+    Random effects are reindexed to the current fit's levels by name; levels
+    the earlier fit did not have are NaN columns.
+    """
+    draws = _flat_draws(warm_start, name)
+    level = {"county_effect": "county", "region_effect": "region"}.get(name)
+    if level is None:
+        return draws
+    previous = (warm_start.categories or {}).get(level)
+    if previous is None:
+        return draws  # positional; the caller checks the shape
+    index = {name: i for i, name in enumerate(previous)}
+    aligned = np.full((len(draws), len(levels[level])), np.nan)
+    for j, lvl in enumerate(levels[level]):
+        if lvl in index:
+            aligned[:, j] = draws[:, index[lvl]]
+    return aligned
+
+
+def warm_start_priors(warm_start: WarmStart) -> dict[str, Any]:
+    """Priors centred on the warm-start posterior, widened by prior_scale.
+
+    Returns build_mrp_model overrides: (mean, sd) for the intercept and
+    beta, and a HalfNormal scale for each sigma_*. Scales are at least 0.05.
+    """
+    scale = warm_start.prior_scale
+    priors: dict[str, Any] = {}
+    for name in ("intercept", "beta"):
+        flat = _flat_draws(warm_start, name)
+        mean, sd = flat.mean(axis=0), flat.std(axis=0)
+        priors[name] = (mean, np.maximum(sd * scale, 0.05))
+    for name in ("sigma_county", "sigma_region", "sigma_obs"):
+        mean = float(_flat_draws(warm_start, name).mean())
+        priors[name] = max(mean * scale, 0.05)
+    return priors
+
+
+def draw_moments(
+    flat: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Per-column mean and variance of (draws, k) samples for the mass matrix.
+
+    NaN columns (levels new to this fit) get mean 0 and the median variance
+    of the other columns; with no usable column the variance is 1.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        mean = np.nanmean(flat, axis=0)
+        var = np.nanvar(flat, axis=0)
+    usable = np.isfinite(var) & (var > 0)
+    fallback = np.median(var[usable]) if usable.any() else 1.0
+    return np.nan_to_num(mean), np.where(usable, var, fallback)
@@ -0,0 +1,109 @@
+"""Vectorized per-ward linear trend fitting.
+
+Fits an ordinary least-squares line of margin on election year for every
+ward at once. Missing elections are masked out, so each ward uses only the
+years it actually has results for, and p-values come from the exact
+Student t distribution with n − 2 degrees of freedom.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import stats  # type: ignore[import-untyped]
+
+
+@dataclass
+class TrendFit:
+    slope: NDArray[np.float64]
+    intercept: NDArray[np.float64]
+    r_squared: NDArray[np.float64]
+    std_err: NDArray[np.float64]
+    p_value: NDArray[np.float64]
+    n: NDArray[np.int64]
+    start_year: NDArray[np.int64]
+    end_year: NDArray[np.int64]
+    valid: NDArray[np.bool_]  # enough points and year variance to fit
+
+
+def fit_linear_trends(
+    years: NDArray[np.int64],
+    values: NDArray[np.float64],
+    min_points: int = 3,
+) -> TrendFit:
+    """Fit y = a + b·year for every row of a (n_wards, n_years) matrix.
+
+    Args:
+        years: (n_years,) ascending election years matching the columns.
+        values: (n_wards, n_years) margins, NaN where a ward has no result.
+        min_points: Minimum elections required for a fit.
+
+    Returns:
+        TrendFit with one entry per ward. Rows that cannot be fitted have
+        ``valid`` False and NaN statistics. A zero residual variance yields
+        a p-value of 1.0, matching the previous loop implementation.
+    """
+    mask = ~np.isnan(values)
+    w = mask.astype(np.float64)
+    x = np.broadcast_to(np.asarray(years, dtype=np.float64), values.shape)
+    y = np.where(mask, values, 0.0)
+
+    n = w.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = (w * x).sum(axis=1) / n
+        y_mean = y.sum(axis=1) / n
+        dx = np.where(mask, x - x_mean[:, None], 0.0)
+        dy = np.where(mask, y - y_mean[:, None], 0.0)
+        ss_xx = (dx * dx).sum(axis=1)
+        ss_yy = (dy * dy).sum(axis=1)
+        ss_xy = (dx * dy).sum(axis=1)
+
+        valid = (n >= min_points) & (ss_xx > 0)
+        slope = np.where(valid, ss_xy / ss_xx, np.nan)
+        intercept = y_mean - slope * x_mean
+        r_squared = np.where(
+            valid, np.where(ss_yy > 0, ss_xy**2 / (ss_xx * ss_yy), 0.0), np.nan
+        )
+
+        sse = np.clip(ss_yy - slope * ss_xy, 0.0, None)
+        df = n - 2
+        mse = np.where(df > 0, sse / df, 0.0)
+        std_err = np.where(valid, np.sqrt(mse / ss_xx), np.nan)
+        t_stat = slope / std_err
+
+    p_value = np.where(
+        valid & (std_err > 0),
+        2 * stats.t.sf(np.abs(np.nan_to_num(t_stat)), np.maximum(df, 1)),
+        np.where(valid, 1.0, np.nan),
+    )
+
+    # Columns are in ascending year order: first/last present column
+    year_arr = np.asarray(years, dtype=np.int64)
+    first = mask.argmax(axis=1)
+    last = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+
+    return TrendFit(
+        slope=slope,
+        intercept=intercept,
+        r_squared=r_squared,
+        std_err=std_err,
+        p_value=p_value,
+        n=n.astype(np.int64),
+        start_year=year_arr[first],
+        end_year=year_arr[last],
+        valid=valid,
+    )
+
+
+def classify_trends(
+    slope: NDArray[np.float64], p_value: NDArray[np.float64], alpha: float = 0.05
+) -> NDArray[np.str_]:
+    """'more_democratic' / 'more_republican' when significant, else 'inconclusive'."""
+    significant = p_value < alpha
+    return np.where(
+        significant & (slope > 0),
+        "more_democratic",
+        np.where(significant & (slope < 0), "more_republican", "inconclusive"),
+    )
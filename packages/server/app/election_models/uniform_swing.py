@@ -8,7 +8,7 @@ def uniform_swing(
     dem_votes: NDArray[np.int64],
     rep_votes: NDArray[np.int64],
     total_votes: NDArray[np.int64],
-    swing_points: float,
+    swing_points: float | NDArray[np.float64],
     turnout_change: float = 0.0,
 ) -> dict[str, NDArray[np.float64]]:
     """Apply uniform swing to ward-level election data.
@@ -18,6 +18,8 @@ def uniform_swing(
         rep_votes: Array of Republican vote counts per ward.
         total_votes: Array of total vote counts per ward.
         swing_points: Swing in percentage points (positive = D, negative = R).
+            An array broadcasts against the vote arrays, so a (n_swings, 1)
+            grid against (n_wards,) votes projects every swing at once.
         turnout_change: Percentage change in turnout (e.g., 5.0 = +5%).
 
     Returns:
@@ -0,0 +1,83 @@
+"""Per-ward election series that run across ward vintages.
+
+Each vintage's matrix only holds the elections reported on its own ward
+boundaries, so a 2024 result lives in a different vintage than the 2016
+one. The per-ward models (trends, changepoints, forecasts) need a ward's
+whole history, so ``stack_vintages`` lines the vintages up by ward_id into
+one ward × year matrix per race type.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class VintageMatrix(Protocol):
+    """Ward × election arrays for one vintage (WardMatrix or the ETL's
+    VoteMatrix)."""
+
+    vintage: int
+    ward_ids: NDArray[np.str_]
+    elections: list[tuple[int, str]]
+    total: NDArray[np.int64]
+    present: NDArray[np.bool_]
+
+    def margin(self) -> NDArray[np.float64]: ...
+
+
+@dataclass
+class WardSeries:
+    """One race type's results per ward_id across every vintage.
+
+    margin and total are (n_wards, n_years), NaN where a ward has no
+    result; vintage is the latest vintage each ward has a result in (0 if
+    none).
+    """
+
+    race_type: str
+    ward_ids: NDArray[np.str_]
+    years: NDArray[np.int64]
+    margin: NDArray[np.float64]
+    total: NDArray[np.float64]
+    vintage: NDArray[np.int64]
+
+
+def stack_vintages(matrices: Sequence[VintageMatrix], race_type: str) -> WardSeries:
+    """Merge a race type's columns from every vintage by ward_id.
+
+    Rows are the sorted union of the vintages' ward_ids. An election
+    reported in more than one vintage takes the latest vintage's result,
+    matching how the API picks the vintage of an election.
+    """
+    matrices = sorted(matrices, key=lambda m: m.vintage)
+    ward_ids = np.unique(
+        np.concatenate([m.ward_ids for m in matrices] or [np.array([], dtype=str)])
+    ).astype(str)
+    years = np.array(
+        sorted({y for m in matrices for y, race in m.elections if race == race_type}),
+        dtype=np.int64,
+    )
+
+    shape = (len(ward_ids), len(years))
+    margin = np.full(shape, np.nan)
+    total = np.full(shape, np.nan)
+    vintage = np.zeros(len(ward_ids), dtype=np.int64)
+    for m in matrices:
+        cols = [j for j, (_, race) in enumerate(m.elections) if race == race_type]
+        if not cols:
+            continue
+        rows = np.searchsorted(ward_ids, m.ward_ids)
+        targets = np.searchsorted(years, [m.elections[j][0] for j in cols])
+        m_margin = m.margin()
+        for j, col in zip(cols, targets.tolist(), strict=True):
+            have = m.present[:, j]
+            margin[rows[have], col] = m_margin[have, j]
+            total[rows[have], col] = m.total[have, j]
+            vintage[rows[have]] = m.vintage
+
+    return WardSeries(race_type, ward_ids, years, margin, total, vintage)
@@ -1,20 +1,31 @@
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.core.rate_limit import RateLimitMiddleware
 from app.api.v1.router import api_router
+from app.services.compute_pool import (
+    ComputeBusyError,
+    ComputeTimeoutError,
+    shutdown_compute_pool,
+)
+from app.services.mrp_cache import warm_posterior_cache
+from app.services.similarity_service import warm_similarity_index
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Startup
+    await warm_similarity_index()
+    await warm_posterior_cache()
     yield
     # Shutdown
+    shutdown_compute_pool()
 
 
 app = FastAPI(
@@ -47,6 +58,23 @@ app.add_middleware(
 app.include_router(api_router)
 
 
+# Saturated compute pool (MRP predictions): fail fast instead of queueing
+@app.exception_handler(ComputeBusyError)
+async def compute_busy_handler(request: Request, exc: ComputeBusyError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy with other model runs. Try again shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(ComputeTimeoutError)
+async def compute_timeout_handler(
+    request: Request, exc: ComputeTimeoutError
+) -> JSONResponse:
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
 @app.get("/health")
 async def health_check() -> dict:
     return {"status": "healthy", "version": settings.app_version}
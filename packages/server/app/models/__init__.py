@@ -9,6 +9,10 @@ from app.models.ward_note import WardNote
 from app.models.voter_registration import VoterRegistration
 from app.models.live_result import LiveResult, LiveElection
 from app.models.analytics_event import AnalyticsEvent
+from app.models.ward_cluster import WardCluster, WardClusterProfile
+from app.models.election_version import ElectionVersion
+from app.models.ward_changepoint import WardChangepoint
+from app.models.ward_forecast import WardForecast
 
 __all__ = [
     "Ward",
@@ -23,4 +27,9 @@ __all__ = [
     "LiveResult",
     "LiveElection",
     "AnalyticsEvent",
+    "WardCluster",
+    "WardClusterProfile",
+    "ElectionVersion",
+    "WardChangepoint",
+    "WardForecast",
 ]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -10,8 +10,9 @@ class ElectionAggregation(Base):
     __tablename__ = "election_aggregations"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    aggregation_level: Mapped[str] = mapped_column(String(20), nullable=False)  # 'county' or 'statewide'
-    aggregation_key: Mapped[str] = mapped_column(String(100), nullable=False)  # county name or 'WI'
+    aggregation_level: Mapped[str] = mapped_column(String(20), nullable=False)  # 'municipality', 'county', 'congressional', 'state_senate', 'assembly', 'statewide'
+    aggregation_key: Mapped[str] = mapped_column(String(400), nullable=False)  # 'Municipality, County', county name, district id or 'WI'
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)  # boundaries change by vintage
     election_year: Mapped[int] = mapped_column(Integer, nullable=False)
     race_type: Mapped[str] = mapped_column(String(50), nullable=False)
     dem_votes: Mapped[int] = mapped_column(Integer, default=0)
@@ -27,6 +28,11 @@ class ElectionAggregation(Base):
     __table_args__ = (
         UniqueConstraint(
             "aggregation_level", "aggregation_key", "election_year", "race_type",
+            "ward_vintage",
             name="uq_aggregation_unique",
         ),
+        Index(
+            "idx_aggregations_election",
+            "aggregation_level", "election_year", "race_type",
+        ),
     )
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, String, UniqueConstraint, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ElectionVersion(Base):
+    """Fingerprint of one election's ward results as of the last aggregation run.
+
+    compute_aggregations.py compares these against election_results to find
+    the elections a load added, changed or removed, recomputes only what they
+    affect, and stamps them with a new data_version. The highest data_version
+    is the version of the derived data that in-memory caches key on.
+    """
+
+    __tablename__ = "election_versions"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)
+    election_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    race_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    checksum: Mapped[str] = mapped_column(String(32), nullable=False)  # md5 of ward rows
+    data_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "ward_vintage", "election_year", "race_type",
+            name="uq_election_version",
+        ),
+        Index("idx_election_versions_version", "data_version"),
+    )
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class WardChangepoint(Base):
+    """Sharpest one-cycle realignment in a ward's margin series for a race type.
+
+    One row per (ward_id, race_type), from the most recent vintage with
+    enough history, like ward_trends.
+    """
+
+    __tablename__ = "ward_changepoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ward_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    race_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    break_year: Mapped[int] = mapped_column(Integer, nullable=False)  # first year of new level
+    magnitude: Mapped[float] = mapped_column(Float, nullable=False)  # margin pts, + = toward D
+    slope: Mapped[float | None] = mapped_column(Float)  # within-segment pts/year
+    f_stat: Mapped[float | None] = mapped_column(Float)
+    p_value: Mapped[float | None] = mapped_column(Float)  # Bonferroni-adjusted
+    elections_analyzed: Mapped[int | None] = mapped_column(Integer)
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint("ward_id", "race_type", name="uq_ward_changepoint"),
+        Index("idx_ward_changepoints_race", "race_type", "break_year"),
+    )
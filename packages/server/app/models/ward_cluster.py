@@ -0,0 +1,45 @@
+from datetime import datetime
+
+from sqlalchemy import Float, Index, Integer, JSON, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class WardCluster(Base):
+    """Electoral archetype assignment for a ward (one row per ward + vintage)."""
+
+    __tablename__ = "ward_clusters"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ward_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)
+    cluster_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    distance: Mapped[float | None] = mapped_column(Float)  # to cluster centroid
+    method: Mapped[str] = mapped_column(String(20), nullable=False)  # kmeans / hierarchical
+    computed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint("ward_id", "ward_vintage", name="uq_ward_cluster_vintage"),
+        Index("idx_ward_clusters_vintage", "ward_vintage"),
+    )
+
+
+class WardClusterProfile(Base):
+    """Summary of one archetype: size, label and mean margin/turnout trajectory."""
+
+    __tablename__ = "ward_cluster_profiles"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)
+    cluster_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    ward_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    label: Mapped[str] = mapped_column(String(50), nullable=False)
+    latest_margin: Mapped[float | None] = mapped_column(Float)
+    margin_shift: Mapped[float | None] = mapped_column(Float)
+    profile: Mapped[dict] = mapped_column(JSON, nullable=False)  # elections + trajectories
+    computed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint("ward_vintage", "cluster_id", name="uq_cluster_profile"),
+    )
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class WardForecast(Base):
+    """Next-election margin and turnout projection for a ward and race type.
+
+    One row per (ward_id, race_type), from the most recent vintage with
+    enough history, like ward_trends.
+    """
+
+    __tablename__ = "ward_forecasts"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ward_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    race_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    target_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    margin: Mapped[float] = mapped_column(Float, nullable=False)  # D − R, points
+    margin_lower: Mapped[float] = mapped_column(Float, nullable=False)
+    margin_upper: Mapped[float] = mapped_column(Float, nullable=False)
+    turnout: Mapped[int | None] = mapped_column(Integer)  # total votes
+    turnout_lower: Mapped[int | None] = mapped_column(Integer)
+    turnout_upper: Mapped[int | None] = mapped_column(Integer)
+    interval_level: Mapped[float] = mapped_column(Float, nullable=False)  # e.g. 0.8
+    elections_analyzed: Mapped[int | None] = mapped_column(Integer)
+    ward_vintage: Mapped[int] = mapped_column(Integer, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    __table_args__ = (
+        UniqueConstraint("ward_id", "race_type", name="uq_ward_forecast"),
+        Index("idx_ward_forecasts_race", "race_type"),
+    )
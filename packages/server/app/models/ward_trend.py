@@ -15,6 +15,7 @@ class WardTrend(Base):
     trend_direction: Mapped[str | None] = mapped_column(String(20))
     trend_slope: Mapped[float | None] = mapped_column(Float)
     trend_r_squared: Mapped[float | None] = mapped_column(Float)
+    trend_std_err: Mapped[float | None] = mapped_column(Float)
     trend_p_value: Mapped[float | None] = mapped_column(Float)
     elections_analyzed: Mapped[int | None] = mapped_column(Integer)
     start_year: Mapped[int | None] = mapped_column(Integer)
@@ -1,27 +1,157 @@
-from sqlalchemy import select, func
+import json
+from typing import Literal, get_args
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import ColumnElement, case, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.election_aggregation import ElectionAggregation
-from app.models.election_result import ElectionResult
 from app.models.ward import Ward
+from app.services.ward_matrix import WardMatrix, get_ward_matrix, ward_vintages
+
+# Levels of the rollup cube built by data/scripts/compute_aggregations.py.
+# Municipality keys are "Municipality, County"; the statewide key is "WI".
+AggregationLevel = Literal[
+    "municipality", "county", "congressional", "state_senate", "assembly",
+    "statewide",
+]
+DISTRICT_LEVELS = ("congressional", "state_senate", "assembly")
+
+_TOTAL_COLUMNS = (
+    "dem_votes", "rep_votes", "other_votes", "total_votes",
+    "dem_pct", "rep_pct", "margin", "ward_count",
+)
+
+
+def _totals(row) -> dict:
+    return {name: getattr(row, name) for name in _TOTAL_COLUMNS}
 
 
 class AggregationService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def get_aggregation(
+        self,
+        level: str,
+        key: str,
+        year: int | None = None,
+        race_type: str | None = None,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Every election's totals for one geography of the rollup cube.
+
+        Elections loaded in several ward vintages report the most recent
+        vintage unless one is given. Returns None for an unknown level or a
+        key with no rows.
+        """
+        if level not in get_args(AggregationLevel):
+            return None
+
+        agg = ElectionAggregation
+        stmt = (
+            select(agg)
+            .where(agg.aggregation_level == level, agg.aggregation_key == key)
+            .order_by(agg.election_year, agg.race_type, agg.ward_vintage.desc())
+        )
+        if year is not None:
+            stmt = stmt.where(agg.election_year == year)
+        if race_type is not None:
+            stmt = stmt.where(agg.race_type == race_type)
+        if vintage is not None:
+            stmt = stmt.where(agg.ward_vintage == vintage)
+        # Keep the first (latest-vintage) row of each election
+        latest: dict[tuple[int, str], ElectionAggregation] = {}
+        for row in (await self.db.execute(stmt)).scalars():
+            latest.setdefault((row.election_year, row.race_type), row)
+        rows = list(latest.values())
+        if not rows:
+            return None
+
+        return {
+            "level": level,
+            "key": key,
+            "election_count": len(rows),
+            "elections": [
+                {
+                    "year": r.election_year,
+                    "race_type": r.race_type,
+                    "ward_vintage": r.ward_vintage,
+                    **_totals(r),
+                }
+                for r in rows
+            ],
+        }
+
+    async def get_level(
+        self,
+        level: str,
+        year: int,
+        race_type: str,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Every key at one level for one election, in one indexed lookup.
+
+        Defaults to the most recent vintage the election was aggregated in.
+        Returns None for an unknown level or missing election.
+        """
+        if level not in get_args(AggregationLevel):
+            return None
+
+        agg = ElectionAggregation
+        filters = (
+            agg.aggregation_level == level,
+            agg.election_year == year,
+            agg.race_type == race_type,
+        )
+        if vintage is None:
+            latest = select(func.max(agg.ward_vintage)).where(*filters)
+            vintage = (await self.db.execute(latest)).scalar()
+            if vintage is None:
+                return None
+
+        stmt = (
+            select(agg.aggregation_key, *(getattr(agg, c) for c in _TOTAL_COLUMNS))
+            .where(*filters, agg.ward_vintage == vintage)
+            .order_by(agg.aggregation_key)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+
+        return {
+            "level": level,
+            "ward_vintage": vintage,
+            "year": year,
+            "race_type": race_type,
+            "key_count": len(rows),
+            "results": [{"key": r.aggregation_key, **_totals(r)} for r in rows],
+        }
+
+    async def _get_one(
+        self, level: str, key: str, year: int, race_type: str
+    ) -> ElectionAggregation | None:
+        """Latest-vintage cube row for one geography and election."""
+        agg = ElectionAggregation
+        stmt = (
+            select(agg)
+            .where(
+                agg.aggregation_level == level,
+                agg.aggregation_key == key,
+                agg.election_year == year,
+                agg.race_type == race_type,
+            )
+            .order_by(agg.ward_vintage.desc())
+            .limit(1)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+
     async def get_county(
         self, county: str, year: int, race_type: str
     ) -> dict | None:
         """Get pre-computed county aggregation."""
-        stmt = select(ElectionAggregation).where(
-            ElectionAggregation.aggregation_level == "county",
-            ElectionAggregation.aggregation_key == county,
-            ElectionAggregation.election_year == year,
-            ElectionAggregation.race_type == race_type,
-        )
-        result = await self.db.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = await self._get_one("county", county, year, race_type)
         if not row:
             return None
 
@@ -29,26 +159,12 @@ class AggregationService:
             "county": row.aggregation_key,
             "year": row.election_year,
             "race_type": row.race_type,
-            "dem_votes": row.dem_votes,
-            "rep_votes": row.rep_votes,
-            "other_votes": row.other_votes,
-            "total_votes": row.total_votes,
-            "dem_pct": row.dem_pct,
-            "rep_pct": row.rep_pct,
-            "margin": row.margin,
-            "ward_count": row.ward_count,
+            **_totals(row),
         }
 
     async def get_statewide(self, year: int, race_type: str) -> dict | None:
         """Get pre-computed statewide aggregation."""
-        stmt = select(ElectionAggregation).where(
-            ElectionAggregation.aggregation_level == "statewide",
-            ElectionAggregation.aggregation_key == "WI",
-            ElectionAggregation.election_year == year,
-            ElectionAggregation.race_type == race_type,
-        )
-        result = await self.db.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = await self._get_one("statewide", "WI", year, race_type)
         if not row:
             return None
 
@@ -56,14 +172,7 @@ class AggregationService:
             "level": "statewide",
             "year": row.election_year,
             "race_type": row.race_type,
-            "dem_votes": row.dem_votes,
-            "rep_votes": row.rep_votes,
-            "other_votes": row.other_votes,
-            "total_votes": row.total_votes,
-            "dem_pct": row.dem_pct,
-            "rep_pct": row.rep_pct,
-            "margin": row.margin,
-            "ward_count": row.ward_count,
+            **_totals(row),
         }
 
     async def get_district(
@@ -73,59 +182,195 @@ class AggregationService:
         year: int,
         race_type: str,
     ) -> dict | None:
-        """Live GROUP BY on election_results JOIN wards for district aggregation."""
-        # Map district_type to the column on the wards table
-        column_map = {
-            "congressional": Ward.congressional_district,
-            "state_senate": Ward.state_senate_district,
-            "assembly": Ward.assembly_district,
-        }
+        """Get pre-computed district aggregation.
 
-        district_col = column_map.get(district_type)
-        if district_col is None:
+        If the election was loaded in several ward vintages, the most recent
+        vintage's boundaries are used.
+        """
+        if district_type not in DISTRICT_LEVELS:
             return None
 
-        stmt = (
-            select(
-                func.sum(ElectionResult.dem_votes).label("dem_votes"),
-                func.sum(ElectionResult.rep_votes).label("rep_votes"),
-                func.sum(ElectionResult.other_votes).label("other_votes"),
-                func.sum(ElectionResult.total_votes).label("total_votes"),
-                func.count(ElectionResult.id).label("ward_count"),
-            )
-            .join(
-                Ward,
-                (Ward.ward_id == ElectionResult.ward_id)
-                & (Ward.ward_vintage == ElectionResult.ward_vintage),
-            )
-            .where(
-                district_col == district_id,
-                ElectionResult.election_year == year,
-                ElectionResult.race_type == race_type,
-            )
-        )
+        row = await self._get_one(district_type, district_id, year, race_type)
+        if not row or not row.total_votes:
+            return None
 
-        result = await self.db.execute(stmt)
-        row = result.one_or_none()
+        return {
+            "district_type": district_type,
+            "district_id": district_id,
+            "ward_vintage": row.ward_vintage,
+            "year": year,
+            "race_type": race_type,
+            **_totals(row),
+        }
 
-        if not row or row.total_votes is None or row.total_votes == 0:
+    async def get_all_districts(
+        self,
+        district_type: str,
+        year: int,
+        race_type: str,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Every district of a type for one election (see get_level)."""
+        if district_type not in DISTRICT_LEVELS:
             return None
 
-        dem = row.dem_votes or 0
-        rep = row.rep_votes or 0
-        total = row.total_votes or 0
+        result = await self.get_level(district_type, year, race_type, vintage)
+        if result is None:
+            return None
 
         return {
             "district_type": district_type,
-            "district_id": district_id,
+            "ward_vintage": result["ward_vintage"],
             "year": year,
             "race_type": race_type,
-            "dem_votes": dem,
-            "rep_votes": rep,
-            "other_votes": row.other_votes or 0,
-            "total_votes": total,
-            "dem_pct": (dem / total * 100) if total > 0 else 0,
-            "rep_pct": (rep / total * 100) if total > 0 else 0,
-            "margin": ((dem - rep) / total * 100) if total > 0 else 0,
-            "ward_count": row.ward_count or 0,
+            "district_count": result["key_count"],
+            "districts": [
+                {"district_id": r.pop("key"), **r} for r in result["results"]
+            ],
+        }
+
+    async def get_custom_region(
+        self,
+        ward_ids: list[str] | None = None,
+        geometry: dict | None = None,
+        area_weighted: bool = False,
+        race_type: str | None = None,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Aggregate an ad-hoc region for every election at once.
+
+        The region is a list of ward ids, a GeoJSON Polygon/MultiPolygon, or
+        both (union). Polygon wards come from the GiST index on wards.geom;
+        with area_weighted, a ward only partly inside the polygon contributes
+        votes in proportion to the share of its area inside. Sums are taken
+        from the resident ward matrices.
+
+        Without a vintage, each election is aggregated on the boundaries of
+        the vintage it was reported in (the latest, if several) and carries
+        that ward_vintage. Returns None if there are no wards.
+        """
+        vintages = [vintage] if vintage is not None else await ward_vintages(self.db)
+        matrices = [
+            m for v in vintages if (m := await get_ward_matrix(self.db, v)) is not None
+        ]
+        if not matrices:
+            return None
+
+        source: dict[tuple[int, str], int] = {}
+        for matrix in matrices:
+            for election in matrix.elections:
+                source[election] = matrix.vintage
+
+        matched: set[str] = set()
+        region: set[str] = set()
+        elections: list[dict] = []
+        for matrix in matrices:
+            weights = np.zeros(matrix.n_wards)
+            for ward_id in ward_ids or []:
+                row = matrix.ward_index.get(ward_id)
+                if row is not None:
+                    weights[row] = 1.0
+                    matched.add(ward_id)
+
+            cols = [
+                j for j in matrix.election_columns(race_type)
+                if source[matrix.elections[j]] == matrix.vintage
+            ]
+            if not cols:
+                continue
+            if geometry is not None:
+                for ward_id, share in await self._wards_in_polygon(
+                    geometry, matrix.vintage, area_weighted
+                ):
+                    row = matrix.ward_index.get(ward_id)
+                    if row is not None:
+                        weights[row] = max(weights[row], share)
+
+            rows = np.flatnonzero(weights > 0)
+            region.update(matrix.ward_ids[rows].tolist())
+            elections.extend(
+                {**e, "ward_vintage": matrix.vintage}
+                for e in aggregate_region(matrix, rows, weights[rows], cols)
+            )
+
+        elections.sort(key=lambda e: (e["year"], e["race_type"]))
+        return {
+            "ward_vintage": vintage,
+            "area_weighted": area_weighted,
+            "ward_count": len(region),
+            "ward_ids": sorted(region),
+            "unmatched_ward_ids": [w for w in ward_ids or [] if w not in matched],
+            "elections": elections,
         }
+
+    async def _wards_in_polygon(
+        self, geometry: dict, vintage: int, area_weighted: bool
+    ) -> list[tuple[str, float]]:
+        """(ward_id, share of the ward's area inside) for intersecting wards.
+
+        Shares are 1.0 unless area_weighted. Wards touching the polygon only
+        along an edge get a zero share and are dropped by the caller.
+        """
+        polygon = func.ST_SetSRID(func.ST_GeomFromGeoJSON(json.dumps(geometry)), 4326)
+        share: ColumnElement[float]
+        if area_weighted:
+            share = case(
+                (func.ST_CoveredBy(Ward.geom, polygon), 1.0),
+                else_=func.ST_Area(func.ST_Intersection(Ward.geom, polygon))
+                / func.nullif(func.ST_Area(Ward.geom), 0),
+            )
+        else:
+            share = literal(1.0)
+        stmt = select(Ward.ward_id, share.label("share")).where(
+            Ward.ward_vintage == vintage,
+            func.ST_Intersects(Ward.geom, polygon),
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [(r.ward_id, float(r.share or 0.0)) for r in rows]
+
+
+def aggregate_region(
+    matrix: WardMatrix,
+    rows: NDArray[np.int64],
+    weights: NDArray[np.float64],
+    cols: list[int],
+) -> list[dict]:
+    """Weighted vote totals of matrix rows for each election column.
+
+    One (n_rows,) @ (n_rows, n_cols) product per vote column; elections no
+    selected ward reported are omitted. Weighted totals are rounded to
+    whole votes.
+    """
+    if len(rows) == 0 or not cols:
+        return []
+
+    sub = np.ix_(rows, np.asarray(cols, dtype=np.int64))
+    totals = {
+        name: np.rint(weights @ getattr(matrix, name)[sub]).astype(np.int64)
+        for name in ("dem", "rep", "other", "total")
+    }
+    reporting = (matrix.present[sub] & (weights[:, None] > 0)).sum(axis=0)
+
+    dem, rep, total = totals["dem"], totals["rep"], totals["total"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dem_pct = np.where(total > 0, dem / total * 100, 0.0)
+        rep_pct = np.where(total > 0, rep / total * 100, 0.0)
+
+    elections = []
+    for i, j in enumerate(cols):
+        if reporting[i] == 0:
+            continue
+        year, race = matrix.elections[j]
+        elections.append({
+            "year": year,
+            "race_type": race,
+            "dem_votes": int(dem[i]),
+            "rep_votes": int(rep[i]),
+            "other_votes": int(totals["other"][i]),
+            "total_votes": int(total[i]),
+            "dem_pct": float(dem_pct[i]),
+            "rep_pct": float(rep_pct[i]),
+            "margin": float(dem_pct[i] - rep_pct[i]),
+            "ward_count": int(reporting[i]),
+        })
+    return elections
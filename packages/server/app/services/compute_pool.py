@@ -0,0 +1,132 @@
+"""Executor for CPU-bound model work, kept off the event loop.
+
+MRP predictions parse NetCDF traces and run (draws × wards) NumPy
+arithmetic. Run inline in a request handler, they stall every other request
+on the uvicorn worker, including tiles and map data. ``run_compute`` runs
+such a call on a small dedicated thread pool instead. NumPy and pandas
+release the GIL for the heavy work, and a thread pool shares the
+in-process posterior and design caches where a process pool would need its
+own copies.
+
+Work is bounded in two ways:
+
+- At most ``compute_max_pending`` calls may be running or queued. Beyond that
+  ``ComputeBusyError`` is raised immediately rather than letting a slider
+  drag pile up requests.
+- A request gets ``compute_timeout_seconds`` in total (``compute_deadline``),
+  shared by every call it dispatches, and then ``ComputeTimeoutError``. A
+  thread cannot be interrupted, so a call that has already started runs to
+  completion and holds its slot until then; a call still in the queue is
+  cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_pending = 0
+_lock = threading.Lock()
+
+
+class ComputeBusyError(RuntimeError):
+    """Too many computations are already running or queued."""
+
+
+class ComputeTimeoutError(TimeoutError):
+    """A computation did not finish within the request timeout."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(settings.compute_workers, 1),
+                thread_name_prefix="compute",
+            )
+        return _executor
+
+
+def compute_deadline() -> float:
+    """Monotonic time by which a request starting now must be answered."""
+    return time.monotonic() + settings.compute_timeout_seconds
+
+
+def _release(_: Future[Any] | None) -> None:
+    global _pending
+    with _lock:
+        _pending -= 1
+
+
+async def run_compute[T](
+    fn: Callable[..., T],
+    *args: Any,
+    deadline: float | None = None,
+    **kwargs: Any,
+) -> T:
+    """Run ``fn(*args, **kwargs)`` on the compute pool and await its result.
+
+    deadline (see compute_deadline) bounds the whole request when it makes
+    several calls; without one this call gets ``compute_timeout_seconds``.
+    Raises ComputeBusyError if the queue is full and ComputeTimeoutError
+    once the deadline passes. Exceptions raised by ``fn`` propagate.
+    """
+    global _pending
+    if deadline is None:
+        deadline = compute_deadline()
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        raise ComputeTimeoutError(_timeout_message())
+
+    executor = _get_executor()
+    with _lock:
+        if _pending >= settings.compute_max_pending:
+            raise ComputeBusyError(
+                f"{_pending} computations already running or queued"
+            )
+        _pending += 1
+    try:
+        future = executor.submit(fn, *args, **kwargs)
+    except BaseException:
+        _release(None)
+        raise
+    future.add_done_callback(_release)
+
+    try:
+        # shield: a timeout must not cancel a call that is already running
+        return await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(future)), timeout
+        )
+    except TimeoutError:
+        if not future.cancel():
+            logger.warning(
+                "%s ran past its request deadline; left running in the background",
+                getattr(fn, "__qualname__", fn),
+            )
+        raise ComputeTimeoutError(_timeout_message()) from None
+
+
+def _timeout_message() -> str:
+    return (
+        f"Computation did not finish within {settings.compute_timeout_seconds:.0f}s"
+    )
+
+
+def shutdown_compute_pool() -> None:
+    """Stop the pool, dropping queued work (called at app shutdown)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,102 @@
+"""Bounded in-memory cache of fitted MRP posteriors.
+
+Parsing a multi-MB NetCDF trace dominates MRP prediction latency, and the
+modeler issues many predictions in a row for the same election while a
+slider is dragged. Posteriors are kept as flattened NumPy arrays keyed by
+(race_type, year, ward_vintage, trace file mtime), so refitting an election
+replaces its entry on the next request. The least recently used entry is
+evicted beyond ``mrp_posterior_cache_size``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.election_models.mrp_storage import (
+    MrpPosterior,
+    list_fitted_models,
+    load_posterior,
+    trace_path,
+)
+
+logger = logging.getLogger(__name__)
+
+PosteriorKey = tuple[str, int, int, float]
+
+_cache: OrderedDict[PosteriorKey, MrpPosterior] = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_posterior(
+    race_type: str, year: int, ward_vintage: int
+) -> MrpPosterior | None:
+    """Return the cached posterior for an election, loading it if needed.
+
+    Returns None if no trace has been fitted. Blocking (file I/O on a miss).
+    """
+    path = trace_path(race_type, year, ward_vintage)
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    key = (race_type, year, ward_vintage, mtime)
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    started = time.perf_counter()
+    posterior = load_posterior(race_type, year, ward_vintage)
+    if posterior is None:
+        return None
+
+    with _lock:
+        # Drop entries for older fits of the same election
+        for stale in [k for k in _cache if k[:3] == key[:3] and k != key]:
+            del _cache[stale]
+        _cache[key] = posterior
+        while len(_cache) > max(settings.mrp_posterior_cache_size, 1):
+            _cache.popitem(last=False)
+
+    logger.info(
+        "Loaded MRP posterior for %s %s (vintage %s, %d samples) in %.0f ms",
+        race_type, year, ward_vintage, posterior.n_samples,
+        (time.perf_counter() - started) * 1000,
+    )
+    return posterior
+
+
+def invalidate_posterior_cache() -> None:
+    """Drop every cached posterior."""
+    with _lock:
+        _cache.clear()
+
+
+async def warm_posterior_cache() -> None:
+    """Load every fitted model at startup (up to the cache size)."""
+    try:
+        fitted = list_fitted_models()[: settings.mrp_posterior_cache_size]
+    except OSError:
+        logger.warning("Could not list MRP traces at startup", exc_info=True)
+        return
+    for model in fitted:
+        try:
+            await asyncio.to_thread(
+                get_posterior,
+                model["race_type"], model["year"], model["ward_vintage"],
+            )
+        except ImportError:
+            logger.info("arviz not installed; MRP posterior cache not warmed")
+            return
+        except Exception:
+            logger.warning(
+                "Could not warm MRP posterior for %s %s",
+                model["race_type"], model["year"], exc_info=True,
+            )
@@ -1,25 +1,53 @@
 """MRP model prediction service.
 
 Loads pre-fitted traces and generates predictions with post-hoc adjustments.
+Trace loading, design building and prediction run on the compute pool
+(services/compute_pool.py), so a saturated pool surfaces as
+ComputeBusyError or ComputeTimeoutError.
 """
 
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Literal
 
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.election_models.mrp_predict import (
+    MrpDesign,
+    build_design,
+    predict_mrp,
+    predict_outcomes,
+    predict_scenarios,
+)
 from app.election_models.mrp_storage import (
+    DIAGNOSTIC_KEYS,
+    MrpPosterior,
     list_fitted_models,
-    load_metadata,
-    load_trace,
 )
+from app.services.compute_pool import compute_deadline, run_compute
+from app.services.mrp_cache import get_posterior
+from app.services.ward_matrix import get_data_version
 
 logger = logging.getLogger(__name__)
 
+MrpAdjustment = Literal[
+    "turnoutChange", "collegeShift", "urbanShift", "ruralShift", "incomeShift"
+]
+MrpSummaryLevel = Literal["county", "congressional", "state_senate", "assembly"]
+
+# Upper bound on scenarios per batch (each is a full ward vector)
+MAX_SCENARIOS = 256
+
+# Prediction designs keyed by (year, race_type, ward_vintage). An entry is
+# rebuilt when the data version it was built from is no longer current.
+_design_cache: OrderedDict[tuple[int, str, int], MrpDesign] = OrderedDict()
+_DESIGN_CACHE_SIZE = 16
+
 # Region mapping (matches data/scripts/fit_mrp_models.py)
 MILWAUKEE_METRO = {
     "Milwaukee", "Waukesha", "Ozaukee", "Washington", "Racine", "Kenosha",
@@ -42,6 +70,35 @@ def _county_to_region(county: str) -> str:
     return "rural"
 
 
+def expand_scenarios(
+    scenarios: list[dict[MrpAdjustment, float]],
+    grid: dict[MrpAdjustment, list[float]] | None = None,
+) -> list[dict[MrpAdjustment, float]]:
+    """Combine explicit scenarios with a grid of adjustment values.
+
+    Every point of the grid's cartesian product is applied on top of every
+    listed scenario (or on top of no adjustments if none are listed).
+    """
+    scenarios = scenarios or ([{}] if grid else [])
+    if not grid:
+        return [dict(s) for s in scenarios]
+    names = list(grid)
+    return [
+        {**s, **dict(zip(names, values, strict=True))}
+        for s in scenarios
+        for values in itertools.product(*(grid[n] for n in names))
+    ]
+
+
+def _diagnostics(posterior: MrpPosterior) -> dict:
+    meta = posterior.metadata
+    return {
+        k: meta.get(k)
+        for k in DIAGNOSTIC_KEYS
+        if k in meta
+    }
+
+
 class MrpService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
@@ -60,44 +117,101 @@ class MrpService:
 
         Returns predictions dict plus metadata.
         """
-        ward_vintage = 2022 if year >= 2022 else 2020
+        deadline = compute_deadline()
+        ward_vintage, posterior, design = await self._load_model(
+            year, race_type, deadline
+        )
 
-        # Load pre-fitted trace
-        trace = load_trace(race_type, year, ward_vintage)
-        if trace is None:
-            raise ValueError(
-                f"No fitted MRP model for {race_type} {year} "
-                f"(vintage {ward_vintage}). Run fit_mrp_models.py first."
-            )
+        # Run predictions
+        predictions = await run_compute(
+            predict_mrp, posterior, design, adjustments, deadline=deadline
+        )
 
-        # Load ward data for prediction
-        ward_df = await self._load_ward_data(year, race_type, ward_vintage)
-        if ward_df.empty:
-            raise ValueError(f"No ward data found for {race_type} {year}")
+        return {
+            "model_id": "mrp",
+            "predictions": predictions,
+            "metadata": {
+                "year": year,
+                "race_type": race_type,
+                "ward_vintage": ward_vintage,
+                "ward_count": len(predictions),
+                **_diagnostics(posterior),
+            },
+        }
 
-        # Lazy import — pymc/arviz only available in Docker
-        from app.election_models.mrp_model import predict_mrp
+    async def predict_scenarios(
+        self,
+        year: int,
+        race_type: str,
+        scenarios: list[dict[MrpAdjustment, float]],
+        levels: list[MrpSummaryLevel],
+        include_wards: bool = False,
+    ) -> dict:
+        """Evaluate a batch of adjustment sets against one fitted model.
 
-        # Run predictions
-        predictions = predict_mrp(trace, ward_df, adjustments)
-
-        # Get diagnostics from metadata
-        meta = load_metadata(race_type, year, ward_vintage) or {}
-        diagnostics = {
-            k: meta.get(k)
-            for k in ["r_hat_max", "ess_min", "draws", "chains"]
-            if k in meta
+        Raises ValueError if the model or its ward data is missing.
+        """
+        deadline = compute_deadline()
+        ward_vintage, posterior, design = await self._load_model(
+            year, race_type, deadline
+        )
+        results = await run_compute(
+            predict_scenarios,
+            posterior,
+            design,
+            scenarios,
+            levels=[lvl for lvl in levels if lvl in design.groups],
+            include_wards=include_wards,
+            deadline=deadline,
+        )
+        return {
+            "model_id": "mrp",
+            "scenario_count": len(results),
+            "scenarios": results,
+            "metadata": {
+                "year": year,
+                "race_type": race_type,
+                "ward_vintage": ward_vintage,
+                "ward_count": design.n_wards,
+                **_diagnostics(posterior),
+            },
         }
 
+    async def predict_outcomes(
+        self,
+        year: int,
+        race_type: str,
+        adjustments: dict[MrpAdjustment, float],
+        levels: list[MrpSummaryLevel],
+        n_samples: int = 500,
+    ) -> dict:
+        """Win probabilities and outcome distributions for one adjustment set.
+
+        Raises ValueError if the model or its ward data is missing.
+        """
+        deadline = compute_deadline()
+        ward_vintage, posterior, design = await self._load_model(
+            year, race_type, deadline
+        )
+        outcomes = await run_compute(
+            predict_outcomes,
+            posterior,
+            design,
+            adjustments,
+            levels=[lvl for lvl in levels if lvl in design.groups],
+            n_samples=n_samples,
+            deadline=deadline,
+        )
         return {
             "model_id": "mrp",
-            "predictions": predictions,
+            "adjustments": adjustments,
+            **outcomes,
             "metadata": {
                 "year": year,
                 "race_type": race_type,
                 "ward_vintage": ward_vintage,
-                "ward_count": len(predictions),
-                **diagnostics,
+                "ward_count": design.n_wards,
+                **_diagnostics(posterior),
             },
         }
 
@@ -125,6 +239,58 @@ class MrpService:
 
         return response
 
+    async def _load_model(
+        self, year: int, race_type: str, deadline: float
+    ) -> tuple[int, MrpPosterior, MrpDesign]:
+        """Posterior and design for an election, or ValueError if missing.
+
+        deadline (compute_deadline) is shared with the caller's prediction.
+        """
+        ward_vintage = 2022 if year >= 2022 else 2020
+
+        # Pre-fitted posterior, parsed once and cached in memory
+        posterior = await run_compute(
+            get_posterior, race_type, year, ward_vintage, deadline=deadline
+        )
+        if posterior is None:
+            raise ValueError(
+                f"No fitted MRP model for {race_type} {year} "
+                f"(vintage {ward_vintage}). Run fit_mrp_models.py first."
+            )
+
+        # Covariates, geography and base votes, cached per data version
+        design = await self._get_design(year, race_type, ward_vintage, deadline)
+        if design is None:
+            raise ValueError(f"No ward data found for {race_type} {year}")
+        return ward_vintage, posterior, design
+
+    async def _get_design(
+        self, year: int, race_type: str, ward_vintage: int, deadline: float
+    ) -> MrpDesign | None:
+        """Return the cached prediction design, rebuilding it when stale.
+
+        Returns None if the election has no wards with votes.
+        """
+        key = (year, race_type, ward_vintage)
+        data_version = await get_data_version(self.db)
+        design = _design_cache.get(key)
+        if design is not None and design.data_version == data_version:
+            _design_cache.move_to_end(key)
+            return design
+
+        ward_df = await self._load_ward_data(year, race_type, ward_vintage)
+        if ward_df.empty:
+            _design_cache.pop(key, None)
+            return None
+        design = await run_compute(
+            build_design, ward_df, data_version, deadline=deadline
+        )
+        _design_cache[key] = design
+        _design_cache.move_to_end(key)
+        while len(_design_cache) > _DESIGN_CACHE_SIZE:
+            _design_cache.popitem(last=False)
+        return design
+
     async def _load_ward_data(
         self, year: int, race_type: str, ward_vintage: int
     ) -> pd.DataFrame:
@@ -134,6 +300,9 @@ class MrpService:
                 er.ward_id,
                 w.county,
                 w.municipality,
+                w.congressional_district,
+                w.state_senate_district,
+                w.assembly_district,
                 er.dem_votes,
                 er.rep_votes,
                 er.total_votes,
@@ -157,11 +326,14 @@ class MrpService:
             query,
             {"year": year, "race_type": race_type, "ward_vintage": ward_vintage},
         )
-        rows = result.mappings().all()
+        rows = result.all()
 
         if not rows:
             return pd.DataFrame()
 
-        df = pd.DataFrame([dict(r) for r in rows])
-        df["region"] = df["county"].apply(_county_to_region)
+        df = pd.DataFrame.from_records(rows, columns=list(result.keys()))
+        # Map each distinct county once rather than every ward
+        df["region"] = df["county"].map(
+            {c: _county_to_region(c) for c in df["county"].unique()}
+        )
         return df
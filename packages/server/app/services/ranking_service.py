@@ -0,0 +1,278 @@
+"""Per-metric ward rankings and percentiles.
+
+Keeps one sorted array per (metric, year, race_type, vintage) in memory so
+top-k, bottom-k, rank-of-ward and percentile lookups are a binary search
+instead of a pair of COUNT(*) queries or a client-side sort of the full
+map-data payload. Indexes are rebuilt whenever the underlying ward matrix
+is reloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.voter_registration import VoterRegistration
+from app.models.ward import Ward
+from app.services.ward_matrix import (
+    WardMatrix,
+    election_vintage,
+    get_ward_matrix,
+    previous_election,
+)
+
+logger = logging.getLogger(__name__)
+
+RankingMetric = Literal["margin", "turnout", "swing", "lean", "registration_rate"]
+
+# Metrics that are defined per election and need year + race_type
+ELECTION_METRICS = {"margin", "turnout", "swing"}
+
+
+@dataclass
+class RankingIndex:
+    metric: str
+    year: int | None
+    race_type: str | None
+    matrix: WardMatrix
+    values: NDArray[np.float64]  # per matrix row, NaN if unranked
+    order: NDArray[np.int64]  # matrix rows sorted by ascending value
+    sorted_values: NDArray[np.float64]
+
+    @property
+    def size(self) -> int:
+        return len(self.sorted_values)
+
+    def count_below(self, value: float) -> int:
+        return int(np.searchsorted(self.sorted_values, value, side="left"))
+
+    def rank(self, value: float) -> int:
+        """1-based rank, 1 = highest value; ties share the best rank."""
+        return self.size - int(np.searchsorted(self.sorted_values, value, side="right")) + 1
+
+    def percentile(self, value: float) -> float:
+        """Share of ranked wards with a strictly lower value, in percent."""
+        return round(self.count_below(value) / max(self.size, 1) * 100, 1)
+
+
+_indexes: dict[tuple[str, int | None, str | None, int], RankingIndex] = {}
+
+
+class RankingService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_index(
+        self,
+        metric: str,
+        year: int | None = None,
+        race_type: str | None = None,
+        vintage: int | None = None,
+    ) -> RankingIndex | None:
+        """Return the sorted index for a metric, building it on first use.
+
+        Without a vintage, election metrics use the vintage the election
+        was reported in and other metrics the latest vintage. Returns None
+        if the metric has no data for the given election.
+        """
+        if vintage is None and metric in ELECTION_METRICS and year and race_type:
+            vintage = await election_vintage(self.db, year, race_type)
+            if vintage is None:
+                return None
+        matrix = await get_ward_matrix(self.db, vintage)
+        if matrix is None:
+            return None
+
+        if metric not in ELECTION_METRICS:
+            year = race_type = None
+        key = (metric, year, race_type, matrix.vintage)
+        index = _indexes.get(key)
+        if index is not None and index.matrix is matrix:
+            return index
+
+        values = await self._metric_values(matrix, metric, year, race_type)
+        if values is None:
+            return None
+
+        ranked = np.flatnonzero(~np.isnan(values))
+        order = ranked[np.argsort(values[ranked], kind="stable")]
+        index = RankingIndex(
+            metric=metric,
+            year=year,
+            race_type=race_type,
+            matrix=matrix,
+            values=values,
+            order=order,
+            sorted_values=values[order],
+        )
+        _indexes[key] = index
+        return index
+
+    async def top(
+        self,
+        metric: str,
+        year: int | None = None,
+        race_type: str | None = None,
+        vintage: int | None = None,
+        limit: int = 20,
+        ascending: bool = False,
+    ) -> dict | None:
+        """Top-k (or bottom-k when ascending) wards for a metric."""
+        index = await self.get_index(metric, year, race_type, vintage)
+        if index is None:
+            return None
+
+        rows = index.order[:limit] if ascending else index.order[::-1][:limit]
+        return {
+            **self._header(index),
+            "order": "bottom" if ascending else "top",
+            "wards": [self._ward_entry(index, int(r)) for r in rows],
+        }
+
+    async def ward_rank(
+        self,
+        metric: str,
+        ward_id: str,
+        year: int | None = None,
+        race_type: str | None = None,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Rank and percentile of a single ward. None if the ward is unranked."""
+        index = await self.get_index(metric, year, race_type, vintage)
+        if index is None:
+            return None
+
+        row = index.matrix.ward_index.get(ward_id)
+        if row is None or np.isnan(index.values[row]):
+            return None
+
+        return {**self._header(index), **self._ward_entry(index, row)}
+
+    async def percentiles(
+        self,
+        metric: str,
+        year: int | None = None,
+        race_type: str | None = None,
+        vintage: int | None = None,
+    ) -> dict | None:
+        """Compact {ward_id: percentile} map for coloring the map by rank."""
+        index = await self.get_index(metric, year, race_type, vintage)
+        if index is None:
+            return None
+
+        below = np.searchsorted(
+            index.sorted_values, index.values[index.order], side="left"
+        )
+        pct = np.round(below / max(index.size, 1) * 100, 1)
+        ward_ids = index.matrix.ward_ids[index.order]
+        return {
+            **self._header(index),
+            "data": dict(zip(ward_ids.tolist(), pct.tolist(), strict=True)),
+        }
+
+    def _header(self, index: RankingIndex) -> dict:
+        return {
+            "metric": index.metric,
+            "year": index.year,
+            "race_type": index.race_type,
+            "ward_vintage": index.matrix.vintage,
+            "ward_count": index.size,
+        }
+
+    def _ward_entry(self, index: RankingIndex, row: int) -> dict:
+        matrix = index.matrix
+        value = float(index.values[row])
+        return {
+            "ward_id": str(matrix.ward_ids[row]),
+            "ward_name": matrix.ward_names[row],
+            "municipality": matrix.municipalities[row],
+            "county": matrix.counties[row],
+            "value": round(value, 2),
+            "rank": index.rank(value),
+            "percentile": index.percentile(value),
+        }
+
+    async def _swing(
+        self, matrix: WardMatrix, col: int
+    ) -> NDArray[np.float64] | None:
+        """Margin change since the previous election of the same race.
+
+        The previous election may only exist in an older vintage; its
+        margins are then matched by ward_id (NaN for wards it lacks).
+        """
+        year, race_type = matrix.elections[col]
+        margin = matrix.margin()
+        previous = await previous_election(self.db, year, race_type)
+        if previous is None:
+            return None
+        prev_col = matrix.election_index.get((previous[0], race_type))
+        if prev_col is not None:
+            return margin[:, col] - margin[:, prev_col]
+
+        source = await get_ward_matrix(self.db, previous[1])
+        if source is None:
+            return None
+        prev_col = source.election_index.get((previous[0], race_type))
+        if prev_col is None:
+            return None
+        rows = source.rows_for(matrix.ward_ids)
+        prev_margin = np.where(rows >= 0, source.margin()[rows, prev_col], np.nan)
+        return margin[:, col] - prev_margin
+
+    async def _metric_values(
+        self,
+        matrix: WardMatrix,
+        metric: str,
+        year: int | None,
+        race_type: str | None,
+    ) -> NDArray[np.float64] | None:
+        """Metric value per matrix row (NaN for wards without data)."""
+        if metric in ELECTION_METRICS:
+            col = matrix.election_index.get((year, race_type))  # type: ignore[arg-type]
+            if col is None:
+                return None
+            if metric == "margin":
+                return matrix.margin()[:, col]
+            if metric == "turnout":
+                return np.where(
+                    matrix.present[:, col], matrix.total[:, col].astype(float), np.nan
+                )
+            return await self._swing(matrix, col)
+
+        if metric == "lean":
+            stmt = select(Ward.ward_id, Ward.partisan_lean).where(
+                Ward.ward_vintage == matrix.vintage,
+                Ward.partisan_lean.is_not(None),
+            )
+        elif metric == "registration_rate":
+            latest = (
+                select(func.max(VoterRegistration.snapshot_date))
+                .where(VoterRegistration.ward_vintage == matrix.vintage)
+                .scalar_subquery()
+            )
+            stmt = select(
+                VoterRegistration.ward_id, VoterRegistration.registration_rate
+            ).where(
+                VoterRegistration.ward_vintage == matrix.vintage,
+                VoterRegistration.snapshot_date == latest,
+                VoterRegistration.registration_rate.is_not(None),
+            )
+        else:
+            raise ValueError(f"Unknown ranking metric: {metric}")
+
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return None
+
+        values = np.full(matrix.n_wards, np.nan)
+        for ward_id, value in rows:
+            i = matrix.ward_index.get(ward_id)
+            if i is not None:
+                values[i] = value
+        return values
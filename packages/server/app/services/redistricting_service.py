@@ -0,0 +1,235 @@
+"""What-if district plans evaluated against the resident ward matrix.
+
+A plan is the current ward → district column of the wards table with some
+wards reassigned (a diff), or a full assignment starting from nothing. It
+is turned into a sparse assignment matrix and applied to every election's
+ward votes at once (see app/election_models/districting.py), so moving a
+handful of wards in a map editor costs milliseconds.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.election_models.districting import (
+    DistrictAssignment,
+    build_assignment,
+    district_totals,
+)
+from app.election_models.fairness import evaluate_fairness
+from app.services.ward_matrix import (
+    WardMatrix,
+    election_vintage,
+    get_ward_matrix,
+    history_vintage,
+)
+
+DistrictType = Literal["congressional", "state_senate", "assembly"]
+PlanBase = Literal["current", "empty"]
+
+
+def _finite(value: float, digits: int = 4) -> float | None:
+    return round(value, digits) if np.isfinite(value) else None
+
+
+class RedistrictingService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def load_plan(
+        self,
+        district_type: DistrictType,
+        assignments: dict[str, str | None],
+        vintage: int,
+        base: PlanBase = "current",
+    ) -> tuple[WardMatrix, DistrictAssignment, dict] | None:
+        """Resolve a plan against a vintage's ward matrix.
+
+        Returns the matrix, the assignment, and a summary of the diff
+        (reassigned count, unmatched ward ids, districts touched). Returns
+        None if the vintage has no wards.
+        """
+        matrix = await get_ward_matrix(self.db, vintage)
+        if matrix is None:
+            return None
+
+        current: NDArray[np.object_] = getattr(matrix, district_type)
+        labels = current.copy() if base == "current" else np.full(
+            matrix.n_wards, None, dtype=object
+        )
+        unmatched: list[str] = []
+        touched: set[str] = set()
+        reassigned = 0
+        for ward_id, district in assignments.items():
+            row = matrix.ward_index.get(ward_id)
+            if row is None:
+                unmatched.append(ward_id)
+                continue
+            district = district or None
+            if labels[row] != district:
+                touched.update(d for d in (labels[row], district) if d)
+                labels[row] = district
+                reassigned += 1
+
+        diff = {
+            "reassigned": reassigned,
+            "unmatched_ward_ids": unmatched,
+            "changed_districts": touched,
+        }
+        return matrix, build_assignment(labels.tolist()), diff
+
+    async def evaluate_plan(
+        self,
+        district_type: DistrictType,
+        assignments: dict[str, str | None],
+        base: PlanBase = "current",
+        race_type: str | None = None,
+        vintage: int | None = None,
+        only_changed: bool = False,
+    ) -> dict | None:
+        """Per-district totals of every election under a what-if plan.
+
+        assignments maps ward_id → district id (None removes the ward from
+        the plan). With base="current" they are applied on top of the
+        wards table's current districts; with base="empty" they are the
+        whole plan. only_changed limits the response to districts that
+        gained or lost wards. Without a vintage, the plan is drawn on the
+        vintage with the longest electoral history. Returns None if the
+        vintage has no wards.
+        """
+        if vintage is None:
+            vintage = await history_vintage(self.db)
+            if vintage is None:
+                return None
+        loaded = await self.load_plan(district_type, assignments, vintage, base)
+        if loaded is None:
+            return None
+        matrix, assignment, diff = loaded
+
+        cols = matrix.election_columns(race_type)
+        votes = {
+            name: getattr(matrix, name)[:, cols]
+            for name in ("dem", "rep", "other", "total", "present")
+        }
+        totals = district_totals(assignment, votes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            margin = (totals["dem"] - totals["rep"]) / totals["total"] * 100
+
+        rows: Sequence[int] = range(assignment.n_districts)
+        if only_changed:
+            rows = [
+                i for i, d in enumerate(assignment.district_ids)
+                if d in diff["changed_districts"]
+            ]
+        ward_counts = assignment.ward_counts()
+
+        return {
+            "district_type": district_type,
+            "ward_vintage": matrix.vintage,
+            "base": base,
+            "reassigned": diff["reassigned"],
+            "unmatched_ward_ids": diff["unmatched_ward_ids"],
+            "district_count": assignment.n_districts,
+            "elections": [
+                {"year": matrix.elections[j][0], "race_type": matrix.elections[j][1]}
+                for j in cols
+            ],
+            "districts": [
+                {
+                    "district_id": assignment.district_ids[i],
+                    "ward_count": int(ward_counts[i]),
+                    "reporting_wards": totals["present"][i].tolist(),
+                    "dem_votes": totals["dem"][i].tolist(),
+                    "rep_votes": totals["rep"][i].tolist(),
+                    "other_votes": totals["other"][i].tolist(),
+                    "total_votes": totals["total"][i].tolist(),
+                    "margin": [
+                        round(float(m), 2) if np.isfinite(m) else None
+                        for m in margin[i]
+                    ],
+                }
+                for i in rows
+            ],
+        }
+
+    async def get_fairness(
+        self,
+        district_type: DistrictType,
+        year: int,
+        race_type: str,
+        assignments: dict[str, str | None] | None = None,
+        base: PlanBase = "current",
+        vintage: int | None = None,
+        swing_range: float = 10.0,
+        swing_step: float = 0.5,
+    ) -> dict | None:
+        """Seats, fairness metrics and seat-vote curve for one election.
+
+        The plan is resolved as in evaluate_plan (no assignments = the
+        current map). The curve covers swings from −swing_range to
+        +swing_range points in swing_step increments. Without a vintage,
+        the plan is drawn on the vintage the election was reported in.
+        Returns None if the vintage has no wards or the election is not in
+        it.
+        """
+        if vintage is None:
+            vintage = await election_vintage(self.db, year, race_type)
+            if vintage is None:
+                return None
+        loaded = await self.load_plan(
+            district_type, assignments or {}, vintage, base
+        )
+        if loaded is None:
+            return None
+        matrix, assignment, diff = loaded
+
+        col = matrix.election_index.get((year, race_type))
+        if col is None:
+            return None
+
+        n_steps = int(round(swing_range / swing_step))
+        swings = (np.arange(-n_steps, n_steps + 1) * swing_step).astype(np.float64)
+        metrics, curve = evaluate_fairness(
+            assignment,
+            matrix.dem[:, col],
+            matrix.rep[:, col],
+            matrix.total[:, col],
+            swings,
+        )
+
+        return {
+            "district_type": district_type,
+            "ward_vintage": matrix.vintage,
+            "year": year,
+            "race_type": race_type,
+            "base": base,
+            "reassigned": diff["reassigned"],
+            "unmatched_ward_ids": diff["unmatched_ward_ids"],
+            "seats": metrics.seats,
+            "dem_seats": metrics.dem_seats,
+            "dem_vote_share": _finite(metrics.dem_vote_share),
+            "efficiency_gap": _finite(metrics.efficiency_gap),
+            "mean_median": _finite(metrics.mean_median),
+            "partisan_bias": _finite(metrics.partisan_bias),
+            "districts": [
+                {"district_id": d, "dem_share": _finite(float(share))}
+                for d, share in zip(
+                    assignment.district_ids,
+                    metrics.district_dem_share,
+                    strict=True,
+                )
+            ],
+            "seat_vote_curve": {
+                "swing": curve.swing.round(4).tolist(),
+                "dem_vote_share": [
+                    _finite(float(v)) for v in curve.dem_vote_share
+                ],
+                "dem_seats": curve.dem_seats.tolist(),
+                "seat_share": curve.seat_share.round(4).tolist(),
+            },
+        }
@@ -1,4 +1,4 @@
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -6,6 +6,7 @@ from app.models.ward import Ward
 from app.models.election_result import ElectionResult
 from app.models.ward_trend import WardTrend
 from app.models.election_aggregation import ElectionAggregation
+from app.services.ranking_service import RankingService
 
 
 class ReportCardService:
@@ -90,23 +91,11 @@ class ReportCardService:
         )
         elections_used = min(len(pres_elections), 3)
 
-        # Compute percentile: how many wards have a lower partisan lean
-        count_below = await self.db.execute(
-            select(func.count()).select_from(Ward).where(
-                Ward.partisan_lean < lean,
-                Ward.partisan_lean.is_not(None),
-            )
+        # Percentile among wards of the same vintage (sorted in-memory index)
+        rank = await RankingService(self.db).ward_rank(
+            "lean", ward.ward_id, vintage=ward.ward_vintage
         )
-        below = count_below.scalar() or 0
-
-        count_total = await self.db.execute(
-            select(func.count()).select_from(Ward).where(
-                Ward.partisan_lean.is_not(None),
-            )
-        )
-        total = count_total.scalar() or 1
-
-        percentile = round(below / total * 100, 1)
+        percentile = rank["percentile"] if rank else None
 
         # Format label
         if lean > 0:
@@ -195,6 +184,7 @@ class ReportCardService:
         county_stmt = select(ElectionAggregation).where(
             ElectionAggregation.aggregation_level == "county",
             ElectionAggregation.aggregation_key == ward.county,
+            ElectionAggregation.ward_vintage == ward.ward_vintage,
             ElectionAggregation.race_type == race_type,
         )
         county_result = await self.db.execute(county_stmt)
@@ -204,6 +194,7 @@ class ReportCardService:
         state_stmt = select(ElectionAggregation).where(
             ElectionAggregation.aggregation_level == "statewide",
             ElectionAggregation.aggregation_key == "WI",
+            ElectionAggregation.ward_vintage == ward.ward_vintage,
             ElectionAggregation.race_type == race_type,
         )
         state_result = await self.db.execute(state_stmt)
@@ -0,0 +1,259 @@
+"""Nearest-neighbour search for "wards like this one".
+
+Each ward is embedded as a standardized vector of its margins across
+elections, its turnout and its demographic shares. A BallTree over those
+vectors is built once per vintage (at startup or on first use) and answers
+k-NN queries without touching the database.
+"""
+
+from __future__ import annotations
+
+import logging
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from sklearn.neighbors import BallTree
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_session
+from app.models.ward_demographic import WardDemographic
+from app.services.ward_matrix import WardMatrix, get_ward_matrix, history_vintage
+
+logger = logging.getLogger(__name__)
+
+# Elections reported in fewer than this share of wards (uncontested
+# legislative seats, partial loads) are left out of the feature vector.
+MIN_ELECTION_COVERAGE = 0.5
+
+DEMOGRAPHIC_FEATURES = [
+    "white_pct",
+    "black_pct",
+    "hispanic_pct",
+    "asian_pct",
+    "college_degree_pct",
+    "log_median_household_income",
+    "log_population_density",
+]
+
+
+@dataclass
+class SimilarityIndex:
+    matrix: WardMatrix
+    tree: BallTree
+    rows: NDArray[np.int64]  # tree position -> matrix row
+    positions: dict[int, int]  # matrix row -> tree position
+    features: NDArray[np.float64]
+    feature_names: list[str]
+
+
+_indexes: dict[int, SimilarityIndex] = {}
+
+
+class SimilarityService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def find_similar(
+        self, ward_id: str, k: int = 10, vintage: int | None = None
+    ) -> dict | None:
+        """Return the k wards closest to ward_id in feature space.
+
+        Returns None if the ward is not in the vintage or has no results.
+        """
+        index = await self.get_index(vintage)
+        if index is None:
+            return None
+
+        row = index.matrix.ward_index.get(ward_id)
+        pos = index.positions.get(row) if row is not None else None
+        if pos is None:
+            return None
+
+        n_query = min(k + 1, len(index.rows))
+        distances, neighbors = index.tree.query(
+            index.features[pos : pos + 1], k=n_query
+        )
+
+        matrix = index.matrix
+        similar = []
+        for dist, nb in zip(distances[0], neighbors[0], strict=True):
+            if nb == pos:
+                continue
+            r = int(index.rows[nb])
+            similar.append({
+                "ward_id": str(matrix.ward_ids[r]),
+                "ward_name": matrix.ward_names[r],
+                "municipality": matrix.municipalities[r],
+                "county": matrix.counties[r],
+                "distance": round(float(dist), 4),
+            })
+
+        return {
+            "ward_id": ward_id,
+            "ward_vintage": matrix.vintage,
+            "k": k,
+            "feature_count": len(index.feature_names),
+            "similar": similar[:k],
+        }
+
+    async def get_index(self, vintage: int | None = None) -> SimilarityIndex | None:
+        """Return the BallTree index for a vintage, rebuilding it if the
+        underlying ward matrix has been reloaded.
+
+        Defaults to the vintage with the longest electoral history rather
+        than the latest one, which may hold a single election.
+        """
+        if vintage is None:
+            vintage = await history_vintage(self.db)
+            if vintage is None:
+                return None
+        matrix = await get_ward_matrix(self.db, vintage)
+        if matrix is None:
+            return None
+
+        index = _indexes.get(matrix.vintage)
+        if index is not None and index.matrix is matrix:
+            return index
+
+        demographics = await self._load_demographics(matrix)
+        features, names = build_feature_matrix(matrix, demographics)
+        rows = np.flatnonzero(matrix.present.any(axis=1))
+        if len(rows) == 0:
+            return None
+
+        index = SimilarityIndex(
+            matrix=matrix,
+            tree=BallTree(features[rows]),
+            rows=rows,
+            positions={int(r): i for i, r in enumerate(rows)},
+            features=features[rows],
+            feature_names=names,
+        )
+        _indexes[matrix.vintage] = index
+        logger.info(
+            "Built similarity index for vintage %s (%d wards, %d features)",
+            matrix.vintage, len(rows), len(names),
+        )
+        return index
+
+    async def _load_demographics(
+        self, matrix: WardMatrix
+    ) -> dict[str, NDArray[np.float64]]:
+        """Demographic columns aligned to the matrix rows (NaN if missing)."""
+        stmt = select(
+            WardDemographic.ward_id,
+            WardDemographic.voting_age_population,
+            WardDemographic.white_pct,
+            WardDemographic.black_pct,
+            WardDemographic.hispanic_pct,
+            WardDemographic.asian_pct,
+            WardDemographic.college_degree_pct,
+            WardDemographic.median_household_income,
+            WardDemographic.population_density,
+        ).where(WardDemographic.ward_vintage == matrix.vintage)
+        rows = (await self.db.execute(stmt)).all()
+
+        names = [
+            "voting_age_population", "white_pct", "black_pct", "hispanic_pct",
+            "asian_pct", "college_degree_pct", "median_household_income",
+            "population_density",
+        ]
+        columns = {n: np.full(matrix.n_wards, np.nan) for n in names}
+        for row in rows:
+            i = matrix.ward_index.get(row.ward_id)
+            if i is None:
+                continue
+            for n in names:
+                value = getattr(row, n)
+                if value is not None:
+                    columns[n][i] = value
+        return columns
+
+
+def build_feature_matrix(
+    matrix: WardMatrix, demographics: dict[str, NDArray[np.float64]]
+) -> tuple[NDArray[np.float64], list[str]]:
+    """Build the standardized (n_wards, n_features) similarity matrix.
+
+    Three blocks — margins, turnout and demographics — are z-scored column
+    by column, missing values are imputed at the column mean (zero), and
+    each block is scaled by 1/sqrt(width) so that a block with many
+    elections does not drown out the demographic block.
+    """
+    coverage = matrix.present.mean(axis=0) if matrix.n_wards else np.array([])
+    cols = np.flatnonzero(coverage >= MIN_ELECTION_COVERAGE)
+    labels = [f"{y}_{r}" for y, r in (matrix.elections[j] for j in cols)]
+
+    margin = matrix.margin()[:, cols]
+
+    vap = demographics["voting_age_population"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        turnout = np.where(
+            (vap > 0)[:, None] & matrix.present[:, cols],
+            matrix.total[:, cols] / vap[:, None] * 100,
+            np.nan,
+        )
+    # Without VAP, fall back to log vote counts as a size/turnout proxy
+    if np.isnan(turnout).all():
+        turnout = np.where(
+            matrix.present[:, cols], np.log1p(matrix.total[:, cols]), np.nan
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        demo = np.column_stack([
+            demographics["white_pct"],
+            demographics["black_pct"],
+            demographics["hispanic_pct"],
+            demographics["asian_pct"],
+            demographics["college_degree_pct"],
+            np.log1p(np.clip(demographics["median_household_income"], 0, None)),
+            np.log1p(np.clip(demographics["population_density"], 0, None)),
+        ])
+
+    blocks = [
+        (margin, [f"margin_{lbl}" for lbl in labels]),
+        (turnout, [f"turnout_{lbl}" for lbl in labels]),
+        (demo, DEMOGRAPHIC_FEATURES),
+    ]
+
+    parts = []
+    names: list[str] = []
+    for block, block_names in blocks:
+        if block.shape[1] == 0:
+            continue
+        z = _standardize(block)
+        keep = ~np.all(z == 0, axis=0)
+        if not keep.any():
+            continue
+        z = z[:, keep]
+        parts.append(z / np.sqrt(z.shape[1]))
+        names.extend(n for n, kept in zip(block_names, keep, strict=True) if kept)
+
+    if not parts:
+        return np.zeros((matrix.n_wards, 1)), ["constant"]
+    return np.hstack(parts), names
+
+
+def _standardize(block: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Column z-scores with NaNs imputed at the mean (zero)."""
+    with warnings.catch_warnings():
+        # All-NaN columns (e.g. no demographics loaded) are expected here
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(block, axis=0)
+        std = np.nanstd(block, axis=0)
+    mean = np.nan_to_num(mean)
+    std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+    z = (block - mean) / std
+    return np.nan_to_num(z, nan=0.0)
+
+
+async def warm_similarity_index() -> None:
+    """Build the default vintage's index at startup so the first request is fast."""
+    try:
+        async with async_session() as db:
+            await SimilarityService(db).get_index()
+    except Exception:
+        logger.warning("Could not warm similarity index at startup", exc_info=True)
@@ -1,9 +1,24 @@
-from sqlalchemy import select, func
+from typing import Literal
+
+import numpy as np
+from sqlalchemy import String, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.election_models.trends import classify_trends, fit_linear_trends
+from app.models.ward_changepoint import WardChangepoint
+from app.models.ward_forecast import WardForecast
 from app.models.ward_trend import WardTrend
 from app.models.election_result import ElectionResult
 from app.models.ward import Ward
+from app.services.ward_matrix import get_data_version
+
+AreaTrendSort = Literal["ward_id", "slope_asc", "slope_desc"]
+
+# Area summaries keyed by (filters, race_type, data version). Old data
+# versions are never requested again, so the cache is simply bounded.
+_area_cache: dict[tuple, dict] = {}
+_AREA_CACHE_SIZE = 512
 
 
 class TrendService:
@@ -38,6 +53,7 @@ class TrendService:
                     "direction": t.trend_direction,
                     "slope": t.trend_slope,
                     "r_squared": t.trend_r_squared,
+                    "std_err": t.trend_std_err,
                     "p_value": t.trend_p_value,
                     "elections_analyzed": t.elections_analyzed,
                     "start_year": t.start_year,
@@ -68,18 +84,179 @@ class TrendService:
         municipality: str | None = None,
         district_type: str | None = None,
         district_id: str | None = None,
+        race_type: str = "president",
+        include_wards: bool = True,
+        limit: int | None = None,
+        offset: int = 0,
+        sort: AreaTrendSort = "ward_id",
     ) -> dict:
-        """Filtered ward trends with direction summary counts."""
-        # Build filter by joining ward_trends with wards
-        stmt = (
-            select(WardTrend)
+        """Direction summary and area trend line, plus optional ward detail.
+
+        The summary counts and the turnout-weighted area trend line are
+        aggregated in SQL and cached per (filters, race_type, data version).
+        Ward rows are returned one page at a time (all of them if limit is
+        None) and omitted entirely when include_wards is False.
+        """
+        filters = (county, municipality, district_type, district_id)
+        key = (*filters, race_type, await get_data_version(self.db))
+        summary = _area_cache.get(key)
+        if summary is None:
+            summary = await self._area_summary(*filters, race_type)
+            if len(_area_cache) >= _AREA_CACHE_SIZE:
+                _area_cache.pop(next(iter(_area_cache)))
+            _area_cache[key] = summary
+
+        ward_trends: list[dict] = []
+        if include_wards and summary["total_wards"]:
+            slope = WardTrend.trend_slope
+            order_by = {
+                "slope_asc": (slope.asc().nulls_last(), WardTrend.ward_id),
+                "slope_desc": (slope.desc().nulls_last(), WardTrend.ward_id),
+            }.get(sort, (WardTrend.ward_id,))
+            stmt = (
+                self._area_filter(
+                    select(
+                        WardTrend.ward_id,
+                        WardTrend.race_type,
+                        WardTrend.trend_direction,
+                        WardTrend.trend_slope,
+                        WardTrend.trend_r_squared,
+                        WardTrend.trend_p_value,
+                    ).join(
+                        Ward,
+                        (Ward.ward_id == WardTrend.ward_id)
+                        & (Ward.ward_vintage == WardTrend.ward_vintage),
+                    ),
+                    *filters,
+                )
+                .where(WardTrend.race_type == race_type)
+                .order_by(*order_by)
+                .offset(offset)
+                .limit(limit)
+            )
+            rows = (await self.db.execute(stmt)).all()
+            ward_trends = [
+                {
+                    "ward_id": r.ward_id,
+                    "race_type": r.race_type,
+                    "direction": r.trend_direction,
+                    "slope": r.trend_slope,
+                    "r_squared": r.trend_r_squared,
+                    "p_value": r.trend_p_value,
+                }
+                for r in rows
+            ]
+
+        return {
+            **summary,
+            "offset": offset,
+            "limit": limit,
+            "trends": ward_trends,
+        }
+
+    async def _area_summary(
+        self,
+        county: str | None,
+        municipality: str | None,
+        district_type: str | None,
+        district_id: str | None,
+        race_type: str,
+    ) -> dict:
+        filters = (county, municipality, district_type, district_id)
+
+        count_stmt = self._area_filter(
+            select(WardTrend.trend_direction, func.count())
             .join(
                 Ward,
                 (Ward.ward_id == WardTrend.ward_id)
                 & (Ward.ward_vintage == WardTrend.ward_vintage),
             )
+            .where(WardTrend.race_type == race_type)
+            .group_by(WardTrend.trend_direction),
+            *filters,
         )
+        direction_counts = {"more_democratic": 0, "more_republican": 0, "inconclusive": 0}
+        total_wards = 0
+        for direction, count in (await self.db.execute(count_stmt)).all():
+            if direction in direction_counts:
+                direction_counts[direction] += count
+            total_wards += count
 
+        # Area-wide totals per election year; summing votes before taking
+        # the margin weights every ward by its turnout
+        votes_stmt = self._area_filter(
+            select(
+                ElectionResult.election_year,
+                func.sum(ElectionResult.dem_votes),
+                func.sum(ElectionResult.rep_votes),
+                func.sum(ElectionResult.total_votes),
+            )
+            .join(
+                Ward,
+                (Ward.ward_id == ElectionResult.ward_id)
+                & (Ward.ward_vintage == ElectionResult.ward_vintage),
+            )
+            .where(ElectionResult.race_type == race_type)
+            .group_by(ElectionResult.election_year)
+            .order_by(ElectionResult.election_year),
+            *filters,
+        )
+        elections = [
+            {
+                "year": year,
+                "dem_votes": int(dem),
+                "rep_votes": int(rep),
+                "total_votes": int(total),
+                "margin": round((dem - rep) / total * 100, 2) if total else None,
+            }
+            for year, dem, rep, total in (await self.db.execute(votes_stmt)).all()
+        ]
+
+        return {
+            "race_type": race_type,
+            "summary": direction_counts,
+            "total_wards": total_wards,
+            "area_trend": self._area_trend_line(elections),
+        }
+
+    @staticmethod
+    def _area_trend_line(elections: list[dict]) -> dict:
+        """Linear fit of the area's turnout-weighted margin over time."""
+        points = [e for e in elections if e["margin"] is not None]
+        trend: dict = {
+            "direction": None,
+            "slope": None,
+            "r_squared": None,
+            "std_err": None,
+            "p_value": None,
+            "elections": elections,
+        }
+        if not points:
+            return trend
+
+        fit = fit_linear_trends(
+            np.array([e["year"] for e in points]),
+            np.array([[e["margin"] for e in points]], dtype=float),
+        )
+        if fit.valid[0]:
+            trend.update(
+                direction=str(classify_trends(fit.slope, fit.p_value)[0]),
+                slope=round(float(fit.slope[0]), 4),
+                r_squared=round(float(fit.r_squared[0]), 4),
+                std_err=round(float(fit.std_err[0]), 4),
+                p_value=round(float(fit.p_value[0]), 6),
+            )
+        return trend
+
+    @staticmethod
+    def _area_filter(
+        stmt,
+        county: str | None,
+        municipality: str | None,
+        district_type: str | None,
+        district_id: str | None,
+    ):
+        """Apply the area filters to a statement already joined to Ward."""
         if county:
             stmt = stmt.where(Ward.county == county)
         if municipality:
@@ -93,30 +270,7 @@ class TrendService:
             col = column_map.get(district_type)
             if col is not None:
                 stmt = stmt.where(col == district_id)
-
-        result = await self.db.execute(stmt)
-        trends = result.scalars().all()
-
-        # Compute direction counts
-        direction_counts = {"more_democratic": 0, "more_republican": 0, "inconclusive": 0}
-        ward_trends = []
-        for t in trends:
-            if t.trend_direction in direction_counts:
-                direction_counts[t.trend_direction] += 1
-            ward_trends.append({
-                "ward_id": t.ward_id,
-                "race_type": t.race_type,
-                "direction": t.trend_direction,
-                "slope": t.trend_slope,
-                "r_squared": t.trend_r_squared,
-                "p_value": t.trend_p_value,
-            })
-
-        return {
-            "summary": direction_counts,
-            "total_wards": len(trends),
-            "trends": ward_trends,
-        }
+        return stmt
 
     async def get_bulk_elections(self, ward_ids: list[str]) -> dict[str, list[dict]]:
         """Get election histories for a list of ward IDs."""
@@ -151,6 +305,78 @@ class TrendService:
 
         return grouped
 
+    async def get_elections_columnar(
+        self,
+        ward_ids: list[str] | None = None,
+        county: str | None = None,
+        municipality: str | None = None,
+        district_type: str | None = None,
+        district_id: str | None = None,
+        race_type: str | None = None,
+    ) -> dict:
+        """Election histories for any number of wards, as parallel columns.
+
+        Wards are selected by explicit id list and/or area filter. Each
+        result row is one position in the value columns; ``ward`` and
+        ``race`` index into ``ward_ids`` and ``races``. Rows come from a
+        plain Core select (no ORM hydration) and the id list is sent as a
+        single array parameter, so there is no cap on its size.
+        """
+        stmt = select(
+            ElectionResult.ward_id,
+            ElectionResult.election_year,
+            ElectionResult.race_type,
+            ElectionResult.dem_votes,
+            ElectionResult.rep_votes,
+            ElectionResult.other_votes,
+            ElectionResult.total_votes,
+            ElectionResult.is_estimate,
+        )
+        if ward_ids is not None:
+            stmt = stmt.where(
+                ElectionResult.ward_id
+                == any_(bindparam("ward_ids", ward_ids, type_=ARRAY(String)))
+            )
+        if county or municipality or (district_type and district_id):
+            stmt = self._area_filter(
+                stmt.join(
+                    Ward,
+                    (Ward.ward_id == ElectionResult.ward_id)
+                    & (Ward.ward_vintage == ElectionResult.ward_vintage),
+                ),
+                county, municipality, district_type, district_id,
+            )
+        if race_type:
+            stmt = stmt.where(ElectionResult.race_type == race_type)
+        stmt = stmt.order_by(ElectionResult.ward_id, ElectionResult.election_year)
+
+        rows = (await self.db.execute(stmt)).all()
+        if not rows:
+            return {
+                "ward_count": 0, "row_count": 0, "ward_ids": [], "races": [],
+                "ward": [], "year": [], "race": [], "dem_votes": [],
+                "rep_votes": [], "other_votes": [], "total_votes": [],
+                "is_estimate": [],
+            }
+
+        wards, years, races, dem, rep, other, total, estimate = zip(*rows, strict=True)
+        ward_names, ward_index = np.unique(np.array(wards), return_inverse=True)
+        race_names, race_index = np.unique(np.array(races), return_inverse=True)
+        return {
+            "ward_count": len(ward_names),
+            "row_count": len(rows),
+            "ward_ids": ward_names.tolist(),
+            "races": race_names.tolist(),
+            "ward": ward_index.tolist(),
+            "year": list(years),
+            "race": race_index.tolist(),
+            "dem_votes": list(dem),
+            "rep_votes": list(rep),
+            "other_votes": list(other),
+            "total_votes": list(total),
+            "is_estimate": [bool(e) for e in estimate],
+        }
+
     async def classify_all(self, race_type: str = "president") -> dict:
         """Compact {wardId: {direction, slope, stats}} map for map rendering."""
         stmt = select(
@@ -180,3 +406,86 @@ class TrendService:
             }
 
         return {"race_type": race_type, "classifications": classifications}
+
+    async def get_changepoints(
+        self,
+        race_type: str = "president",
+        significant_only: bool = True,
+        alpha: float = 0.05,
+    ) -> dict:
+        """Compact {wardId: {break_year, magnitude, ...}} map of realignments."""
+        stmt = select(
+            WardChangepoint.ward_id,
+            WardChangepoint.break_year,
+            WardChangepoint.magnitude,
+            WardChangepoint.slope,
+            WardChangepoint.p_value,
+            WardChangepoint.elections_analyzed,
+        ).where(WardChangepoint.race_type == race_type)
+        if significant_only:
+            stmt = stmt.where(WardChangepoint.p_value < alpha)
+
+        rows = (await self.db.execute(stmt)).all()
+        return {
+            "race_type": race_type,
+            "ward_count": len(rows),
+            "changepoints": {
+                row.ward_id: {
+                    "break_year": row.break_year,
+                    "magnitude": row.magnitude,
+                    "slope": row.slope,
+                    "p_value": row.p_value,
+                    "elections_analyzed": row.elections_analyzed,
+                }
+                for row in rows
+            },
+        }
+
+    async def get_forecasts(self, race_type: str = "president") -> dict:
+        """Next-election forecasts in the map-data payload shape.
+
+        demPct/repPct are two-party shares implied by the forecast margin
+        and vote counts are split from the forecast turnout, so the payload
+        can be rendered like any election's map data. Interval bounds ride
+        along in the per-ward entries.
+        """
+        stmt = select(
+            WardForecast.ward_id,
+            WardForecast.target_year,
+            WardForecast.margin,
+            WardForecast.margin_lower,
+            WardForecast.margin_upper,
+            WardForecast.turnout,
+            WardForecast.turnout_lower,
+            WardForecast.turnout_upper,
+            WardForecast.interval_level,
+        ).where(WardForecast.race_type == race_type)
+        rows = (await self.db.execute(stmt)).all()
+
+        data: dict[str, dict] = {}
+        for row in rows:
+            dem_pct = 50 + row.margin / 2
+            turnout = row.turnout or 0
+            data[row.ward_id] = {
+                "demPct": round(dem_pct, 2),
+                "repPct": round(100 - dem_pct, 2),
+                "margin": row.margin,
+                "totalVotes": turnout,
+                "demVotes": round(turnout * dem_pct / 100),
+                "repVotes": round(turnout * (100 - dem_pct) / 100),
+                "isEstimate": True,
+                "targetYear": row.target_year,
+                "marginLower": row.margin_lower,
+                "marginUpper": row.margin_upper,
+                "turnoutLower": row.turnout_lower,
+                "turnoutUpper": row.turnout_upper,
+            }
+
+        years = [row.target_year for row in rows]
+        return {
+            "year": max(set(years), key=years.count) if years else 0,
+            "raceType": race_type,
+            "wardCount": len(data),
+            "intervalLevel": rows[0].interval_level if rows else None,
+            "data": data,
+        }
@@ -0,0 +1,333 @@
+"""Resident ward × election vote matrices.
+
+Loads every election result for a ward vintage once into dense NumPy
+arrays so analytics endpoints (similar wards, rankings, custom regions)
+can answer with array operations instead of re-querying
+``election_results`` on every request. Matrices are reloaded when the
+aggregation stage publishes a new data version (see ElectionVersion) or
+after ``ward_matrix_ttl_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.election_result import ElectionResult
+from app.models.election_version import ElectionVersion
+from app.models.ward import Ward
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WardMatrix:
+    """Dense vote arrays for one ward vintage.
+
+    Rows follow ``ward_ids`` (every ward in the vintage, sorted); columns
+    follow ``elections`` as ``(year, race_type)`` pairs sorted by year then
+    race. Cells without a reported result have ``present`` set to False and
+    zero votes.
+    """
+
+    vintage: int
+    ward_ids: NDArray[np.str_]
+    ward_names: NDArray[np.object_]
+    municipalities: NDArray[np.object_]
+    counties: NDArray[np.object_]
+    congressional: NDArray[np.object_]
+    state_senate: NDArray[np.object_]
+    assembly: NDArray[np.object_]
+    elections: list[tuple[int, str]]
+    dem: NDArray[np.int64]
+    rep: NDArray[np.int64]
+    other: NDArray[np.int64]
+    total: NDArray[np.int64]
+    present: NDArray[np.bool_]
+    data_version: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+    ward_index: dict[str, int] = field(init=False)
+    election_index: dict[tuple[int, str], int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.ward_index = {w: i for i, w in enumerate(self.ward_ids.tolist())}
+        self.election_index = {e: j for j, e in enumerate(self.elections)}
+
+    @property
+    def n_wards(self) -> int:
+        return len(self.ward_ids)
+
+    def margin(self) -> NDArray[np.float64]:
+        """Margin (D − R as % of total votes), NaN where there is no result."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            margin = (self.dem - self.rep) / self.total * 100
+        return np.where(self.total > 0, margin, np.nan)
+
+    def election_columns(self, race_type: str | None = None) -> list[int]:
+        """Column indices for one race type (all races if None), by year."""
+        return [
+            j for j, (_, race) in enumerate(self.elections)
+            if race_type is None or race == race_type
+        ]
+
+    def rows_for(self, ward_ids: NDArray[np.str_]) -> NDArray[np.int64]:
+        """Row of each ward_id in this matrix, -1 where it has none.
+
+        Lines up wards of another vintage by ward_id.
+        """
+        rows = np.searchsorted(self.ward_ids, ward_ids)
+        found = rows < self.n_wards
+        found[found] = self.ward_ids[rows[found]] == ward_ids[found]
+        return np.where(found, rows, -1)
+
+
+_cache: dict[int, WardMatrix] = {}
+_lock = asyncio.Lock()
+
+
+async def latest_vintage(db: AsyncSession) -> int | None:
+    """Most recent ward vintage present in the wards table."""
+    result = await db.execute(select(func.max(Ward.ward_vintage)))
+    return result.scalar()
+
+
+async def ward_vintages(db: AsyncSession) -> list[int]:
+    """Every ward vintage in the wards table, oldest first."""
+    result = await db.execute(
+        select(Ward.ward_vintage).distinct().order_by(Ward.ward_vintage)
+    )
+    return list(result.scalars())
+
+
+async def election_vintage(
+    db: AsyncSession, year: int, race_type: str
+) -> int | None:
+    """Most recent ward vintage with results for an election."""
+    result = await db.execute(
+        select(func.max(ElectionResult.ward_vintage)).where(
+            ElectionResult.election_year == year,
+            ElectionResult.race_type == race_type,
+        )
+    )
+    return result.scalar()
+
+
+async def previous_election(
+    db: AsyncSession, year: int, race_type: str
+) -> tuple[int, int] | None:
+    """(year, vintage) of the last election of a race type before year.
+
+    Elections are reported in the vintage current at the time, so the
+    previous one is often in an older vintage than year itself.
+    """
+    result = await db.execute(
+        select(ElectionResult.election_year, func.max(ElectionResult.ward_vintage))
+        .where(
+            ElectionResult.election_year < year,
+            ElectionResult.race_type == race_type,
+        )
+        .group_by(ElectionResult.election_year)
+        .order_by(ElectionResult.election_year.desc())
+        .limit(1)
+    )
+    row = result.first()
+    return (row[0], row[1]) if row is not None else None
+
+
+async def history_vintage(db: AsyncSession) -> int | None:
+    """Ward vintage with results for the most elections (latest on ties).
+
+    A new vintage starts with a single election, so this — not
+    latest_vintage — is the default for features built on a ward's
+    electoral history.
+    """
+    elections = (
+        select(
+            ElectionResult.ward_vintage,
+            ElectionResult.election_year,
+            ElectionResult.race_type,
+        )
+        .distinct()
+        .subquery()
+    )
+    result = await db.execute(
+        select(elections.c.ward_vintage)
+        .group_by(elections.c.ward_vintage)
+        .order_by(func.count().desc(), elections.c.ward_vintage.desc())
+        .limit(1)
+    )
+    return result.scalar()
+
+
+async def get_data_version(db: AsyncSession) -> int:
+    """Version of the derived election data, bumped by every aggregation run
+    that found changed results (0 before the first tracked run)."""
+    result = await db.execute(select(func.max(ElectionVersion.data_version)))
+    return result.scalar() or 0
+
+
+async def get_ward_matrix(
+    db: AsyncSession, vintage: int | None = None
+) -> WardMatrix | None:
+    """Return the cached matrix for a vintage, loading it if missing or stale.
+
+    If vintage is not specified, the most recent vintage is used. Returns
+    None if the vintage has no wards.
+    """
+    if vintage is None:
+        vintage = await latest_vintage(db)
+        if vintage is None:
+            return None
+
+    data_version = await get_data_version(db)
+    cached = _cache.get(vintage)
+    if cached is not None and not _is_stale(cached, data_version):
+        return cached
+
+    async with _lock:
+        # Another request may have finished the load while we waited
+        cached = _cache.get(vintage)
+        if cached is not None and not _is_stale(cached, data_version):
+            return cached
+
+        started = time.perf_counter()
+        matrix = await _load_matrix(db, vintage, data_version)
+        if matrix is None:
+            return None
+        _cache[vintage] = matrix
+        logger.info(
+            "Loaded ward matrix for vintage %s (%d wards × %d elections) in %.0f ms",
+            vintage, matrix.n_wards, len(matrix.elections),
+            (time.perf_counter() - started) * 1000,
+        )
+        return matrix
+
+
+def invalidate_ward_matrix(vintage: int | None = None) -> None:
+    """Drop cached matrices so the next request reloads from the database."""
+    if vintage is None:
+        _cache.clear()
+    else:
+        _cache.pop(vintage, None)
+
+
+def _is_stale(matrix: WardMatrix, data_version: int) -> bool:
+    return (
+        matrix.data_version != data_version
+        or time.monotonic() - matrix.loaded_at > settings.ward_matrix_ttl_seconds
+    )
+
+
+async def _load_matrix(
+    db: AsyncSession, vintage: int, data_version: int
+) -> WardMatrix | None:
+    ward_stmt = select(
+        Ward.ward_id,
+        Ward.ward_name,
+        Ward.municipality,
+        Ward.county,
+        Ward.congressional_district,
+        Ward.state_senate_district,
+        Ward.assembly_district,
+    ).where(Ward.ward_vintage == vintage)
+    ward_rows = (await db.execute(ward_stmt)).all()
+    if not ward_rows:
+        return None
+
+    ward_cols = [np.array(c, dtype=object) for c in zip(*ward_rows, strict=True)]
+    order = np.argsort(ward_cols[0].astype(str))
+    ward_cols = [c[order] for c in ward_cols]
+    ward_ids = ward_cols[0].astype(str)
+
+    result_stmt = select(
+        ElectionResult.ward_id,
+        ElectionResult.election_year,
+        ElectionResult.race_type,
+        ElectionResult.dem_votes,
+        ElectionResult.rep_votes,
+        ElectionResult.other_votes,
+        ElectionResult.total_votes,
+    ).where(ElectionResult.ward_vintage == vintage)
+    result_rows = (await db.execute(result_stmt)).all()
+
+    elections, arrays, present = pivot_results(ward_ids, result_rows)
+
+    return WardMatrix(
+        vintage=vintage,
+        ward_ids=ward_ids,
+        ward_names=ward_cols[1],
+        municipalities=ward_cols[2],
+        counties=ward_cols[3],
+        congressional=ward_cols[4],
+        state_senate=ward_cols[5],
+        assembly=ward_cols[6],
+        elections=elections,
+        dem=arrays["dem"],
+        rep=arrays["rep"],
+        other=arrays["other"],
+        total=arrays["total"],
+        present=present,
+        data_version=data_version,
+    )
+
+
+def pivot_results(
+    ward_ids: NDArray[np.str_],
+    result_rows: Sequence[Sequence[Any]],
+) -> tuple[list[tuple[int, str]], dict[str, NDArray[np.int64]], NDArray[np.bool_]]:
+    """Pivot long-format result rows into dense ward × election arrays.
+
+    ward_ids must be sorted. Each row is (ward_id, election_year, race_type,
+    dem_votes, rep_votes, other_votes, total_votes); rows for wards not in
+    ward_ids are dropped. Returns the sorted (year, race_type) columns, the
+    dem/rep/other/total arrays and the presence mask. Shared with the sync
+    ETL scripts in data/scripts.
+    """
+    if result_rows:
+        r_ward, r_year, r_race, r_dem, r_rep, r_other, r_total = zip(
+            *result_rows, strict=True
+        )
+        wards = np.array(r_ward, dtype=str)
+        rows = np.searchsorted(ward_ids, wards)
+        known = rows < len(ward_ids)
+        known[known] = ward_ids[rows[known]] == wards[known]
+        years = np.array(r_year, dtype=np.int64)[known]
+        race_names, race_codes = np.unique(
+            np.array(r_race, dtype=str)[known], return_inverse=True
+        )
+        keys, cols = np.unique(
+            years * len(race_names) + race_codes, return_inverse=True
+        )
+        elections = [
+            (int(k // len(race_names)), str(race_names[k % len(race_names)]))
+            for k in keys
+        ]
+        rows = rows[known]
+        values = [
+            np.array(v, dtype=np.int64)[known]
+            for v in (r_dem, r_rep, r_other, r_total)
+        ]
+    else:
+        rows = cols = np.array([], dtype=np.int64)
+        values = [np.array([], dtype=np.int64)] * 4
+        elections = []
+
+    shape = (len(ward_ids), len(elections))
+    arrays = {}
+    for name, v in zip(("dem", "rep", "other", "total"), values, strict=True):
+        arr = np.zeros(shape, dtype=np.int64)
+        arr[rows, cols] = v
+        arrays[name] = arr
+    present = np.zeros(shape, dtype=bool)
+    present[rows, cols] = True
+    return elections, arrays, present
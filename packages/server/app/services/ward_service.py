@@ -5,6 +5,7 @@ from geoalchemy2.functions import ST_AsGeoJSON, ST_Contains, ST_SetSRID, ST_Make
 
 from app.models.ward import Ward
 from app.models.election_result import ElectionResult
+from app.models.ward_cluster import WardCluster, WardClusterProfile
 
 
 class WardService:
@@ -244,3 +245,44 @@ class WardService:
             "type": "FeatureCollection",
             "features": features,
         }
+
+    async def get_clusters(self, vintage: int | None = None) -> dict:
+        """Get pre-computed electoral archetypes as a compact map layer.
+
+        Returns {ward_id: cluster_id} plus one profile per cluster. If
+        vintage is not specified, returns the most recent clustered vintage.
+        """
+        if vintage is None:
+            vintage = (
+                await self.db.execute(select(func.max(WardCluster.ward_vintage)))
+            ).scalar()
+
+        profile_stmt = (
+            select(WardClusterProfile)
+            .where(WardClusterProfile.ward_vintage == vintage)
+            .order_by(WardClusterProfile.cluster_id)
+        )
+        profiles = (await self.db.execute(profile_stmt)).scalars().all()
+
+        stmt = select(
+            WardCluster.ward_id, WardCluster.cluster_id, WardCluster.method
+        ).where(WardCluster.ward_vintage == vintage)
+        rows = (await self.db.execute(stmt)).all()
+
+        return {
+            "ward_vintage": vintage,
+            "method": rows[0].method if rows else None,
+            "cluster_count": len(profiles),
+            "profiles": [
+                {
+                    "cluster_id": p.cluster_id,
+                    "label": p.label,
+                    "ward_count": p.ward_count,
+                    "latest_margin": p.latest_margin,
+                    "margin_shift": p.margin_shift,
+                    **p.profile,
+                }
+                for p in profiles
+            ],
+            "data": {row.ward_id: row.cluster_id for row in rows},
+        }
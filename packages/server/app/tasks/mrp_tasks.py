@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from pathlib import Path
+from typing import get_args
 
 from app.core.celery_app import celery_app
+from app.election_models.mrp_storage import FitMethod
 
 logger = logging.getLogger(__name__)
 
@@ -38,24 +41,59 @@ def fit_mrp_model_task(
     year: int,
     race_type: str,
     draws: int = 2000,
-    tune: int = 1000,
+    tune: int | None = None,
+    chains: int = 2,
+    method: FitMethod = "nuts",
+    replace_exact: bool = False,
+    warm_start: str | None = None,
+    informative_priors: bool = False,
 ) -> dict:
     """Async Celery task to fit an MRP model.
 
     This runs in the Celery worker process (not the async FastAPI process),
-    so it uses sync database access via psycopg2.
+    so it uses sync database access via psycopg2. An approximate fit
+    (method "advi" or "pathfinder") does not replace an existing NUTS fit
+    unless replace_exact is set.
+
+    warm_start ("same", "previous" or "{race_type}_{year}", see
+    mrp_storage.resolve_warm_start) starts NUTS from an earlier fit; tune
+    then defaults to WARM_START_TUNE instead of 1000.
     """
     import pandas as pd
     import psycopg2
 
     from app.election_models.mrp_model import (
+        WARM_START_TUNE,
         fit_mrp_model,
         get_diagnostics,
+        load_warm_start,
+    )
+    from app.election_models.mrp_predict import category_levels
+    from app.election_models.mrp_progress import SamplingProgress
+    from app.election_models.mrp_storage import (
+        APPROXIMATE_METHODS,
+        fitted_method,
+        resolve_warm_start,
+        save_trace,
     )
-    from app.election_models.mrp_storage import save_trace
+
+    # Task arguments arrive as JSON, so the Literal type is not enforced
+    if method not in get_args(FitMethod):
+        return {"status": "failed", "error": f"Unknown fit method: {method}"}
 
     ward_vintage = 2022 if year >= 2022 else 2020
 
+    if (
+        method in APPROXIMATE_METHODS
+        and not replace_exact
+        and fitted_method(race_type, year, ward_vintage) == "nuts"
+    ):
+        return {
+            "status": "failed",
+            "error": f"{race_type} {year} already has a NUTS fit; "
+            "set replace_exact to overwrite it with an approximation",
+        }
+
     # Use sync DB connection (Celery worker)
     db_url = os.environ.get(
         "DATABASE_URL",
@@ -63,6 +101,7 @@ def fit_mrp_model_task(
     )
     db_url = db_url.replace("+asyncpg", "").replace("+psycopg2", "")
 
+    started = time.perf_counter()
     self.update_state(state="PROGRESS", meta={"step": "loading_data"})
 
     conn = psycopg2.connect(db_url)
@@ -102,22 +141,55 @@ def fit_mrp_model_task(
 
     df["region"] = df["county"].apply(_county_to_region)
 
-    self.update_state(
-        state="PROGRESS",
-        meta={"step": "fitting", "ward_count": len(df)},
-    )
-
+    start = None
+    if warm_start:
+        source = resolve_warm_start(race_type, year, warm_start)
+        if source is None:
+            return {
+                "status": "failed",
+                "error": f"No fitted model to warm-start from ({warm_start})",
+            }
+        start = load_warm_start(
+            source["race_type"], source["year"], source["ward_vintage"],
+            informative_priors=informative_priors,
+        )
+    if tune is None:
+        tune = WARM_START_TUNE if start is not None else 1000
+    loaded = time.perf_counter()
+
+    fitting_meta = {"step": "fitting", "method": method, "ward_count": len(df)}
+    self.update_state(state="PROGRESS", meta=fitting_meta)
+
+    def report(snapshot: dict) -> None:
+        self.update_state(
+            state="PROGRESS", meta={**fitting_meta, "sampling": snapshot}
+        )
+
+    progress = SamplingProgress(chains, tune, draws, report)
     try:
-        trace = fit_mrp_model(df, draws=draws, tune=tune, chains=2)
+        trace = fit_mrp_model(
+            df, draws=draws, tune=tune, chains=chains, method=method,
+            warm_start=start, progress=progress,
+        )
     except Exception as e:
         logger.exception("MRP fitting failed for %s %s", race_type, year)
         return {"status": "failed", "error": str(e)}
+    fitted = time.perf_counter()
 
     diag = get_diagnostics(trace)
+    diag["timings"] = {
+        "load_seconds": round(loaded - started, 1),
+        **progress.timings(),
+        "fit_seconds": round(fitted - loaded, 1),
+        "diagnostics_seconds": round(time.perf_counter() - fitted, 1),
+    }
 
     self.update_state(state="PROGRESS", meta={"step": "saving"})
 
-    save_trace(trace, race_type, year, ward_vintage, metadata=diag)
+    save_trace(
+        trace, race_type, year, ward_vintage,
+        metadata=diag, categories=category_levels(df),
+    )
 
     return {
         "status": "success",
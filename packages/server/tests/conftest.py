@@ -9,6 +9,21 @@ from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 from app.core.database import engine
+from app.core.rate_limit import RateLimitMiddleware
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    """Give every test a fresh rate-limit window.
+
+    All test requests come from the same client address, so without this
+    the suite as a whole trips the 30 req/min limit on expensive paths.
+    """
+    layer = app.middleware_stack  # built on the first request
+    while layer is not None:
+        if isinstance(layer, RateLimitMiddleware):
+            layer.reset()
+        layer = getattr(layer, "app", None)
 
 
 @pytest.fixture
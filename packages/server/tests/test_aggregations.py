@@ -0,0 +1,145 @@
+"""Tests for aggregation API endpoints."""
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_all_districts_unknown_type(client):
+    response = await client.get("/api/v1/aggregations/district/county/2020/president")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["district_count"] == 0
+    assert data["districts"] == []
+
+
+@pytest.mark.asyncio
+async def test_all_districts_bulk(client):
+    response = await client.get(
+        "/api/v1/aggregations/district/congressional/2020/president"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["district_count"] == len(data["districts"])
+    ids = [d["district_id"] for d in data["districts"]]
+    assert ids == sorted(ids)
+    for district in data["districts"]:
+        assert district["ward_count"] > 0
+
+
+@pytest.mark.asyncio
+async def test_single_district_matches_bulk(client):
+    bulk = await client.get("/api/v1/aggregations/district/assembly/2020/president")
+    districts = bulk.json()["districts"]
+    if not districts:
+        pytest.skip("no precomputed district aggregations")
+    first = districts[0]
+    response = await client.get(
+        f"/api/v1/aggregations/district/assembly/{first['district_id']}"
+        "/2020/president"
+    )
+    assert response.status_code == 200
+    assert response.json()["total_votes"] == first["total_votes"]
+
+
+@pytest.mark.asyncio
+async def test_custom_region_requires_selection(client):
+    response = await client.post("/api/v1/aggregations/custom", json={})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_custom_region_rejects_non_polygon(client):
+    response = await client.post(
+        "/api/v1/aggregations/custom",
+        json={"geometry": {"type": "Point", "coordinates": [-89.4, 43.07]}},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "coordinates",
+    [
+        [[[-89.5, 43.0], [-89.3, 43.0], [-89.3, 43.2], [-89.5, 43.2]]],  # open
+        [[[-89.5, 43.0], [-89.3, 43.0], [-89.5, 43.0]]],  # too few positions
+        [[[-89.5, 43.0], ["x", 43.0], [-89.3, 43.2], [-89.5, 43.0]]],
+        [[-89.5, 43.0, -89.3, 43.0]],  # not a list of rings
+    ],
+)
+async def test_custom_region_rejects_malformed_polygon(client, coordinates):
+    response = await client.post(
+        "/api/v1/aggregations/custom",
+        json={"geometry": {"type": "Polygon", "coordinates": coordinates}},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_custom_region_ward_list(client):
+    response = await client.post(
+        "/api/v1/aggregations/custom",
+        json={"ward_ids": ["not-a-ward"], "race_type": "president"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["unmatched_ward_ids"] == ["not-a-ward"]
+    assert data["ward_count"] == 0
+    assert data["elections"] == []
+
+
+@pytest.mark.asyncio
+async def test_custom_region_uses_each_elections_vintage(client):
+    madison = [[
+        [-89.45, 43.05], [-89.35, 43.05], [-89.35, 43.1], [-89.45, 43.1],
+        [-89.45, 43.05],
+    ]]
+    response = await client.post(
+        "/api/v1/aggregations/custom",
+        json={
+            "geometry": {"type": "Polygon", "coordinates": madison},
+            "race_type": "president",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ward_count"] > 0
+    vintages = {e["year"]: e["ward_vintage"] for e in data["elections"]}
+    # 2024 is only reported on the 2025 boundaries, 2020 on older ones
+    assert vintages[2024] == 2025
+    assert vintages[2020] < 2025
+
+
+@pytest.mark.asyncio
+async def test_rollup_unknown_level(client):
+    response = await client.get(
+        "/api/v1/aggregations/precinct?year=2020&race_type=president"
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_rollup_level_requires_election(client):
+    response = await client.get("/api/v1/aggregations/county")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_rollup_municipality_bulk(client):
+    response = await client.get(
+        "/api/v1/aggregations/municipality?year=2020&race_type=president"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["key_count"] == len(data["results"])
+    for row in data["results"]:
+        assert ", " in row["key"]
+
+
+@pytest.mark.asyncio
+async def test_rollup_statewide_all_elections(client):
+    response = await client.get("/api/v1/aggregations/statewide/WI")
+    if response.status_code == 404:
+        pytest.skip("no precomputed aggregations")
+    data = response.json()
+    assert data["election_count"] == len(data["elections"])
+    years = [e["year"] for e in data["elections"]]
+    assert years == sorted(years)
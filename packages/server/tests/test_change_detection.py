@@ -0,0 +1,82 @@
+"""Tests for incremental aggregation change sets (no database required)."""
+import numpy as np
+
+from app.election_models.change_set import (
+    changed_wards,
+    diff_fingerprints,
+    rewrite_scope,
+)
+
+STORED = {
+    (2022, 2022, "governor"): (100, "aaa"),
+    (2022, 2024, "president"): (100, "bbb"),
+    (2022, 2024, "assembly"): (80, "ccc"),
+}
+
+
+def test_unchanged():
+    changed, removed = diff_fingerprints(dict(STORED), STORED)
+    assert changed == set()
+    assert removed == set()
+    assert rewrite_scope(changed, removed) == (set(), set())
+
+
+def test_added_election():
+    current = {**STORED, (2022, 2024, "senate"): (100, "ddd")}
+    changed, removed = diff_fingerprints(current, STORED)
+    assert changed == {(2022, 2024, "senate")}
+    assert removed == set()
+    assert rewrite_scope(changed, removed) == (set(), {"senate"})
+
+
+def test_changed_election():
+    current = {**STORED, (2022, 2024, "president"): (100, "bbb2")}
+    changed, removed = diff_fingerprints(current, STORED)
+    assert changed == {(2022, 2024, "president")}
+    assert removed == set()
+
+    # A row count change with the same checksum is a change too
+    current = {**STORED, (2022, 2022, "governor"): (101, "aaa")}
+    assert diff_fingerprints(current, STORED)[0] == {(2022, 2022, "governor")}
+
+
+def test_removed_election_rewrites_race_type():
+    current = dict(STORED)
+    del current[(2022, 2024, "assembly")]
+    current[(2022, 2024, "president")] = (100, "bbb2")
+    changed, removed = diff_fingerprints(current, STORED)
+    assert changed == {(2022, 2024, "assembly"), (2022, 2024, "president")}
+    assert removed == {(2022, 2024, "assembly")}
+    assert rewrite_scope(changed, removed) == ({"assembly"}, {"president"})
+
+
+def test_full_rebuild():
+    current = {**STORED, (2022, 2024, "senate"): (100, "ddd")}
+    changed, removed = diff_fingerprints(current, STORED, full=True)
+    assert changed == set(current)
+    assert removed == set()
+    whole, partial = rewrite_scope(changed, removed, full=True)
+    assert whole == {"governor", "president", "assembly", "senate"}
+    assert partial == set()
+
+
+def test_changed_wards():
+    ward_ids = np.array(["w1", "w2", "w3"])
+    elections = [(2022, "governor"), (2024, "president"), (2024, "senate")]
+    present = np.array([
+        [True, True, False],
+        [True, False, True],
+        [False, True, True],
+    ])
+    changed = {(2022, 2024, "president"), (2022, 2024, "senate")}
+
+    wards = changed_wards(
+        2022, ward_ids, elections, present, changed, {"president", "governor"}
+    )
+    # senate is rewritten whole, so it is not tracked per ward
+    assert wards == {"president": {"w1", "w3"}, "governor": set()}
+
+    # Keys are per vintage
+    assert changed_wards(
+        2020, ward_ids, elections, present, changed, {"president"}
+    ) == {"president": set()}
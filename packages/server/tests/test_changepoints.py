@@ -0,0 +1,52 @@
+"""Tests for the vectorized changepoint kernel (no database required)."""
+import numpy as np
+import pytest
+
+from app.election_models.changepoints import detect_changepoints
+
+YEARS = np.array([2008, 2010, 2012, 2014, 2016, 2018, 2020, 2022])
+
+
+def test_constant_series_has_no_break():
+    values = np.full((2, len(YEARS)), 100.0) * [[1], [-1]]
+    fit = detect_changepoints(YEARS, values)
+    assert fit.valid.all()
+    assert (fit.f_stat == 0.0).all()
+    assert (fit.p_value == 1.0).all()
+    assert fit.magnitude == pytest.approx([0.0, 0.0], abs=1e-9)
+
+
+def test_linear_series_has_no_break():
+    fit = detect_changepoints(YEARS, (2.0 * YEARS - 4000.0)[None, :])
+    assert fit.valid[0]
+    assert fit.f_stat[0] == 0.0
+    assert fit.p_value[0] == 1.0
+    assert fit.slope[0] == pytest.approx(2.0)
+
+
+def test_exact_one_step_shift():
+    values = np.where(YEARS >= 2016, -10.0, 20.0)
+    fit = detect_changepoints(YEARS, values[None, :])
+    assert fit.valid[0]
+    assert fit.break_year[0] == 2016
+    assert fit.magnitude[0] == pytest.approx(-30.0)
+    assert fit.f_stat[0] == np.inf
+    assert fit.p_value[0] < 1e-6
+
+
+def test_noisy_shift_ranks_above_flat_series():
+    rng = np.random.default_rng(1)
+    shifted = np.where(YEARS >= 2016, -10.0, 20.0) + rng.normal(0, 2, len(YEARS))
+    flat = np.full(len(YEARS), 100.0)
+    fit = detect_changepoints(YEARS, np.vstack([shifted, flat]))
+    assert fit.break_year[0] == 2016
+    assert fit.p_value[0] < 0.05
+    assert fit.p_value[0] < fit.p_value[1]
+
+
+def test_too_short_series_is_invalid():
+    values = np.full(len(YEARS), np.nan)
+    values[:4] = [1.0, 5.0, 20.0, 25.0]
+    fit = detect_changepoints(YEARS, values[None, :])
+    assert not fit.valid[0]
+    assert np.isnan(fit.p_value[0])
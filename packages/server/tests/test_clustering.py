@@ -0,0 +1,109 @@
+"""Tests for ward trajectory clustering (no database required)."""
+import numpy as np
+import pytest
+
+from app.election_models.clustering import (
+    _archetype_label,
+    cluster_trajectories,
+    trajectory_features,
+)
+
+# Three archetypes over four elections, 5 wards each: safe D, a ward
+# trending R from competitive, and safe R
+SAFE_D = [30.0, 30.0, 32.0, 31.0]
+SWING = [4.0, 0.0, -6.0, -10.0]
+SAFE_R = [-35.0, -36.0, -34.0, -35.0]
+
+
+def make_wards(rng):
+    margin = np.vstack([
+        np.array(center) + rng.normal(0, 0.5, (5, 4))
+        for center in (SAFE_R, SAFE_D, SWING)
+    ])
+    total = np.full(margin.shape, 500.0)
+    return margin, total
+
+
+@pytest.mark.parametrize("method", ["kmeans", "hierarchical"])
+def test_recovers_archetypes_ordered_d_to_r(method):
+    margin, total = make_wards(np.random.default_rng(0))
+    result = cluster_trajectories(margin, total, n_clusters=3, method=method)
+
+    # Rows 0-4 are safe R, 5-9 safe D, 10-14 the swing wards
+    assert result.labels.tolist() == [2] * 5 + [0] * 5 + [1] * 5
+    assert [p["cluster_id"] for p in result.profiles] == [0, 1, 2]
+    assert [p["ward_count"] for p in result.profiles] == [5, 5, 5]
+    assert [p["label"] for p in result.profiles] == [
+        "Safe D, stable",
+        "Lean R, trending R",
+        "Safe R, stable",
+    ]
+
+
+def test_profiles_are_cluster_means():
+    margin, total = make_wards(np.random.default_rng(1))
+    result = cluster_trajectories(margin, total, n_clusters=3)
+
+    for profile in result.profiles:
+        members = margin[result.labels == profile["cluster_id"]]
+        expected = members.mean(axis=0)
+        assert profile["margin_trajectory"] == pytest.approx(expected, abs=0.01)
+        assert profile["latest_margin"] == pytest.approx(expected[-1], abs=0.01)
+        assert profile["margin_shift"] == pytest.approx(
+            expected[-1] - expected[0], abs=0.01
+        )
+        assert profile["turnout_trajectory"] == pytest.approx([1.0] * 4)
+
+
+def test_distances_are_to_own_centroid():
+    margin, total = make_wards(np.random.default_rng(2))
+    result = cluster_trajectories(margin, total, n_clusters=3)
+    features = trajectory_features(margin, total)
+
+    for cluster in range(3):
+        members = features[result.labels == cluster]
+        expected = np.linalg.norm(members - members.mean(axis=0), axis=1)
+        np.testing.assert_allclose(result.distances[result.labels == cluster], expected)
+
+
+def test_missing_results_ignored_in_profiles():
+    margin, total = make_wards(np.random.default_rng(3))
+    margin[10, 3] = np.nan  # one swing ward missing the last election
+    result = cluster_trajectories(margin, total, n_clusters=3)
+
+    swing = result.profiles[1]
+    assert swing["margin_trajectory"][3] == pytest.approx(
+        margin[11:15, 3].mean(), abs=0.01
+    )
+
+
+def test_turnout_features_follow_shape_not_size():
+    margin = np.zeros((2, 3))
+    total = np.array([[100.0, 200.0, 300.0], [1000.0, 2000.0, 3000.0]])
+    features = trajectory_features(margin, total)
+
+    # Same relative turnout trajectory, so identical features
+    np.testing.assert_allclose(features[0], features[1])
+
+
+def test_more_clusters_than_wards():
+    margin = np.array([[10.0, 12.0, 14.0], [-10.0, -12.0, -14.0]])
+    result = cluster_trajectories(margin, np.full((2, 3), 100.0), n_clusters=8)
+
+    assert len(result.profiles) == 2
+    assert result.labels.tolist() == [0, 1]
+
+
+@pytest.mark.parametrize(
+    ("latest", "shift", "label"),
+    [
+        (None, 0.0, "Unknown"),
+        (15.0, 0.0, "Safe D, stable"),
+        (5.0, 5.0, "Lean D, trending D"),
+        (0.0, -5.0, "Competitive, trending R"),
+        (-5.0, 4.9, "Lean R, stable"),
+        (-15.0, -20.0, "Safe R, trending R"),
+    ],
+)
+def test_archetype_label_thresholds(latest, shift, label):
+    assert _archetype_label(latest, shift) == label
@@ -0,0 +1,28 @@
+"""Tests for the compute pool's request deadline (no database required)."""
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.compute_pool import (
+    ComputeTimeoutError,
+    compute_deadline,
+    run_compute,
+)
+
+
+async def test_calls_share_the_request_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "compute_timeout_seconds", 0.3)
+    deadline = compute_deadline()
+
+    assert await run_compute(lambda: time.sleep(0.2) or 1, deadline=deadline) == 1
+    # Each call alone would fit in 0.3s, but together they exceed it
+    with pytest.raises(ComputeTimeoutError):
+        await run_compute(time.sleep, 0.2, deadline=deadline)
+
+
+async def test_expired_deadline_does_not_submit():
+    calls = []
+    with pytest.raises(ComputeTimeoutError):
+        await run_compute(calls.append, 1, deadline=time.monotonic() - 1)
+    assert calls == []
@@ -0,0 +1,50 @@
+"""Tests for sparse district assignment (no database required)."""
+import numpy as np
+
+from app.election_models.districting import build_assignment, district_totals
+
+
+def test_district_ids_sort_numerically():
+    assignment = build_assignment(["10", "2", "1", "2", "10"])
+
+    assert assignment.district_ids == ["1", "2", "10"]
+    assert assignment.codes.tolist() == [2, 1, 0, 1, 2]
+    assert assignment.n_districts == 3
+    assert assignment.ward_counts().tolist() == [1, 2, 2]
+
+
+def test_mixed_ids_sort_numbers_first_then_lexically():
+    assignment = build_assignment(["B", "10", "A", "9"])
+
+    assert assignment.district_ids == ["9", "10", "A", "B"]
+
+
+def test_unassigned_wards():
+    assignment = build_assignment(["1", None, "", "1", "2"])
+
+    assert assignment.codes.tolist() == [0, -1, -1, 0, 1]
+    assert assignment.ward_counts().tolist() == [2, 1]
+    # Unassigned wards have an empty column in the sparse matrix
+    dense = assignment.matrix.toarray()
+    assert dense.tolist() == [[1, 0, 0, 1, 0], [0, 0, 0, 0, 1]]
+
+
+def test_district_totals_sum_wards_per_election():
+    assignment = build_assignment(["2", "1", None, "2"])
+    dem = np.array([[10, 1], [20, 2], [30, 3], [40, 4]])
+    present = np.array([[True, True], [True, False], [True, True], [False, True]])
+    totals = district_totals(assignment, {"dem": dem, "present": present})
+
+    assert set(totals) == {"dem", "present"}
+    assert totals["dem"].tolist() == [[20, 2], [50, 5]]
+    assert totals["present"].tolist() == [[1, 0], [1, 2]]
+    assert totals["dem"].dtype == np.int64
+
+
+def test_no_assigned_wards():
+    assignment = build_assignment([None, None])
+    totals = district_totals(assignment, {"dem": np.ones((2, 3), dtype=np.int64)})
+
+    assert assignment.district_ids == []
+    assert assignment.ward_counts().tolist() == []
+    assert totals["dem"].shape == (0, 3)
@@ -0,0 +1,74 @@
+"""Tests for the partisan-fairness kernels (no database required)."""
+import numpy as np
+import pytest
+
+from app.election_models.districting import build_assignment
+from app.election_models.fairness import (
+    evaluate_fairness,
+    plan_metrics,
+    seat_vote_curve,
+)
+
+# One ward per district, plus a ward left out of the plan. Two-party
+# shares: district 1 70% D, 2 40%, 3 45%, 4 tied at 50%
+ASSIGNMENT = build_assignment(["1", "2", "3", "4", None])
+DEM = np.array([700, 400, 450, 500, 0])
+REP = np.array([300, 600, 550, 500, 1000])
+TOTAL = DEM + REP
+
+
+def test_plan_metrics_by_hand():
+    metrics = plan_metrics(DEM[:4], REP[:4])
+
+    # Wasted D: 200 (surplus in 1) + 400 + 450 (losses) + 250 (tie);
+    # wasted R: 300 (loss) + 100 + 50 (surplus) + 250 (tie)
+    assert metrics.efficiency_gap == pytest.approx((700 - 1300) / 4000)
+    # Shares .70 .40 .45 .50: median .475, mean .5125
+    assert metrics.mean_median == pytest.approx(0.475 - 0.5125)
+    assert metrics.dem_vote_share == pytest.approx(0.5125)
+    assert metrics.seats == 4
+    assert metrics.dem_seats == 1  # the tied district is not a D seat
+    np.testing.assert_allclose(metrics.district_dem_share, [0.7, 0.4, 0.45, 0.5])
+
+
+def test_tie_leaves_the_efficiency_gap_unchanged():
+    without_tie = plan_metrics(DEM[:3], REP[:3])
+    with_tie = plan_metrics(DEM[:4], REP[:4])
+
+    # Scale out the extra 1000 two-party votes the tie adds
+    assert with_tie.efficiency_gap * 4000 == pytest.approx(
+        without_tie.efficiency_gap * 3000
+    )
+
+
+def test_uncontested_districts_are_not_seats():
+    metrics = plan_metrics(np.array([60, 0]), np.array([40, 0]))
+
+    assert metrics.seats == 1
+    assert np.isnan(metrics.district_dem_share[1])
+
+
+def test_seat_vote_curve_by_hand():
+    curve = seat_vote_curve(ASSIGNMENT, DEM, REP, TOTAL, np.array([0.0, 5.0, 10.0]))
+
+    # +5 points: 75/45/50/55 -> districts 1 and 4 (3 is now tied);
+    # +10 points: 80/50/55/60 -> 1, 3 and 4 (2 is tied)
+    assert curve.dem_seats.tolist() == [1, 2, 3]
+    np.testing.assert_allclose(curve.seat_share, [0.25, 0.5, 0.75])
+    # Statewide share counts only wards in the plan
+    np.testing.assert_allclose(curve.dem_vote_share, [0.5125, 0.5625, 0.6125])
+
+
+def test_partisan_bias_at_an_even_statewide_vote():
+    metrics, curve = evaluate_fairness(
+        ASSIGNMENT, DEM, REP, TOTAL, np.array([-1.0, 0.0, 1.0])
+    )
+
+    # Swinging -1.25 points to 50% leaves 68.75/38.75/43.75/48.75:
+    # one D seat of four
+    assert metrics.partisan_bias == pytest.approx(0.25 - 0.5)
+    assert metrics.efficiency_gap == pytest.approx(-0.15)
+    # The extra even-vote swing is not part of the returned curve
+    assert curve.swing.tolist() == [-1.0, 0.0, 1.0]
+    # +1 point tips the tied district to D
+    assert curve.dem_seats.tolist() == [1, 1, 2]
@@ -0,0 +1,125 @@
+"""Tests for the next-election forecast kernels (no database required)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from app.election_models.forecast import forecast_series, next_election_year
+from app.election_models.ward_series import stack_vintages
+
+YEARS = np.array([2016, 2020, 2024])
+T_80_DF1 = stats.t.ppf(0.9, 1)  # 3.0777
+
+
+def test_equal_weights_match_ordinary_least_squares():
+    # half_life=inf weighs every election 1. Margins 0, 6, 6:
+    # slope 24/32 = 0.75 through (2020, 4), so 2028 -> 4 + 0.75*8 = 10;
+    # residuals -1, 2, -1 give sigma² = 6/1 and
+    # se² = 6 * (1 + 1/3 + 8²/32) = 20
+    fit = forecast_series(
+        YEARS, np.array([[0.0, 6.0, 6.0]]), np.array([2028]), half_life=np.inf
+    )
+
+    assert fit.valid.tolist() == [True]
+    assert fit.point[0] == pytest.approx(10.0)
+    assert fit.lower[0] == pytest.approx(10.0 - T_80_DF1 * np.sqrt(20))
+    assert fit.upper[0] == pytest.approx(10.0 + T_80_DF1 * np.sqrt(20))
+    assert fit.n.tolist() == [3]
+
+
+def test_recency_weights_halve_each_election_back():
+    # half_life=1: weights 1/4, 1/2, 1 (sum 7/4). In years since 2016,
+    # x̄ = 10/(7/4) = 40/7 and ȳ = 9/(7/4) = 36/7; s_xx = 728/49,
+    # s_xy = 420/49, so slope = 15/26 and 2028 (x = 12) gives
+    # 36/7 + 15/26 * 44/7 = 798/91. Residuals -24/13, 24/13, -6/13 give a
+    # weighted sigma² of 36/13 and se² = 36/13 * (1 + 4/7 + 242/91) = 1980/169
+    fit = forecast_series(
+        YEARS, np.array([[0.0, 6.0, 6.0]]), np.array([2028]), half_life=1.0
+    )
+
+    half_width = T_80_DF1 * np.sqrt(1980) / 13
+    assert fit.point[0] == pytest.approx(798 / 91)
+    assert fit.lower[0] == pytest.approx(798 / 91 - half_width)
+    assert fit.upper[0] == pytest.approx(798 / 91 + half_width)
+
+
+def test_exact_line_has_a_zero_width_interval():
+    fit = forecast_series(
+        YEARS, np.array([[-8.0, -4.0, 0.0]]), np.array([2028]), level=0.95
+    )
+
+    assert fit.point[0] == pytest.approx(4.0)
+    assert fit.lower[0] == pytest.approx(4.0)
+    assert fit.upper[0] == pytest.approx(4.0)
+
+
+def test_missing_years_are_skipped_and_weights_follow_own_history():
+    years = np.array([2012, 2016, 2020, 2024])
+    values = np.array([
+        [np.nan, 0.0, 6.0, 6.0],
+        [0.0, 6.0, 6.0, np.nan],
+    ])
+    fit = forecast_series(years, values, np.array([2028, 2024]), half_life=1.0)
+
+    # Both rows are the weighted case above: a leading gap is ignored, and
+    # row 1's last election (2020) gets weight 1 despite the missing 2024
+    half_width = T_80_DF1 * np.sqrt(1980) / 13
+    assert fit.n.tolist() == [3, 3]
+    np.testing.assert_allclose(fit.point, [798 / 91] * 2)
+    np.testing.assert_allclose(fit.upper, [798 / 91 + half_width] * 2)
+
+
+@pytest.mark.parametrize(
+    ("values", "target"),
+    [
+        ([[np.nan, 1.0, 2.0]], 2028),  # fewer than min_points
+        ([[1.0, 2.0, 3.0]], 0),  # no target year
+    ],
+)
+def test_invalid_rows(values, target):
+    fit = forecast_series(YEARS, np.array(values), np.array([target]))
+
+    assert fit.valid.tolist() == [False]
+    assert np.isnan(fit.point[0]) and np.isnan(fit.lower[0])
+    assert fit.target_year.tolist() == [0]
+
+
+def test_next_election_year_uses_each_wards_last_gap():
+    years = np.array([2014, 2016, 2018, 2020, 2022, 2024])
+    present = np.array([
+        [True, True, True, True, True, True],  # every cycle -> 2026
+        [True, False, True, False, True, False],  # staggered senate -> 2026
+        [False, True, False, True, False, True],  # presidential -> 2028
+        [True, False, False, True, False, False],  # 2014, 2020 -> 2026
+        [False, False, False, False, False, True],  # single election
+        [False, False, False, False, False, False],  # none
+    ])
+
+    assert next_election_year(years, present).tolist() == [
+        2026, 2026, 2028, 2026, 0, 0,
+    ]
+
+
+def one_ward(vintage, elections, dem_pct):
+    dem = np.array([dem_pct])
+    return SimpleNamespace(
+        vintage=vintage,
+        ward_ids=np.array(["W1"]),
+        elections=elections,
+        total=np.full(dem.shape, 100),
+        present=np.ones(dem.shape, dtype=bool),
+        margin=lambda: 2.0 * dem - 100,
+    )
+
+
+def test_cross_vintage_series_targets_the_next_cycle():
+    # 2016/2020 reported on 2020 boundaries, 2024 only in the 2025 vintage
+    old = one_ward(2020, [(2016, "president"), (2020, "president")], [60, 40])
+    new = one_ward(2025, [(2024, "president")], [70])
+    series = stack_vintages([old, new], "president")
+
+    target = next_election_year(series.years, ~np.isnan(series.margin))
+    assert target.tolist() == [2028]
+    fit = forecast_series(series.years, series.margin, target)
+    assert fit.valid.tolist() == [True]
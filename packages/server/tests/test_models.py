@@ -0,0 +1,89 @@
+"""Tests for model API endpoints."""
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_mrp_scenarios_unknown_adjustment(client):
+    response = await client.post(
+        "/api/v1/models/mrp/scenarios",
+        json={
+            "year": 2020,
+            "race_type": "president",
+            "scenarios": [{"swing": 2}],
+        },
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_mrp_scenarios_empty(client):
+    response = await client.post(
+        "/api/v1/models/mrp/scenarios",
+        json={"year": 2020, "race_type": "president"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_mrp_scenarios_grid_too_large(client):
+    response = await client.post(
+        "/api/v1/models/mrp/scenarios",
+        json={
+            "year": 2020,
+            "race_type": "president",
+            "grid": {
+                "collegeShift": list(range(20)),
+                "turnoutChange": list(range(20)),
+            },
+        },
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_mrp_outcomes_invalid_level(client):
+    response = await client.post(
+        "/api/v1/models/mrp/outcomes",
+        json={"year": 2020, "race_type": "president", "levels": ["ward"]},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_mrp_outcomes_too_many_samples(client):
+    response = await client.post(
+        "/api/v1/models/mrp/outcomes",
+        json={"year": 2020, "race_type": "president", "n_samples": 100000},
+    )
+    assert response.status_code == 422
+
+
+MRP_PREDICT = {
+    "model_id": "mrp",
+    "parameters": {"baseElectionYear": 2020, "baseRaceType": "president"},
+}
+
+
+@pytest.mark.asyncio
+async def test_mrp_predict_busy(client, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "compute_max_pending", 0)
+    response = await client.post("/api/v1/models/predict", json=MRP_PREDICT)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_mrp_predict_timeout(client, monkeypatch):
+    import time
+
+    from app.core.config import settings
+    from app.services import mrp_service
+
+    monkeypatch.setattr(settings, "compute_timeout_seconds", 0.05)
+    monkeypatch.setattr(
+        mrp_service, "get_posterior", lambda *args: time.sleep(0.5)
+    )
+    response = await client.post("/api/v1/models/predict", json=MRP_PREDICT)
+    assert response.status_code == 504
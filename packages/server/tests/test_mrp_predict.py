@@ -0,0 +1,303 @@
+"""Tests for vectorized MRP prediction (no database or PyMC required)."""
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.special import expit
+
+from app.election_models.mrp_predict import (
+    ADJUSTMENT_MAP,
+    COVARIATES,
+    GROUP_COLUMNS,
+    build_design,
+    predict_mrp,
+    predict_outcomes,
+    predict_scenarios,
+    prepare_ward_df,
+)
+from app.election_models.mrp_storage import MrpPosterior
+
+# Fit-time levels, deliberately not in the data's sorted order. "Vilas"
+# appears only in the prediction data.
+FIT_COUNTIES = ["Milwaukee", "Dane", "Brown"]
+FIT_REGIONS = ["rural", "milwaukee_metro", "madison_metro", "fox_valley"]
+
+ALL_ADJUSTMENTS = {
+    "turnoutChange": 7.5,
+    "collegeShift": 3.0,
+    "urbanShift": -2.0,
+    "ruralShift": 4.0,
+    "incomeShift": -1.5,
+}
+
+
+@pytest.fixture
+def posterior():
+    rng = np.random.default_rng(7)
+    n = 400
+    return MrpPosterior(
+        intercept=rng.normal(0, 0.3, n),
+        beta=rng.normal(0, 0.5, (n, len(COVARIATES))),
+        county_effect=rng.normal(0, 0.4, (n, len(FIT_COUNTIES))),
+        region_effect=rng.normal(0, 0.2, (n, len(FIT_REGIONS))),
+        counties=FIT_COUNTIES,
+        regions=FIT_REGIONS,
+    )
+
+
+@pytest.fixture
+def ward_df():
+    rng = np.random.default_rng(11)
+    n = 60
+    counties = rng.choice(["Milwaukee", "Dane", "Brown", "Vilas"], n)
+    region_of = {
+        "Milwaukee": "milwaukee_metro",
+        "Dane": "madison_metro",
+        "Brown": "fox_valley",
+        "Vilas": "rural",
+    }
+    dem = rng.integers(0, 2000, n)
+    rep = rng.integers(0, 2000, n)
+    return pd.DataFrame({
+        "ward_id": [f"W{i:03d}" for i in range(n)],
+        "county": counties,
+        "region": [region_of[c] for c in counties],
+        "population_density": rng.choice([100.0, 1500.0, 8000.0], n),
+        "college_degree_pct": rng.uniform(0.1, 0.6, n),
+        "median_household_income": rng.uniform(30_000, 120_000, n),
+        "white_pct": rng.uniform(0.3, 0.95, n),
+        "dem_votes": dem,
+        "rep_votes": rep,
+        "total_votes": dem + rep + rng.integers(0, 100, n),
+        "congressional_district": [str(i % 3 + 1) for i in range(n)],
+    })
+
+
+def reference_effects(posterior, df, draw):
+    """County + region effect of every ward for one posterior draw."""
+    county_col = {c: i for i, c in enumerate(posterior.counties)}
+    region_col = {r: i for i, r in enumerate(posterior.regions)}
+    county = posterior.county_effect[draw]
+    region = posterior.region_effect[draw]
+    return np.array([
+        (county[county_col[c]] if c in county_col else 0.0)
+        + (region[region_col[r]] if r in region_col else 0.0)
+        for c, r in zip(df["county"], df["region"], strict=True)
+    ])
+
+
+def reference_shifts(df, adjustments):
+    """Coefficient shift and per-ward logit shift of an adjustment set."""
+    beta_shift = np.zeros(len(COVARIATES))
+    for name, idx in ADJUSTMENT_MAP.items():
+        beta_shift[idx] += adjustments.get(name, 0) * 0.04
+    density = df["population_density"].values
+    ward_shift = np.zeros(len(df))
+    for i in range(len(df)):
+        if density[i] > 3000:
+            ward_shift[i] += adjustments.get("urbanShift", 0) * 0.04
+        elif density[i] < 500:
+            ward_shift[i] += adjustments.get("ruralShift", 0) * 0.04
+    return beta_shift, ward_shift
+
+
+def reference_predict(posterior, ward_df, adjustments, n_samples=500):
+    """Per-sample, per-ward loop equivalent of predict_mrp."""
+    df = prepare_ward_df(ward_df)
+    X = df[COVARIATES].values.astype(np.float64)  # noqa: N806
+
+    def effects(draw):
+        return reference_effects(posterior, df, draw)
+
+    beta_shift, ward_shift = reference_shifts(df, adjustments)
+
+    mean_effects = np.mean([effects(d) for d in range(posterior.n_samples)], axis=0)
+    mu = (
+        posterior.intercept.mean()
+        + X @ (posterior.beta.mean(axis=0) + beta_shift)
+        + mean_effects
+        + ward_shift
+    )
+    share = expit(mu)
+
+    sample_idx = np.linspace(
+        0, posterior.n_samples - 1, min(n_samples, posterior.n_samples), dtype=int
+    )
+    mu_samples = np.zeros((len(sample_idx), len(df)))
+    for si, draw in enumerate(sample_idx):
+        mu_samples[si] = (
+            posterior.intercept[draw]
+            + X @ (posterior.beta[draw] + beta_shift)
+            + effects(draw)
+            + ward_shift
+        )
+    share_samples = expit(mu_samples)
+    lower = np.percentile(share_samples, 5, axis=0)
+    upper = np.percentile(share_samples, 95, axis=0)
+
+    multiplier = 1 + adjustments.get("turnoutChange", 0) / 100
+    predictions = {}
+    for i, row in enumerate(df.itertuples()):
+        projected_total = max(1, round(row.total_votes * multiplier))
+        two_party = max(1, round((row.dem_votes + row.rep_votes) * multiplier))
+        dem = round(two_party * share[i])
+        rep = two_party - dem
+        predictions[row.ward_id] = {
+            "demPct": round(dem / projected_total * 100, 2),
+            "repPct": round(rep / projected_total * 100, 2),
+            "margin": round((dem - rep) / projected_total * 100, 2),
+            "demVotes": dem,
+            "repVotes": rep,
+            "totalVotes": projected_total,
+            "lowerMargin": round((2 * lower[i] - 1) * 100, 2),
+            "upperMargin": round((2 * upper[i] - 1) * 100, 2),
+        }
+    return predictions
+
+
+def assert_matches(actual, expected):
+    assert actual.keys() == expected.keys()
+    for ward_id, ref in expected.items():
+        pred = actual[ward_id]
+        for key in ("demVotes", "repVotes", "totalVotes"):
+            assert pred[key] == ref[key], (ward_id, key)
+        for key in ("demPct", "repPct", "margin", "lowerMargin", "upperMargin"):
+            assert pred[key] == pytest.approx(ref[key], abs=1e-9), (ward_id, key)
+        assert pred["confidence"] == 0.8
+
+
+@pytest.mark.parametrize("adjustments", [None, ALL_ADJUSTMENTS])
+def test_predict_matches_reference_loop(posterior, ward_df, adjustments):
+    expected = reference_predict(posterior, ward_df, adjustments or {})
+    assert_matches(predict_mrp(posterior, ward_df, adjustments), expected)
+    # A cached design gives the same result as the raw DataFrame
+    assert_matches(predict_mrp(posterior, build_design(ward_df), adjustments), expected)
+
+
+def test_unseen_county_gets_zero_effect(posterior, ward_df):
+    assert "Vilas" in set(ward_df["county"])
+    only_vilas = ward_df[ward_df["county"] == "Vilas"]
+    shifted = MrpPosterior(
+        intercept=posterior.intercept,
+        beta=posterior.beta,
+        county_effect=posterior.county_effect + 5.0,
+        region_effect=posterior.region_effect,
+        counties=FIT_COUNTIES,
+        regions=FIT_REGIONS,
+    )
+    # Fitted county effects do not touch a ward whose county was never fitted
+    assert predict_mrp(shifted, only_vilas) == predict_mrp(posterior, only_vilas)
+
+
+def test_scenarios_match_predict_point_estimate(posterior, ward_df):
+    scenarios = [{}, ALL_ADJUSTMENTS, {"collegeShift": -4.0}]
+    results = predict_scenarios(
+        posterior, ward_df, scenarios, levels=("county",), include_wards=True
+    )
+
+    assert [r["adjustments"] for r in results] == scenarios
+    for adjustments, result in zip(scenarios, results, strict=True):
+        expected = predict_mrp(posterior, ward_df, adjustments)
+        assert result["wards"].keys() == expected.keys()
+        for ward_id, ward in result["wards"].items():
+            for key in ("demVotes", "repVotes", "totalVotes", "margin"):
+                assert ward[key] == expected[ward_id][key], (ward_id, key)
+
+
+@pytest.mark.parametrize("level", ["county", "congressional"])
+def test_scenario_level_totals_sum_to_statewide(posterior, ward_df, level):
+    results = predict_scenarios(
+        posterior, ward_df, [{}, ALL_ADJUSTMENTS], levels=(level,),
+        include_wards=True,
+    )
+
+    for result in results:
+        state = result["statewide"]
+        groups = result["groups"][level]
+        for key in ("demVotes", "repVotes", "totalVotes"):
+            assert sum(g[key] for g in groups) == state[key]
+            assert sum(w[key] for w in result["wards"].values()) == state[key]
+        assert state["margin"] == pytest.approx(
+            (state["demVotes"] - state["repVotes"]) / state["totalVotes"] * 100,
+            abs=0.005,
+        )
+    ids = [g["id"] for g in results[0]["groups"][level]]
+    assert ids == sorted(set(ward_df[GROUP_COLUMNS[level]]), key=ids.index)
+
+
+def reference_outcomes(posterior, ward_df, adjustments, level, n_samples):
+    """Per-draw loop: statewide margin and group D wins for every draw."""
+    df = prepare_ward_df(ward_df)
+    X = df[COVARIATES].values.astype(np.float64)  # noqa: N806
+    beta_shift, ward_shift = reference_shifts(df, adjustments)
+    multiplier = 1 + adjustments.get("turnoutChange", 0) / 100
+    two_party = np.maximum(
+        1, np.round((df["dem_votes"] + df["rep_votes"]).values * multiplier)
+    )
+    total = np.maximum(1, np.round(df["total_votes"].values * multiplier))
+    groups = df[GROUP_COLUMNS[level]].values
+
+    sample_idx = np.linspace(
+        0, posterior.n_samples - 1, min(n_samples, posterior.n_samples), dtype=int
+    )
+    margins, wins = [], []
+    for draw in sample_idx:
+        mu = (
+            posterior.intercept[draw]
+            + X @ (posterior.beta[draw] + beta_shift)
+            + reference_effects(posterior, df, draw)
+            + ward_shift
+        )
+        dem = np.round(two_party * expit(mu))
+        margins.append((2 * dem.sum() - two_party.sum()) / total.sum() * 100)
+        wins.append({
+            g: 2 * dem[groups == g].sum() > two_party[groups == g].sum()
+            for g in set(groups)
+        })
+    return np.array(margins), wins
+
+
+def test_outcomes_match_per_draw_reference(posterior, ward_df):
+    n_samples = 150
+    result = predict_outcomes(
+        posterior, ward_df, ALL_ADJUSTMENTS, levels=("congressional",),
+        n_samples=n_samples,
+    )
+    margins, wins = reference_outcomes(
+        posterior, ward_df, ALL_ADJUSTMENTS, "congressional", n_samples
+    )
+
+    state = result["statewide"]
+    assert result["sampleCount"] == n_samples
+    np.testing.assert_allclose(state["marginDraws"], margins, atol=0.01)
+    assert state["demWinProb"] == pytest.approx(np.mean(margins > 0), abs=1e-4)
+
+    level = result["levels"]["congressional"]
+    for group in level["groups"]:
+        expected = np.mean([w[group["id"]] for w in wins])
+        assert group["demWinProb"] == pytest.approx(expected, abs=1e-4)
+    seats = np.array([sum(w.values()) for w in wins])
+    expected_histogram = np.bincount(seats, minlength=4) / len(seats)
+    np.testing.assert_allclose(
+        level["demSeats"]["histogram"], expected_histogram, atol=1e-4
+    )
+
+
+@pytest.mark.parametrize("adjustments", [{}, ALL_ADJUSTMENTS])
+def test_outcome_statistics_are_consistent(posterior, ward_df, adjustments):
+    result = predict_outcomes(
+        posterior, ward_df, adjustments, levels=("county", "congressional")
+    )
+
+    draws = np.array(result["statewide"]["marginDraws"])
+    assert len(draws) == result["sampleCount"] == 400
+    assert result["statewide"]["demWinProb"] == pytest.approx(
+        np.mean(draws > 0), abs=1e-4
+    )
+    for level in result["levels"].values():
+        histogram = level["demSeats"]["histogram"]
+        assert len(histogram) == len(level["groups"]) + 1
+        assert sum(histogram) == pytest.approx(1.0, abs=1e-3)
+        # Expected seats from the histogram match the sum of win probabilities
+        assert np.dot(np.arange(len(histogram)), histogram) == pytest.approx(
+            sum(g["demWinProb"] for g in level["groups"]), abs=1e-2
+        )
@@ -0,0 +1,109 @@
+"""Tests for MRP sampling progress reporting (no PyMC required)."""
+from collections import namedtuple
+
+import pytest
+
+from app.election_models import mrp_progress
+from app.election_models.mrp_progress import SamplingProgress
+
+# Shape of the object pm.sample passes to its callback
+Draw = namedtuple("Draw", "chain draw_idx tuning stats is_last")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(mrp_progress.time, "monotonic", clock)
+    return clock
+
+
+def run_chain(progress, clock, chain, tune, draws, diverging=(), step=0.5):
+    for i in range(tune + draws):
+        clock.now += 0.1
+        progress(None, Draw(
+            chain=chain,
+            draw_idx=i,
+            tuning=i < tune,
+            stats=[{"diverging": i in diverging, "step_size": step}],
+            is_last=i == tune + draws - 1,
+        ))
+
+
+def test_nuts_progress(clock):
+    reports = []
+    progress = SamplingProgress(2, tune=10, draws=20, report=reports.append)
+    clock.now += 5.0  # model compilation before the first draw
+    # No draws yet, so no rate to estimate from
+    assert progress.snapshot()["eta_seconds"] is None
+
+    # A divergence while tuning is not counted
+    run_chain(progress, clock, 0, 10, 20, diverging={3, 15, 25})
+    snap = progress.snapshot()
+    assert snap["phase"] == "sampling"
+    assert snap["draws_done"] == 30
+    assert snap["draws_total"] == 60
+    assert snap["percent"] == 50.0
+    assert snap["divergences"] == 2
+    assert snap["eta_seconds"] == pytest.approx(3.0)
+    assert snap["chains"][0]["step_size"] == 0.5
+    assert snap["chains"][1]["draw"] == 0
+    assert progress.finished is None
+
+    run_chain(progress, clock, 1, 10, 20)
+    assert progress.finished is not None
+    final = reports[-1]
+    assert final["phase"] == "done"
+    assert final["percent"] == 100.0
+    assert final["eta_seconds"] == 0.0
+
+    timings = progress.timings()
+    assert timings["setup_seconds"] == pytest.approx(5.1)
+    assert timings["tune_seconds"] == pytest.approx(1.0)
+    assert timings["sample_seconds"] == pytest.approx(4.9)
+
+
+def test_reports_are_throttled(clock):
+    reports = []
+    progress = SamplingProgress(1, tune=0, draws=100, report=reports.append)
+    run_chain(progress, clock, 0, 0, 100)
+    # Every 2s over 10s of draws, plus the forced report on the last draw
+    assert 5 <= len(reports) <= 7
+    assert reports[-1]["draws_done"] == 100
+
+
+def test_dict_stats_and_missing_step_size(clock):
+    progress = SamplingProgress(1, tune=1, draws=1, report=lambda s: None)
+    progress(None, Draw(0, 0, True, {"diverging": False}, False))
+    assert progress.snapshot()["phase"] == "tuning"
+    assert progress.chains[0].step_size is None
+
+
+def test_advi_early_stop_reports_done(clock):
+    reports = []
+    progress = SamplingProgress(2, tune=1000, draws=2000, report=reports.append)
+    progress.configure(chains=1, tune=0, draws=30_000)
+    losses = []
+    for i in range(500):
+        clock.now += 0.001
+        losses.append(100.0 - i * 0.1)
+        progress.advi(None, losses, i)
+    last = reports[-1] if reports else None
+
+    # Convergence stopped pm.fit after 500 of 30,000 iterations
+    progress.finish()
+    assert reports[-1] is not last
+    final = reports[-1]
+    assert final["phase"] == "done"
+    assert final["percent"] == 100.0
+    assert final["draws_done"] == 500
+    assert final["draws_total"] == 30_000
+    assert final["loss"] == pytest.approx(100.0 - 499 * 0.1)
+    assert progress.timings()["tune_seconds"] == 0.0
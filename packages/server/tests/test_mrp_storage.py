@@ -0,0 +1,157 @@
+"""Tests for the MRP posterior sidecar (no database or ArviZ required)."""
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.election_models import mrp_storage
+from app.election_models.mrp_storage import (
+    POSTERIOR_FORMAT_VERSION,
+    MrpPosterior,
+    load_posterior,
+    posterior_filenames,
+    save_posterior,
+    save_trace,
+    trace_filename,
+)
+
+COUNTIES = ["Milwaukee", "Dane", "Brown"]
+REGIONS = ["rural", "milwaukee_metro"]
+
+
+@pytest.fixture
+def traces_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "mrp_traces_dir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def posterior():
+    rng = np.random.default_rng(3)
+    n = 50
+    return MrpPosterior(
+        intercept=rng.normal(size=n),
+        beta=rng.normal(size=(n, 4)),
+        county_effect=rng.normal(size=(n, len(COUNTIES))),
+        region_effect=rng.normal(size=(n, len(REGIONS))),
+        counties=COUNTIES,
+        regions=REGIONS,
+    )
+
+
+def assert_same_draws(loaded, posterior):
+    for name in ("intercept", "beta", "county_effect", "region_effect"):
+        expected = getattr(posterior, name).astype(np.float32)
+        np.testing.assert_array_equal(getattr(loaded, name), expected)
+
+
+def test_sidecar_round_trip(traces_dir, posterior):
+    npy_path = save_posterior(posterior, "president", 2020, 2020)
+    _, header_name = posterior_filenames("president", 2020, 2020)
+    header = json.loads((traces_dir / header_name).read_text())
+
+    assert header["format_version"] == POSTERIOR_FORMAT_VERSION
+    assert header["n_samples"] == 50
+    assert header["columns"] == {
+        "intercept": [0, 1],
+        "beta": [1, 5],
+        "county_effect": [5, 8],
+        "region_effect": [8, 10],
+    }
+    assert header["counties"] == COUNTIES
+    assert header["regions"] == REGIONS
+    assert np.load(npy_path).dtype == np.float32
+    assert not list(traces_dir.glob("*.tmp"))
+
+    loaded = load_posterior("president", 2020, 2020)
+    assert isinstance(loaded.beta, np.memmap)
+    assert loaded.n_samples == 50
+    assert loaded.counties == COUNTIES
+    assert loaded.regions == REGIONS
+    assert_same_draws(loaded, posterior)
+
+
+def test_format_version_mismatch_is_ignored(traces_dir, posterior):
+    save_posterior(posterior, "president", 2020, 2020)
+    _, header_name = posterior_filenames("president", 2020, 2020)
+    header_path = traces_dir / header_name
+    header = json.loads(header_path.read_text())
+    header["format_version"] = POSTERIOR_FORMAT_VERSION + 1
+    header_path.write_text(json.dumps(header))
+
+    assert mrp_storage._load_posterior_sidecar("president", 2020, 2020) is None
+
+
+def test_sidecar_older_than_trace_is_ignored(traces_dir, posterior):
+    npy_path = save_posterior(posterior, "president", 2020, 2020)
+    trace_file = traces_dir / trace_filename("president", 2020, 2020)
+    trace_file.write_bytes(b"")
+    mtime = npy_path.stat().st_mtime
+    os.utime(trace_file, (mtime + 10, mtime + 10))
+
+    assert mrp_storage._load_posterior_sidecar("president", 2020, 2020) is None
+
+
+def fake_trace(posterior, chains=2):
+    """Stand-in for InferenceData: the posterior variables by chain."""
+    draws = posterior.n_samples // chains
+
+    def values(arr):
+        return SimpleNamespace(values=arr.reshape(chains, draws, *arr.shape[1:]))
+
+    return SimpleNamespace(posterior={
+        "intercept": values(posterior.intercept),
+        "beta": values(posterior.beta),
+        "county_effect": values(posterior.county_effect),
+        "region_effect": values(posterior.region_effect),
+    })
+
+
+def test_missing_sidecar_falls_back_to_trace(traces_dir, posterior, monkeypatch):
+    trace = fake_trace(posterior)
+    loads = []
+    monkeypatch.setattr(
+        mrp_storage, "load_trace", lambda *key: loads.append(key) or trace
+    )
+
+    loaded = load_posterior("governor", 2022, 2022)
+    assert loads == [("governor", 2022, 2022)]
+    np.testing.assert_array_equal(loaded.beta, posterior.beta)
+
+    # The fallback writes a sidecar, so the next load skips the trace
+    reloaded = load_posterior("governor", 2022, 2022)
+    assert len(loads) == 1
+    assert_same_draws(reloaded, posterior)
+
+
+def test_no_trace_returns_none(traces_dir):
+    assert load_posterior("president", 2016, 2020) is None
+
+
+def test_save_trace_renames_finished_files_into_place(traces_dir, posterior):
+    final = traces_dir / trace_filename("president", 2020, 2020)
+    written = []
+
+    def to_netcdf(path):
+        # Nothing is at the final path while the trace is being written
+        assert not final.exists()
+        written.append(path)
+        with open(path, "wb") as f:
+            f.write(b"netcdf")
+
+    trace = fake_trace(posterior)
+    trace.to_netcdf = to_netcdf
+    categories = {"county": COUNTIES, "region": REGIONS}
+
+    path = save_trace(trace, "president", 2020, 2020, categories=categories)
+
+    assert path == final
+    assert written and written[0] != str(final)
+    assert final.read_bytes() == b"netcdf"
+    meta = json.loads(final.with_suffix(".json").read_text())
+    assert (meta["race_type"], meta["year"]) == ("president", 2020)
+    assert not list(traces_dir.glob("*.tmp"))
+    assert_same_draws(load_posterior("president", 2020, 2020), posterior)
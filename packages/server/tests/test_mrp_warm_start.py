@@ -0,0 +1,122 @@
+"""Tests for MRP warm-start inputs (no database required)."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.election_models.mrp_warm_start import (
+    WarmStart,
+    draw_moments,
+    previous_draws,
+    warm_start_priors,
+)
+
+CHAINS, DRAWS = 2, 100
+
+
+def fake_trace(**variables):
+    """InferenceData stand-in: posterior[name].values is (chain, draw, ...)."""
+    return SimpleNamespace(posterior={
+        name: SimpleNamespace(
+            values=np.asarray(v).reshape(CHAINS, DRAWS, *np.shape(v)[1:])
+        )
+        for name, v in variables.items()
+    })
+
+
+@pytest.fixture
+def warm_start():
+    rng = np.random.default_rng(5)
+    n = CHAINS * DRAWS
+    trace = fake_trace(
+        intercept=rng.normal(0.3, 0.1, n),
+        beta=rng.normal([0.5, -1.0, 0.2, 0.0], [0.2, 0.1, 0.001, 0.3], (n, 4)),
+        county_effect=rng.normal([1.0, 2.0, 3.0], 0.1, (n, 3)),
+        region_effect=rng.normal(0, 0.5, (n, 2)),
+        sigma_county=np.abs(rng.normal(0.4, 0.05, n)),
+        sigma_region=np.full(n, 0.01),
+        sigma_obs=np.abs(rng.normal(0.2, 0.01, n)),
+    )
+    return WarmStart(
+        trace=trace,
+        categories={"county": ["Brown", "Dane", "Milwaukee"], "region": ["a", "b"]},
+    )
+
+
+def test_previous_draws_flattens_chains(warm_start):
+    draws = previous_draws(warm_start, "beta", {})
+    assert draws.shape == (CHAINS * DRAWS, 4)
+
+
+def test_previous_draws_realigns_effects_by_name(warm_start):
+    levels = {"county": ["Milwaukee", "Brown", "Vilas"], "region": ["b", "a"]}
+    bare = WarmStart(trace=warm_start.trace)
+    original = previous_draws(bare, "county_effect", {})
+    aligned = previous_draws(warm_start, "county_effect", levels)
+
+    assert aligned.shape == (CHAINS * DRAWS, 3)
+    np.testing.assert_array_equal(aligned[:, 0], original[:, 2])  # Milwaukee
+    np.testing.assert_array_equal(aligned[:, 1], original[:, 0])  # Brown
+    assert np.isnan(aligned[:, 2]).all()  # Vilas is new
+
+    regions = previous_draws(warm_start, "region_effect", levels)
+    original = previous_draws(bare, "region_effect", {})
+    np.testing.assert_array_equal(regions, original[:, ::-1])
+
+
+def test_previous_draws_without_categories_is_positional(warm_start):
+    bare = WarmStart(trace=warm_start.trace)
+    draws = previous_draws(bare, "county_effect", {"county": ["X"]})
+    assert draws.shape == (CHAINS * DRAWS, 3)
+
+
+def test_warm_start_priors(warm_start):
+    posterior = warm_start.trace.posterior
+    priors = warm_start_priors(warm_start)
+
+    beta = posterior["beta"].values.reshape(-1, 4)
+    mean, sd = priors["beta"]
+    np.testing.assert_allclose(mean, beta.mean(axis=0))
+    np.testing.assert_allclose(sd[[0, 1, 3]], 2 * beta.std(axis=0)[[0, 1, 3]])
+    assert sd[2] == 0.05  # a near-constant coefficient keeps a usable prior
+
+    mean, sd = priors["intercept"]
+    assert np.ndim(mean) == 0
+    assert mean == pytest.approx(posterior["intercept"].values.mean())
+
+    sigma_county = posterior["sigma_county"].values.mean()
+    assert priors["sigma_county"] == pytest.approx(2 * sigma_county)
+    assert priors["sigma_region"] == 0.05
+    assert isinstance(priors["sigma_obs"], float)
+
+
+def test_draw_moments_fill_new_levels_with_median_variance():
+    flat = np.column_stack([
+        np.tile([0.0, 2.0], 50),  # var 1
+        np.tile([1.0, 5.0], 50),  # var 4
+        np.tile([0.0, 6.0], 50),  # var 9
+        np.full(100, np.nan),  # level new to this fit
+        np.full(100, 7.0),  # zero variance
+    ])
+    mean, var = draw_moments(flat)
+    np.testing.assert_allclose(mean, [1.0, 3.0, 3.0, 0.0, 7.0])
+    np.testing.assert_allclose(var, [1.0, 4.0, 9.0, 4.0, 4.0])
+
+
+def test_draw_moments_without_usable_columns():
+    mean, var = draw_moments(np.full((10, 2), np.nan))
+    np.testing.assert_array_equal(mean, [0.0, 0.0])
+    np.testing.assert_array_equal(var, [1.0, 1.0])
+
+
+def test_scales_are_log_transformed_for_the_mass_matrix():
+    pm = pytest.importorskip("pymc")
+    from app.election_models.mrp_model import _unconstrained
+
+    with pm.Model() as model:
+        sigma = pm.HalfNormal("sigma", sigma=1.0)
+        beta = pm.Normal("beta", 0, 1, shape=2)
+    draws = np.array([0.5, 1.0, 2.0])
+    np.testing.assert_allclose(_unconstrained(model, sigma, draws), np.log(draws))
+    betas = np.ones((3, 2))
+    np.testing.assert_array_equal(_unconstrained(model, beta, betas), betas)
@@ -0,0 +1,60 @@
+"""Tests for ranking API endpoints."""
+import numpy as np
+import pytest
+
+from app.services.ward_matrix import WardMatrix
+
+
+@pytest.mark.asyncio
+async def test_rankings_unknown_metric(client):
+    response = await client.get("/api/v1/rankings/population")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_rankings_election_metric_requires_election(client):
+    response = await client.get("/api/v1/rankings/margin")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_top_margin(client):
+    response = await client.get(
+        "/api/v1/rankings/margin?year=2020&race_type=president&limit=5"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["order"] == "top"
+    assert len(data["wards"]) <= 5
+    values = [w["value"] for w in data["wards"]]
+    assert values == sorted(values, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_ward_rank_not_found(client):
+    response = await client.get("/api/v1/rankings/lean/ward/nonexistent")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_swing_across_vintages(client):
+    # 2024 is reported in the 2025 vintage, 2020 in an older one
+    response = await client.get(
+        "/api/v1/rankings/swing?year=2024&race_type=president&limit=5"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ward_vintage"] == 2025
+    assert data["ward_count"] > 0
+
+
+def test_rows_for_matches_by_ward_id():
+    ward_ids = np.array(["W1", "W3", "W4"])
+    empty = np.zeros((3, 0), dtype=np.int64)
+    labels = np.array(["", "", ""], dtype=object)
+    matrix = WardMatrix(
+        2022, ward_ids, labels, labels, labels, labels, labels, labels,
+        [], empty, empty, empty, empty, empty.astype(bool),
+    )
+    rows = matrix.rows_for(np.array(["W0", "W1", "W2", "W4", "W5"]))
+    assert rows.tolist() == [-1, 0, -1, 2, -1]
@@ -0,0 +1,73 @@
+"""Tests for redistricting API endpoints."""
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_plan_invalid_district_type(client):
+    response = await client.post(
+        "/api/v1/redistricting/plan", json={"district_type": "county"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_plan_empty_base_needs_assignments(client):
+    response = await client.post(
+        "/api/v1/redistricting/plan",
+        json={"district_type": "assembly", "base": "empty"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_plan_diff_only_changed(client):
+    response = await client.post(
+        "/api/v1/redistricting/plan",
+        json={
+            "district_type": "assembly",
+            "assignments": {"not-a-ward": "1"},
+            "race_type": "president",
+            "only_changed": True,
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reassigned"] == 0
+    assert data["unmatched_ward_ids"] == ["not-a-ward"]
+    assert data["districts"] == []
+
+
+@pytest.mark.asyncio
+async def test_fairness_swing_step_too_small(client):
+    response = await client.post(
+        "/api/v1/redistricting/fairness",
+        json={
+            "district_type": "assembly",
+            "year": 2020,
+            "race_type": "president",
+            "swing_step": 0.001,
+        },
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_fairness_current_map(client):
+    response = await client.post(
+        "/api/v1/redistricting/fairness",
+        json={
+            "district_type": "assembly",
+            "year": 2020,
+            "race_type": "president",
+            "swing_range": 5,
+            "swing_step": 1,
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    # 2020 is reported on the 2020 boundaries, not the latest vintage
+    assert data["ward_vintage"] == 2020
+    assert 0 <= data["dem_seats"] <= data["seats"]
+    curve = data["seat_vote_curve"]
+    assert curve["swing"] == [float(s) for s in range(-5, 6)]
+    assert curve["dem_seats"] == sorted(curve["dem_seats"])
@@ -0,0 +1,125 @@
+"""Tests for the similar-wards feature matrix (no database needed)."""
+
+import numpy as np
+import pytest
+
+from app.services.similarity_service import (
+    DEMOGRAPHIC_FEATURES,
+    build_feature_matrix,
+)
+from app.services.ward_matrix import WardMatrix
+
+ELECTIONS = [(2016, "president"), (2018, "state_assembly"), (2020, "president")]
+
+# 4 wards; the 2018 assembly race is only reported in one ward (25% coverage)
+DEM = np.array([[60, 0, 70], [80, 50, 90], [30, 0, 20], [150, 0, 0]])
+REP = np.array([[40, 0, 30], [120, 50, 110], [70, 0, 80], [150, 0, 0]])
+PRESENT = np.array([
+    [True, False, True],
+    [True, True, True],
+    [True, False, True],
+    [True, False, False],
+])
+
+
+def make_matrix(dem=DEM, rep=REP, present=PRESENT, elections=ELECTIONS):
+    n = len(dem)
+    labels = np.array([""] * n, dtype=object)
+    return WardMatrix(
+        vintage=2020,
+        ward_ids=np.array([f"W{i}" for i in range(n)]),
+        ward_names=labels,
+        municipalities=labels,
+        counties=labels,
+        congressional=labels,
+        state_senate=labels,
+        assembly=labels,
+        elections=list(elections),
+        dem=dem,
+        rep=rep,
+        other=np.zeros_like(dem),
+        total=dem + rep,
+        present=present,
+    )
+
+
+def no_demographics(n):
+    names = [
+        "voting_age_population", "white_pct", "black_pct", "hispanic_pct",
+        "asian_pct", "college_degree_pct", "median_household_income",
+        "population_density",
+    ]
+    return {name: np.full(n, np.nan) for name in names}
+
+
+def test_low_coverage_elections_and_empty_demographics_dropped():
+    features, names = build_feature_matrix(make_matrix(), no_demographics(4))
+
+    assert names == [
+        "margin_2016_president",
+        "margin_2020_president",
+        "turnout_2016_president",
+        "turnout_2020_president",
+    ]
+    assert features.shape == (4, 4)
+
+
+def test_margins_standardized_and_block_weighted():
+    features, _ = build_feature_matrix(make_matrix(), no_demographics(4))
+
+    # 2016 margins 20, -20, -40, 0: mean -10, population sd sqrt(500);
+    # two margin columns, so each is scaled by 1/sqrt(2)
+    expected = (np.array([20, -20, -40, 0]) + 10) / np.sqrt(500) / np.sqrt(2)
+    np.testing.assert_allclose(features[:, 0], expected)
+
+
+def test_missing_results_imputed_at_the_mean():
+    features, _ = build_feature_matrix(make_matrix(), no_demographics(4))
+
+    # Ward 3 has no 2020 result: z-score 0 in both 2020 columns
+    assert features[3, 1] == 0.0
+    assert features[3, 3] == 0.0
+    # The other three are standardized among themselves
+    margins = np.array([40.0, -10.0, -60.0])
+    expected = (margins - margins.mean()) / margins.std() / np.sqrt(2)
+    np.testing.assert_allclose(features[:3, 1], expected)
+
+
+def test_turnout_uses_voting_age_population_when_known():
+    demographics = no_demographics(4)
+    demographics["voting_age_population"] = np.array([200.0, 400.0, 400.0, 300.0])
+    features, names = build_feature_matrix(make_matrix(), demographics)
+
+    # 2016 turnout 50%, 50%, 25%, 100%
+    turnout = np.array([50.0, 50.0, 25.0, 100.0])
+    expected = (turnout - turnout.mean()) / turnout.std() / np.sqrt(2)
+    np.testing.assert_allclose(
+        features[:, names.index("turnout_2016_president")], expected
+    )
+
+
+def test_demographic_block_weighted_by_its_width():
+    demographics = no_demographics(4)
+    demographics["white_pct"] = np.array([90.0, 70.0, 50.0, 30.0])
+    demographics["college_degree_pct"] = np.array([10.0, np.nan, 30.0, 40.0])
+    features, names = build_feature_matrix(make_matrix(), demographics)
+
+    # Only the demographic columns with data are kept
+    assert [n for n in names if n in DEMOGRAPHIC_FEATURES] == [
+        "white_pct", "college_degree_pct",
+    ]
+    white = features[:, names.index("white_pct")]
+    # z-scores of 90, 70, 50, 30 are ±3/sqrt(5), ±1/sqrt(5); block width 2
+    expected = np.array([3, 1, -1, -3]) / np.sqrt(5) / np.sqrt(2)
+    np.testing.assert_allclose(white, expected)
+    assert features[1, names.index("college_degree_pct")] == 0.0
+
+
+@pytest.mark.parametrize("n_wards", [0, 3])
+def test_no_usable_features_gives_a_constant_column(n_wards):
+    empty = np.zeros((n_wards, 0), dtype=np.int64)
+    matrix = make_matrix(empty, empty, empty.astype(bool), [])
+    features, names = build_feature_matrix(matrix, no_demographics(n_wards))
+
+    assert names == ["constant"]
+    assert features.shape == (n_wards, 1)
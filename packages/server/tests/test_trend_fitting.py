@@ -0,0 +1,90 @@
+"""Tests for the vectorized trend kernels (no database required)."""
+import numpy as np
+import pytest
+from scipy import stats
+
+from app.election_models.trends import classify_trends, fit_linear_trends
+
+YEARS = np.array([2012, 2014, 2016, 2018, 2020, 2022, 2024])
+
+
+def test_matches_linregress():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 10, (20, len(YEARS))) + 0.8 * (YEARS - 2012)
+    fit = fit_linear_trends(YEARS, values)
+
+    assert fit.valid.all()
+    for i, row in enumerate(values):
+        ref = stats.linregress(YEARS, row)
+        assert fit.slope[i] == pytest.approx(ref.slope)
+        assert fit.intercept[i] == pytest.approx(ref.intercept)
+        assert fit.r_squared[i] == pytest.approx(ref.rvalue**2)
+        assert fit.std_err[i] == pytest.approx(ref.stderr)
+        assert fit.p_value[i] == pytest.approx(ref.pvalue)
+    assert (fit.n == len(YEARS)).all()
+
+
+def test_nan_masked_rows_match_linregress_on_present_years():
+    row = np.array([5.0, np.nan, 9.0, 4.0, np.nan, 15.0, 12.0])
+    fit = fit_linear_trends(YEARS, row[None, :])
+    present = ~np.isnan(row)
+    ref = stats.linregress(YEARS[present], row[present])
+
+    assert fit.valid[0]
+    assert fit.n[0] == 5
+    assert fit.slope[0] == pytest.approx(ref.slope)
+    assert fit.intercept[0] == pytest.approx(ref.intercept)
+    assert fit.p_value[0] == pytest.approx(ref.pvalue)
+    assert fit.start_year[0] == 2012
+    assert fit.end_year[0] == 2024
+
+
+def test_nan_trailing_years_set_end_year():
+    row = np.array([np.nan, 1.0, 2.0, 4.0, 3.0, np.nan, np.nan])
+    fit = fit_linear_trends(YEARS, row[None, :])
+    assert fit.start_year[0] == 2014
+    assert fit.end_year[0] == 2020
+
+
+def test_too_few_points_is_invalid():
+    row = np.array([5.0, np.nan, 9.0, np.nan, np.nan, np.nan, np.nan])
+    fit = fit_linear_trends(YEARS, row[None, :], min_points=3)
+    assert not fit.valid[0]
+    assert np.isnan(fit.slope[0])
+    assert np.isnan(fit.p_value[0])
+
+    fit = fit_linear_trends(YEARS, row[None, :], min_points=2)
+    assert fit.valid[0]
+
+
+def test_no_year_variance_is_invalid():
+    years = np.array([2020, 2020, 2020])
+    fit = fit_linear_trends(years, np.array([[1.0, 2.0, 3.0]]))
+    assert not fit.valid[0]
+    assert np.isnan(fit.slope[0])
+    assert np.isnan(fit.r_squared[0])
+
+
+def test_zero_residual_has_p_value_one():
+    constant = np.full(len(YEARS), 100.0)
+    linear = 2.0 * YEARS - 4000.0
+    fit = fit_linear_trends(YEARS, np.vstack([constant, linear]))
+
+    assert fit.valid.all()
+    assert fit.slope[0] == pytest.approx(0.0)
+    assert fit.slope[1] == pytest.approx(2.0)
+    assert fit.std_err[1] == pytest.approx(0.0)
+    assert (fit.p_value == 1.0).all()
+
+
+def test_classify_trends():
+    slope = np.array([1.5, -2.0, 3.0, -0.5, np.nan])
+    p_value = np.array([0.01, 0.001, 0.2, 0.05, np.nan])
+    assert classify_trends(slope, p_value).tolist() == [
+        "more_democratic",
+        "more_republican",
+        "inconclusive",
+        "inconclusive",
+        "inconclusive",
+    ]
+    assert classify_trends(slope, p_value, alpha=0.5)[2] == "more_democratic"
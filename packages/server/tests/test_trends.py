@@ -0,0 +1,82 @@
+"""Tests for trend API endpoints."""
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_area_trends_invalid_sort(client):
+    response = await client.get("/api/v1/trends/area?county=Dane&sort=margin")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_area_trends_limit_out_of_range(client):
+    response = await client.get("/api/v1/trends/area?county=Dane&limit=0")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_area_trends_paginated(client):
+    response = await client.get(
+        "/api/v1/trends/area?county=Dane&limit=10&sort=slope_desc"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["trends"]) <= 10
+    assert sum(data["summary"].values()) <= data["total_wards"]
+    assert "area_trend" in data
+    slopes = [t["slope"] for t in data["trends"] if t["slope"] is not None]
+    assert slopes == sorted(slopes, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_area_trends_summary_only(client):
+    response = await client.get(
+        "/api/v1/trends/area?county=Dane&include_wards=false"
+    )
+    assert response.status_code == 200
+    assert response.json()["trends"] == []
+
+
+@pytest.mark.asyncio
+async def test_elections_requires_selection(client):
+    response = await client.post("/api/v1/trends/elections", json={})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_elections_columnar(client):
+    response = await client.post(
+        "/api/v1/trends/elections",
+        json={"county": "Dane", "race_type": "president"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["row_count"] == len(data["year"]) == len(data["total_votes"])
+    assert all(0 <= i < data["ward_count"] for i in data["ward"])
+
+
+@pytest.mark.asyncio
+async def test_changepoints_alpha_out_of_range(client):
+    response = await client.get("/api/v1/trends/changepoints?alpha=0")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_changepoints(client):
+    response = await client.get("/api/v1/trends/changepoints?race_type=president")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["ward_count"] == len(data["changepoints"])
+    for entry in data["changepoints"].values():
+        assert entry["p_value"] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_forecasts_map_data_shape(client):
+    response = await client.get("/api/v1/trends/forecasts?race_type=president")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["raceType"] == "president"
+    assert data["wardCount"] == len(data["data"])
+    for entry in data["data"].values():
+        assert entry["marginLower"] <= entry["margin"] <= entry["marginUpper"]
@@ -0,0 +1,100 @@
+"""Tests for cross-vintage ward series (no database required)."""
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.election_models.ward_series import stack_vintages
+
+
+def vintage_matrix(vintage, ward_ids, elections, dem, rep, present):
+    dem = np.array(dem, dtype=np.int64)
+    rep = np.array(rep, dtype=np.int64)
+    total = dem + rep
+
+    def margin():
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(total > 0, (dem - rep) / total * 100, np.nan)
+
+    return SimpleNamespace(
+        vintage=vintage,
+        ward_ids=np.array(ward_ids),
+        elections=elections,
+        total=total,
+        present=np.array(present),
+        margin=margin,
+    )
+
+
+# 2020 vintage: 2016 and 2020 president plus a 2018 governor race;
+# 2025 vintage: 2024 president only, with W2 gone and W4 new
+V2020 = vintage_matrix(
+    2020,
+    ["W1", "W2", "W3"],
+    [(2016, "president"), (2018, "governor"), (2020, "president")],
+    dem=[[60, 50, 70], [30, 40, 20], [50, 50, 0]],
+    rep=[[40, 50, 30], [70, 60, 80], [50, 50, 0]],
+    present=[[True, True, True], [True, True, True], [True, True, False]],
+)
+V2025 = vintage_matrix(
+    2025,
+    ["W1", "W3", "W4"],
+    [(2024, "president")],
+    dem=[[45], [75], [10]],
+    rep=[[55], [25], [90]],
+    present=[[True], [True], [True]],
+)
+
+
+def test_series_joins_vintages_by_ward_id():
+    series = stack_vintages([V2025, V2020], "president")
+
+    assert series.race_type == "president"
+    assert series.ward_ids.tolist() == ["W1", "W2", "W3", "W4"]
+    assert series.years.tolist() == [2016, 2020, 2024]
+    np.testing.assert_array_equal(
+        series.margin,
+        [
+            [20.0, 40.0, -10.0],
+            [-40.0, -60.0, np.nan],
+            [0.0, np.nan, 50.0],
+            [np.nan, np.nan, -80.0],
+        ],
+    )
+    np.testing.assert_array_equal(
+        series.total,
+        [
+            [100, 100, 100],
+            [100, 100, np.nan],
+            [100, np.nan, 100],
+            [np.nan, np.nan, 100],
+        ],
+    )
+    # Latest vintage each ward has a result in
+    assert series.vintage.tolist() == [2025, 2020, 2025, 2025]
+
+
+def test_other_race_types_are_left_out():
+    series = stack_vintages([V2020, V2025], "governor")
+
+    assert series.years.tolist() == [2018]
+    assert series.margin[:, 0].tolist()[:3] == [0.0, -20.0, 0.0]
+    assert np.isnan(series.margin[3, 0])
+    assert series.vintage.tolist() == [2020, 2020, 2020, 0]
+
+
+def test_election_in_two_vintages_takes_the_latest():
+    relisted = vintage_matrix(
+        2022, ["W1"], [(2020, "president")], dem=[[10]], rep=[[90]],
+        present=[[True]],
+    )
+    series = stack_vintages([relisted, V2020], "president")
+
+    assert series.margin[0].tolist() == [20.0, -80.0]
+    assert series.vintage[0] == 2022
+
+
+def test_no_matrices():
+    series = stack_vintages([], "president")
+
+    assert series.ward_ids.shape == (0,)
+    assert series.margin.shape == (0, 0)
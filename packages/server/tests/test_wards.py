@@ -55,3 +55,32 @@ async def test_boundaries_endpoint(client):
     data = response.json()
     assert data["type"] == "FeatureCollection"
     assert "features" in data
+
+
+@pytest.mark.asyncio
+async def test_similar_wards_not_found(client):
+    response = await client.get("/api/v1/wards/nonexistent/similar?k=5")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_similar_wards_k_out_of_range(client):
+    response = await client.get("/api/v1/wards/nonexistent/similar?k=0")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_ward_clusters(client):
+    response = await client.get("/api/v1/wards/clusters")
+    assert response.status_code == 200
+    data = response.json()
+    assert "profiles" in data
+    assert "data" in data
+    assert data["cluster_count"] == len(data["profiles"])
+    ids = [p["cluster_id"] for p in data["profiles"]]
+    assert ids == list(range(len(ids)))
+    # Every clustered ward points at a profile, and the counts agree
+    assert set(data["data"].values()) <= set(ids)
+    assert sum(p["ward_count"] for p in data["profiles"]) == len(data["data"])
+    for p in data["profiles"]:
+        assert len(p["margin_trajectory"]) == len(p["elections"])